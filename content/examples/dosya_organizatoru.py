@@ -0,0 +1,31 @@
+# Dosya Organizatörü Örneği
+import os
+from ekom_organizer import make_plan, apply_plan
+
+# Deneme için karışık bir "İndirilenler" klasörü oluştur
+os.makedirs("indirilenler/eski", exist_ok=True)
+dosyalar = {
+    "tatil.jpg": b"resim" * 1000,
+    "fatura.pdf": b"belge" * 2000,
+    "sarki.mp3": b"muzik" * 3000,
+    "eski/tatil_kopya.jpg": b"resim" * 1000,
+    "eski/notlar.txt": b"notlar",
+    "yedek.zip": b"arsiv" * 500,
+    "betik.py": b"print('merhaba')\n",
+}
+for ad, icerik in dosyalar.items():
+    with open(os.path.join("indirilenler", ad), "wb") as f:
+        f.write(icerik)
+
+# Önce plan: hiçbir dosya taşınmaz (kuru çalıştırma)
+plan = make_plan("indirilenler", by="type", duplicates=True)
+for grup in plan.duplicates:
+    print("Kopya:", ", ".join(os.path.relpath(d.path, plan.root) for d in grup))
+for kaynak, hedef in plan.moves:
+    print(f"{os.path.relpath(kaynak, plan.root):<22} → {os.path.relpath(hedef, plan.root)}")
+
+# Plan uygun görünüyorsa uygula
+tasinan = apply_plan(plan)
+print(f"\n{tasinan} dosya taşındı:")
+for klasor in sorted(os.listdir("indirilenler")):
+    print(f"  {klasor}/: {', '.join(sorted(os.listdir(os.path.join('indirilenler', klasor))))}")
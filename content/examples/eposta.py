@@ -0,0 +1,25 @@
+# E-posta Gönderme Örneği (yerel deneme sunucusuyla, gerçek e-posta gönderilmez)
+import email
+from email.policy import default
+from ekom_mail import SMTPSink, SMTPPool, render_report
+
+modules = {
+    "python_temelleri": {"title": "Python Temelleri",
+                         "lessons": {"degiskenler": "Değişkenler", "operatorler": "Operatörler"}},
+    "otomasyon": {"title": "Otomasyon", "lessons": {"dosya_okuma": "Dosya Okuma", "mail": "E-posta"}}
+}
+ogrenciler = [("ayse", 40, ["degiskenler", "operatorler", "dosya_okuma"]),
+              ("mehmet", 10, ["degiskenler"]),
+              ("zeynep", 0, [])]
+
+# Her 2. iletiyi geçici hatayla geri çeviren sunucu: havuz yeniden dener
+with SMTPSink(fail_every=2, keep=1) as sunucu:
+    havuz = SMTPPool(sunucu.host, sunucu.port, size=2, retries=3, rate=20, backoff=0.05)
+    raporlar = (render_report(ad, puan, dersler, modules) for ad, puan, dersler in ogrenciler)
+    sonuc = havuz.send_all(raporlar)
+    print(f"Gönderilen: {sonuc['sent']}, yeniden deneme: {sonuc['retries']}, "
+          f"bağlantı: {sonuc['connections']}")
+
+    son = email.message_from_bytes(sunucu.messages[-1], policy=default)
+    print(f"\nSon ileti → {son['To']}: {son['Subject']}")
+    print(son.get_content())
@@ -0,0 +1,32 @@
+# Excel Otomasyonu
+from openpyxl import Workbook
+
+def veri_uret():
+    # Satırlar bir üreteçle teker teker üretilir; liste bellekte tutulmaz
+    veriler = [
+        ['Ahmet', 25, 'İstanbul'],
+        ['Ayşe', 30, 'Ankara'],
+        ['Mehmet', 35, 'İzmir']
+    ]
+    for veri in veriler:
+        yield veri
+
+def excel_olustur():
+    # write_only kipi: hücre nesneleri bellekte tutulmaz, satırlar doğrudan dosyaya akar
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Veriler")
+
+    # Başlıklar
+    ws.append(['İsim', 'Yaş', 'Şehir'])
+
+    # Veriler: ws['A2'] gibi tek tek hücre yazmak yerine satır satır ekle
+    for satir in veri_uret():
+        ws.append(satir)
+
+    # Kaydet
+    wb.save('ornek_veriler.xlsx')
+    print("Excel dosyası oluşturuldu: ornek_veriler.xlsx")
+
+    # Büyük veriler için: python ekomcode.py export ilerleme.xlsx
+
+excel_olustur()
@@ -0,0 +1,37 @@
+# Veritabanı İşlemleri Örneği (SQLite ile toplu yükleme)
+import random
+import sqlite3
+import time
+
+baglanti = sqlite3.connect("okul.db", isolation_level=None)
+baglanti.execute("PRAGMA journal_mode=WAL")
+baglanti.execute("PRAGMA synchronous=NORMAL")
+baglanti.execute("CREATE TABLE IF NOT EXISTS notlar (ogrenci TEXT, ders TEXT, puan INTEGER)")
+
+def notlar(adet):
+    """Satırları liste yerine üreteçle ver: bellekte hepsi birden tutulmaz"""
+    dersler = ["Matematik", "Fizik", "Kimya", "Türkçe"]
+    rastgele = random.Random(42)
+    for i in range(adet):
+        ders = i % 4
+        yield (f"ogrenci_{i % 500}", dersler[ders], rastgele.randint(20 + ders * 10, 100))
+
+# Tek işlem (BEGIN/COMMIT) içinde executemany ile toplu ekleme
+baslangic = time.perf_counter()
+baglanti.execute("BEGIN")
+baglanti.executemany("INSERT INTO notlar VALUES (?, ?, ?)", notlar(100000))
+baglanti.execute("COMMIT")
+print(f"100000 satır eklendi: {time.perf_counter() - baslangic:.2f} saniye")
+
+# Dizin, veri yüklendikten sonra tek seferde kurulur
+baglanti.execute("CREATE INDEX IF NOT EXISTS notlar_ders ON notlar (ders)")
+
+# Sonuçlar fetchall() yerine imleç üzerinde dolaşılarak işlenir
+print("\nDers ortalamaları:")
+for ders, ortalama, sayi in baglanti.execute(
+        "SELECT ders, AVG(puan), COUNT(*) FROM notlar GROUP BY ders ORDER BY ders"):
+    print(f"  {ders:<10} {ortalama:6.2f} ({sayi} not)")
+
+en_iyi = baglanti.execute("SELECT ogrenci, MAX(puan) FROM notlar WHERE ders = ?", ("Fizik",)).fetchone()
+print(f"\nFizikte en yüksek puan: {en_iyi[0]} ({en_iyi[1]})")
+baglanti.close()
@@ -0,0 +1,24 @@
+# Web Scraping Örneği (eşzamanlı, internet gerektirmez)
+import asyncio
+from ekom_scraper import FixtureServer, Scraper
+
+async def kazi():
+    # Yerel deneme sunucusu: birbirine bağlantı veren 30 yapay sayfa
+    async with FixtureServer(pages=30, fail_every=10) as sunucu:
+        # Sunucu başına en fazla 4 eşzamanlı istek, bağlantılar açık tutulur
+        async with Scraper(per_host=4, retries=2) as scraper:
+            sayfalar = await scraper.crawl(sunucu.urls())
+            print(f"{len(sayfalar)} sayfa, {scraper.connections} bağlantı, "
+                  f"{scraper.stats['retries']} yeniden deneme")
+
+    print("Sayfa Başlıkları:")
+    for sayfa in sayfalar[:5]:
+        print(f"- {sayfa.title}: {sayfa.headings[0]} ({len(sayfa.links)} bağlantı)")
+
+    hatali = [sayfa.url for sayfa in sayfalar if not sayfa.ok]
+    print(f"Hatalı sayfa sayısı: {len(hatali)}")
+
+# Kullanım
+asyncio.run(kazi())
+
+# Gerçek bir site için: asyncio.run(Scraper().crawl(["https://example.com"]))
@@ -0,0 +1,39 @@
+# Hesap Makinesi Çözümü
+while True:
+    print("\n--- Hesap Makinesi ---")
+    print("1. Toplama")
+    print("2. Çıkarma") 
+    print("3. Çarpma")
+    print("4. Bölme")
+    print("5. Çıkış")
+    
+    secim = input("Seçiminiz (1-5): ")
+    
+    if secim == '5':
+        print("Güle güle!")
+        break
+    
+    if secim in ['1', '2', '3', '4']:
+        try:
+            sayi1 = float(input("İlk sayı: "))
+            sayi2 = float(input("İkinci sayı: "))
+            
+            if secim == '1':
+                sonuc = sayi1 + sayi2
+                print(f"Sonuç: {sayi1} + {sayi2} = {sonuc}")
+            elif secim == '2':
+                sonuc = sayi1 - sayi2
+                print(f"Sonuç: {sayi1} - {sayi2} = {sonuc}")
+            elif secim == '3':
+                sonuc = sayi1 * sayi2
+                print(f"Sonuç: {sayi1} × {sayi2} = {sonuc}")
+            elif secim == '4':
+                if sayi2 != 0:
+                    sonuc = sayi1 / sayi2
+                    print(f"Sonuç: {sayi1} ÷ {sayi2} = {sonuc}")
+                else:
+                    print("Hata: Sıfıra bölünemez!")
+        except ValueError:
+            print("Hata: Geçerli sayı girin!")
+    else:
+        print("Geçersiz seçim!")
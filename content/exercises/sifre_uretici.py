@@ -0,0 +1,23 @@
+# Şifre Üretici Çözümü
+import random
+import string
+
+def sifre_uret(uzunluk=12):
+    # Her karakter sınıfından en az bir karakter olsun
+    siniflar = [string.ascii_lowercase, string.ascii_uppercase, string.digits, string.punctuation]
+    karakterler = [random.choice(sinif) for sinif in siniflar]
+
+    # Kalan karakterleri tüm karakterler arasından seç
+    tum_karakterler = ''.join(siniflar)
+    karakterler += [random.choice(tum_karakterler) for i in range(uzunluk - len(karakterler))]
+
+    # Zorunlu karakterlerin yeri tahmin edilemesin
+    random.shuffle(karakterler)
+    return ''.join(karakterler)
+
+# Kullanım
+uzunluk = int(input("Şifre uzunluğu (en az 4): "))
+print("Rastgele Şifreler:")
+for i in range(5):
+    sifre = sifre_uret(max(4, uzunluk))
+    print(f"{i+1}. {sifre}")
@@ -0,0 +1,50 @@
+# Basit dosya organizatörü: tarama, aşamalı kopya bulma ve plan
+import os
+import hashlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+TURLER = {".jpg": "Resimler", ".png": "Resimler", ".pdf": "Belgeler",
+          ".txt": "Belgeler", ".mp3": "Müzik", ".zip": "Arşivler"}
+
+# Deneme klasörü
+os.makedirs("klasor/alt", exist_ok=True)
+for ad, icerik in [("a.jpg", b"x" * 5000), ("b.pdf", b"y" * 5000), ("alt/c.jpg", b"x" * 5000),
+                   ("d.txt", b"z" * 10), ("e.mp3", b"m" * 800), ("alt/f.zip", b"q" * 10)]:
+    with open(os.path.join("klasor", ad), "wb") as f:
+        f.write(icerik)
+
+def tara(klasor):
+    """os.scandir ile tüm dosyalar: (yol, boyut)"""
+    for girdi in os.scandir(klasor):
+        if girdi.is_dir():
+            yield from tara(girdi.path)
+        else:
+            yield girdi.path, girdi.stat().st_size
+
+def ozet(yol, boyut=None):
+    with open(yol, "rb") as f:
+        return hashlib.blake2b(f.read(boyut) if boyut else f.read()).hexdigest()
+
+def grupla(yollar, anahtar):
+    gruplar = defaultdict(list)
+    for yol, deger in zip(yollar, anahtar):
+        gruplar[deger].append(yol)
+    return [grup for grup in gruplar.values() if len(grup) > 1]
+
+dosyalar = dict(tara("klasor"))
+# 1. aşama: boyut
+adaylar = grupla(dosyalar, dosyalar.values())
+print(f"{len(dosyalar)} dosya, boyutu aynı olan {sum(map(len, adaylar))} aday")
+
+with ThreadPoolExecutor() as havuz:
+    for grup in adaylar:
+        # 2. aşama: ilk 1 KiB, 3. aşama: dosyanın tamamı
+        for kismi in grupla(grup, havuz.map(lambda yol: ozet(yol, 1024), grup)):
+            for kopya in grupla(kismi, havuz.map(ozet, kismi)):
+                print("Kopya:", " = ".join(kopya))
+
+print("\nPlan (kuru çalıştırma):")
+for yol in sorted(dosyalar):
+    klasor = TURLER.get(os.path.splitext(yol)[1].lower(), "Diğer")
+    print(f"  {yol} → klasor/{klasor}/{os.path.basename(yol)}")
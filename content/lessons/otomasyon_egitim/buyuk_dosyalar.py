@@ -0,0 +1,27 @@
+# Büyük bir günlük dosyasını farklı yöntemlerle işleyelim
+import tracemalloc
+from ekom_bigfile import generate_log, benchmark, METHODS
+
+generate_log("gunluk.log", size_mb=8)
+
+# Satırları tek tek üreten bir üreteç
+def hatalar(yol):
+    with open(yol, encoding="utf-8") as dosya:
+        for satir in dosya:
+            if "ERROR" in satir:
+                yield satir.rstrip("\n")
+
+tracemalloc.start()
+for i, satir in enumerate(hatalar("gunluk.log")):
+    if i < 3:
+        print(satir)
+_, tepe = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+print(f"{i + 1} hata satırı, tepe bellek: {tepe / 1024:.0f} KiB\n")
+
+# Aynı sayımı tek süreçli yöntemlerle karşılaştıralım
+# (paralel yöntem için: python ekomcode.py bigfile)
+rapor = benchmark("gunluk.log", "ERROR", ["read_all", "lines", "chunks", "mmap"])
+print(f"{'Yöntem':<20}{'MiB/s':>8}{'Bellek KiB':>12}{'Eşleşme':>10}")
+for ad, sonuc in rapor["results"].items():
+    print(f"{METHODS[ad][0]:<20}{sonuc['mb_per_s']:>8.0f}{sonuc['peak_kib']:>12.0f}{sonuc['matches']:>10}")
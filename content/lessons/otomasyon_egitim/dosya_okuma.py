@@ -0,0 +1,20 @@
+# Dosya yazma
+with open("ornek.txt", "w", encoding="utf-8") as dosya:
+    dosya.write("Merhaba Dünya!\n")
+    dosya.write("Python ile dosya işlemleri\n")
+    dosya.write("Otomasyon eğitimi\n")
+
+print("Dosya yazma tamamlandı!")
+
+# Dosya okuma
+print("\nDosya içeriği:")
+with open("ornek.txt", "r", encoding="utf-8") as dosya:
+    icerik = dosya.read()
+    print(icerik)
+
+# Satır satır okuma
+print("Satır satır okuma:")
+with open("ornek.txt", "r", encoding="utf-8") as dosya:
+    satirlar = dosya.readlines()
+    for i, satir in enumerate(satirlar, 1):
+        print(f"{i}. satır: {satir.strip()}")
@@ -0,0 +1,34 @@
+# Yerel deneme sunucusuyla e-posta gönderelim (gerçek e-posta gönderilmez)
+import time
+import smtplib
+from email.message import EmailMessage
+from ekom_mail import SMTPSink
+
+def ileti(alici, puan):
+    mesaj = EmailMessage()
+    mesaj["From"] = "ogretmen@ornek.com"
+    mesaj["To"] = alici
+    mesaj["Subject"] = "Haftalık puanınız"
+    mesaj.set_content(f"Merhaba,\nBu haftaki puanınız: {puan}\n")
+    return mesaj
+
+iletiler = [ileti(f"ogrenci{i}@ornek.com", i * 7 % 100) for i in range(100)]
+
+# Her ağ turunda 2 ms bekleyen yerel sunucu
+with SMTPSink(latency=0.002) as sunucu:
+    # Her ileti için yeni bağlantı
+    baslangic = time.perf_counter()
+    for mesaj in iletiler[:50]:
+        with smtplib.SMTP(sunucu.host, sunucu.port) as smtp:
+            smtp.send_message(mesaj)
+    print(f"Her iletide yeni bağlantı: {50 / (time.perf_counter() - baslangic):.0f} ileti/s")
+
+    # Tek bağlantı açık tutulur
+    baslangic = time.perf_counter()
+    with smtplib.SMTP(sunucu.host, sunucu.port) as smtp:
+        for mesaj in iletiler[50:]:
+            smtp.send_message(mesaj)
+    print(f"Açık tutulan bağlantı:     {50 / (time.perf_counter() - baslangic):.0f} ileti/s")
+
+    print(f"Sunucuya ulaşan ileti: {sunucu.stats['messages']}, "
+          f"açılan bağlantı: {sunucu.stats['connections']}")
@@ -0,0 +1,26 @@
+# Sırayla ve eşzamanlı veri çekmeyi karşılaştıralım
+import time
+import asyncio
+from ekom_scraper import FixtureServer, Scraper
+
+async def karsilastir():
+    # Her yanıtı 20 ms geciktiren yerel deneme sunucusu
+    async with FixtureServer(pages=20, delay=0.02) as sunucu:
+        adresler = sunucu.urls()
+
+        async with Scraper(per_host=1) as scraper:
+            baslangic = time.perf_counter()
+            for adres in adresler:
+                await scraper.fetch(adres)
+            print(f"Sırayla: {time.perf_counter() - baslangic:.2f} saniye")
+
+        async with Scraper(per_host=10) as scraper:
+            baslangic = time.perf_counter()
+            sayfalar = await scraper.crawl(adresler)
+            print(f"Eşzamanlı: {time.perf_counter() - baslangic:.2f} saniye, "
+                  f"{scraper.connections} bağlantı")
+
+    for sayfa in sayfalar[:3]:
+        print(f"{sayfa.title}: {sayfa.headings[0]}")
+
+asyncio.run(karsilastir())
@@ -0,0 +1,11 @@
+# SQLite'a satır eklemenin farklı yollarını karşılaştıralım
+from ekom_db import benchmark, INSERT_METHODS
+
+rapor = benchmark(rows=20000, directory=".")
+print(f"{'Yöntem':<28}{'Satır':>8}{'Satır/s':>10}")
+for ad, sonuc in rapor["inserts"].items():
+    print(f"{INSERT_METHODS[ad][0]:<28}{sonuc['rows']:>8}{sonuc['rows_per_s']:>10.0f}")
+
+print(f"\n{'Sorgu okuma':<28}{'Bellek KiB':>18}")
+for ad, sonuc in rapor["queries"].items():
+    print(f"{ad:<28}{sonuc['peak_kib']:>18.0f}")
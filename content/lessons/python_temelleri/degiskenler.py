@@ -0,0 +1,18 @@
+# Değişken tanımlama
+isim = "Ahmet"
+yas = 25
+boy = 1.75
+ogrenci = True
+
+# Veri tiplerini yazdırma
+print("İsim:", isim, "Tip:", type(isim))
+print("Yaş:", yas, "Tip:", type(yas))
+print("Boy:", boy, "Tip:", type(boy))
+print("Öğrenci:", ogrenci, "Tip:", type(ogrenci))
+
+# Liste ve sözlük
+meyveler = ["elma", "armut", "muz"]
+kisi = {"ad": "Mehmet", "yas": 30}
+
+print("Meyveler:", meyveler)
+print("Kişi:", kisi)
@@ -0,0 +1,28 @@
+# Aritmetik operatörler
+a = 10
+b = 3
+
+print("Toplam:", a + b)
+print("Fark:", a - b)
+print("Çarpım:", a * b)
+print("Bölüm:", a / b)
+print("Tam Bölüm:", a // b)
+print("Kalan:", a % b)
+print("Üs:", a ** b)
+
+# Karşılaştırma operatörleri
+x = 5
+y = 8
+
+print("x == y:", x == y)
+print("x != y:", x != y)
+print("x > y:", x > y)
+print("x < y:", x < y)
+
+# Mantıksal operatörler
+dogru = True
+yanlis = False
+
+print("dogru and yanlis:", dogru and yanlis)
+print("dogru or yanlis:", dogru or yanlis)
+print("not dogru:", not dogru)
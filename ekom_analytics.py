@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Öğrenci topluluğu (kohort) istatistikleri.
+
+Depodaki tüm öğrenciler iki toplu sorguyla okunur ve öğrenci × ders
+tamamlanma matrisine yerleştirilir. NumPy kuruluysa matris bir bool
+dizisidir; ders ve öğrenci toplamları sütun/satır toplamlarıyla,
+yüzdelikler sıralı dizi üzerinden bulunur. NumPy yoksa her ders bir
+öğrenci bit dizisi, her öğrenci bir ders bit dizisi olarak tutulur ve
+toplamlar int.bit_count() ile C düzeyinde sayılır. Her iki durumda da
+öğrenci başına sözlük dolaşılmaz; sıralama listesi ve takılan
+öğrenciler heapq ile seçilir.
+"""
+
+import sys
+import json
+import heapq
+from datetime import datetime, timedelta
+
+from colorama import Fore, Style
+
+from ekom_progress import LessonIndex
+
+PERCENTILES = (25, 50, 75, 90, 99)
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _rank(count, p):
+    """Sıralı dizide p. yüzdeliğin sırası (ekom_bench.summarize ile aynı kural)"""
+    return min(count - 1, int(round(p / 100 * (count - 1))))
+
+
+class NumpyMatrix:
+    """Öğrenci × ders bool matrisi"""
+
+    name = "numpy"
+
+    def __init__(self, np, learners, lessons, rows, cols):
+        self.np = np
+        self.matrix = np.zeros((learners, lessons), dtype=bool)
+        self.matrix[np.frombuffer(rows, dtype=np.uint32), np.frombuffer(cols, dtype=np.uint32)] = True
+
+    def lesson_counts(self):
+        return self.matrix.sum(axis=0).tolist()
+
+    def learner_counts(self):
+        return self.matrix.sum(axis=1).tolist()
+
+    def percentiles(self, values, percentiles):
+        ordered = self.np.sort(self.np.asarray(values))
+        ranks = [_rank(len(ordered), p) for p in percentiles]
+        return ordered[ranks].tolist()
+
+
+class BitsetMatrix:
+    """Satırları ve sütunları ayrı bit dizileri olan matris"""
+
+    name = "bitset"
+
+    def __init__(self, learners, lessons, rows, cols):
+        row_bits = [bytearray((lessons + 7) // 8) for _ in range(learners)]
+        col_bits = [bytearray((learners + 7) // 8) for _ in range(lessons)]
+        for row, col in zip(rows, cols):
+            row_bits[row][col >> 3] |= 1 << (col & 7)
+            col_bits[col][row >> 3] |= 1 << (row & 7)
+        self.rows = row_bits
+        self.cols = col_bits
+
+    def lesson_counts(self):
+        return [int.from_bytes(bits, "little").bit_count() for bits in self.cols]
+
+    def learner_counts(self):
+        return [int.from_bytes(bits, "little").bit_count() for bits in self.rows]
+
+    def percentiles(self, values, percentiles):
+        ordered = sorted(values)
+        return [ordered[_rank(len(ordered), p)] for p in percentiles]
+
+
+class Cohort:
+    """Depodaki tüm öğrencilerin tamamlanma matrisi ve özet bilgileri"""
+
+    def __init__(self, modules, learners, completions, backend="auto"):
+        from array import array
+        self.modules = modules
+        self.index = LessonIndex(modules)
+        self.learner_ids = [learner_id for learner_id, _, _, _ in learners]
+        self.scores = [score for _, score, _, _ in learners]
+        self.start_dates = [start for _, _, start, _ in learners]
+        # Son tamamlama zamanı; depo bilmiyorsa None
+        self.last_completed = [last for _, _, _, last in learners]
+
+        row_of = {learner_id: row for row, learner_id in enumerate(self.learner_ids)}
+        position = self.index.position
+        rows, cols = array('I'), array('I')
+        for learner_id, lesson_key in completions:
+            row = row_of.get(learner_id)
+            col = position.get(lesson_key)
+            # Katalogdan çıkarılmış dersler sayılmaz
+            if row is not None and col is not None:
+                rows.append(row)
+                cols.append(col)
+
+        np = _numpy() if backend in ("auto", "numpy") else None
+        if backend == "numpy" and np is None:
+            raise ImportError("numpy kurulu değil")
+        if np is not None:
+            self.matrix = NumpyMatrix(np, len(self.learner_ids), len(self.index), rows, cols)
+        else:
+            self.matrix = BitsetMatrix(len(self.learner_ids), len(self.index), rows, cols)
+
+    @classmethod
+    def load(cls, store, modules, backend="auto"):
+        """Depodaki tüm öğrencileri oku"""
+        learners, completions = store.cohort()
+        return cls(modules, learners, completions, backend)
+
+    def __len__(self):
+        return len(self.learner_ids)
+
+    def _lesson_entry(self, position, rate):
+        lesson_key = self.index.keys[position]
+        module_key = self.index.module_of[lesson_key]
+        return {"lesson": lesson_key, "module": module_key,
+                "title": self.modules[module_key]["lessons"][lesson_key], "rate": rate}
+
+    def _percentiles(self, values):
+        found = self.matrix.percentiles(values, PERCENTILES) if values else [0] * len(PERCENTILES)
+        return {f"p{p}": value for p, value in zip(PERCENTILES, found)}
+
+    def report(self, top=10, stalled_days=14, today=None):
+        """Tüm özetler, JSON'a yazılabilir biçimde"""
+        learner_total, lesson_total = len(self), len(self.index)
+        lesson_counts = self.matrix.lesson_counts()
+        learner_counts = self.matrix.learner_counts()
+        cells = learner_total * lesson_total
+
+        modules = {}
+        for module_key, module in self.modules.items():
+            positions = [self.index.position[lesson_key] for lesson_key in module["lessons"]
+                         if self.index.module_of[lesson_key] == module_key]
+            done = sum(lesson_counts[position] for position in positions)
+            modules[module_key] = {
+                "title": module["title"],
+                "lessons": len(positions),
+                "rate": done / (learner_total * len(positions)) if learner_total and positions else 0.0
+            }
+
+        lesson_rates = [count / learner_total if learner_total else 0.0 for count in lesson_counts]
+        hardest = heapq.nsmallest(top, range(lesson_total), key=lesson_rates.__getitem__)
+
+        # Hiç ders bitirmemiş öğrencinin son etkinliği başlangıç tarihidir; ders bitirmiş ama
+        # zamanı bilinmeyen öğrenci takılan sayılmaz (etkin öğrenciler yanlışlıkla listelenmesin)
+        last_active = [last or (start if not completed else None)
+                       for last, start, completed in zip(self.last_completed, self.start_dates, learner_counts)]
+        today = today or datetime.now()
+        cutoff = (today - timedelta(days=stalled_days)).strftime("%Y-%m-%d %H:%M:%S")
+        stalled = [row for row, last in enumerate(last_active)
+                   if last is not None and last < cutoff and learner_counts[row] < lesson_total]
+
+        return {
+            "backend": self.matrix.name,
+            "learners": learner_total,
+            "lessons": lesson_total,
+            "completion_rate": sum(lesson_counts) / cells if cells else 0.0,
+            "modules": modules,
+            "lesson_rates": dict(zip(self.index.keys, lesson_rates)),
+            "hardest_lessons": [self._lesson_entry(position, lesson_rates[position]) for position in hardest],
+            "score_percentiles": self._percentiles(self.scores),
+            "completed_percentiles": self._percentiles(learner_counts),
+            "leaderboard": [{"learner": learner_id, "score": score, "completed": completed}
+                            for score, completed, learner_id in heapq.nlargest(
+                                top, zip(self.scores, learner_counts, self.learner_ids))],
+            "stalled_days": stalled_days,
+            "stalled_total": len(stalled),
+            "stalled_unknown": sum(1 for last in last_active if last is None),
+            "stalled": [{"learner": self.learner_ids[row], "last_active": last_active[row],
+                         "completed": learner_counts[row]}
+                        for row in heapq.nsmallest(top, stalled, key=last_active.__getitem__)]
+        }
+
+
+def _bar(rate, width=20):
+    filled = int(round(rate * width))
+    return "█" * filled + "░" * (width - filled)
+
+
+def print_report(report):
+    print(f"\n{Fore.CYAN}╔══════════ KOHORT İSTATİSTİKLERİ ══════════╗{Style.RESET_ALL}")
+    print(f"║ {report['learners']} öğrenci, {report['lessons']} ders "
+          f"({report['backend']}), genel tamamlanma: %{report['completion_rate'] * 100:.1f}")
+    print(f"║")
+    print(f"║ {Fore.YELLOW}Modüller:{Style.RESET_ALL}")
+    for module in report["modules"].values():
+        print(f"║   {module['title'][:30]:<30} {_bar(module['rate'])} %{module['rate'] * 100:5.1f}")
+    if report["hardest_lessons"]:
+        print(f"║")
+        print(f"║ {Fore.YELLOW}En az tamamlanan dersler:{Style.RESET_ALL}")
+        for lesson in report["hardest_lessons"]:
+            print(f"║   {lesson['title'][:40]:<40} %{lesson['rate'] * 100:5.1f}")
+    print(f"║")
+    scores = "  ".join(f"{name}={value}" for name, value in report["score_percentiles"].items())
+    completed = "  ".join(f"{name}={value}" for name, value in report["completed_percentiles"].items())
+    print(f"║ {Fore.YELLOW}Puan yüzdelikleri:{Style.RESET_ALL} {scores}")
+    print(f"║ {Fore.YELLOW}Tamamlanan ders:{Style.RESET_ALL}   {completed}")
+    if report["leaderboard"]:
+        print(f"║")
+        print(f"║ {Fore.YELLOW}Sıralama:{Style.RESET_ALL}")
+        for rank, entry in enumerate(report["leaderboard"], 1):
+            print(f"║   {rank:>3}. {entry['learner'][:30]:<30} {entry['score']:>7} puan  "
+                  f"{entry['completed']:>5} ders")
+    print(f"║")
+    print(f"║ {Fore.YELLOW}{report['stalled_days']} gündür ilerlemeyen: "
+          f"{report['stalled_total']} öğrenci{Style.RESET_ALL}")
+    for entry in report["stalled"]:
+        print(f"║   {entry['learner'][:30]:<30} son etkinlik {entry['last_active'][:10]}  "
+              f"{entry['completed']:>5} ders")
+    if report["stalled_unknown"]:
+        print(f"║   ({report['stalled_unknown']} öğrencinin son etkinlik zamanı bilinmiyor, dahil edilmedi)")
+    print(f"╚═══════════════════════════════════════════╝")
+
+
+def main(store, content, top=10, stalled_days=14, backend="auto", json_path=None):
+    """analytics komutu; çıkış kodunu döndürür"""
+    import time
+    start = time.perf_counter()
+    try:
+        cohort = Cohort.load(store, content.catalog()["modules"], backend)
+    except ImportError as e:
+        print(f"{Fore.RED}{e}{Style.RESET_ALL}", file=sys.stderr)
+        return 2
+    loaded = time.perf_counter()
+    report = cohort.report(top, stalled_days)
+    done = time.perf_counter()
+
+    print_report(report)
+    print(f"yükleme: {(loaded - start) * 1000:.1f} ms, hesaplama: {(done - loaded) * 1000:.1f} ms")
+    if json_path:
+        with open(json_path, 'w', encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"{Fore.GREEN}✓ Sonuçlar kaydedildi: {json_path}")
+    return 0
@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""EkomCode performans ölçüm takımı.
+
+Sabit tohumlu, tekrarlanabilir iş yükleri çalıştırır: ekran çizimi,
+içerik arama, ilerleme kaydetme/yükleme ve kod çalıştırma. İçerik ve
+ilerleme ölçümleri için 10.000 derslik yapay bir katalog ve 10.000
+tamamlanmış dersi olan bir öğrenci kaydı üretilir. Sonuçlar gecikme
+yüzdelikleri ve bellek tepe değeri olarak raporlanır; JSON temel
+değerlerle karşılaştırılıp gerilemeler işaretlenir.
+"""
+
+import io
+import os
+import gc
+import sys
+import json
+import time
+import random
+import shutil
+import fnmatch
+import platform
+import tempfile
+import tracemalloc
+
+from colorama import Fore, Style
+
+from ekom_content import ContentPack, ContentBundle, build_bundle
+from ekom_render import Renderer
+from ekom_storage import SQLiteProgressStore, new_progress
+
+DEFAULT_BASELINE = "bench_baseline.json"
+SEED = 1234
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Bir ölçüm fonksiyonunu kayda al"""
+    def register(fn):
+        BENCHMARKS[name] = fn
+        return fn
+    return register
+
+
+class BenchContext:
+    """Ölçümler arasında paylaşılan yapay veri ve geçici klasör"""
+
+    def __init__(self, root, lessons=10000, modules=10, completions=10000, quick=False):
+        self.root = root
+        self.lessons = lessons
+        self.modules = modules
+        self.completions = completions
+        self.quick = quick
+        self._pack = None
+        self._bundle = None
+
+    def iterations(self, count):
+        return max(10, count // 10) if self.quick else count
+
+    @property
+    def pack(self):
+        if self._pack is None:
+            pack_dir = os.path.join(self.root, "pack")
+            make_synthetic_pack(pack_dir, self.lessons, self.modules)
+            self._pack = ContentPack(pack_dir)
+        return self._pack
+
+    @property
+    def bundle(self):
+        if self._bundle is None:
+            path = os.path.join(self.root, "content.bundle")
+            build_bundle(self.pack.root, path)
+            self._bundle = ContentBundle(path)
+        return self._bundle
+
+    def lesson_keys(self):
+        """Katalogdaki (modül, ders) çiftleri"""
+        return [(module_key, lesson_key)
+                for module_key, module in self.pack.catalog()["modules"].items()
+                for lesson_key in module["lessons"]]
+
+    def app(self, content, learner_id="bench"):
+        """Ekranı belleğe çizen, yapay içerikli bir EkomCode örneği"""
+        from ekomcode import EkomCode
+        store_dir = tempfile.mkdtemp(dir=self.root)
+        app = EkomCode(learner_id=learner_id, store=SQLiteProgressStore(store_dir), content=content)
+        app.screen = Renderer(io.StringIO(), ansi=True)
+        return app
+
+
+def make_synthetic_pack(root, lessons=10000, modules=10):
+    """Belirtilen boyutta yapay bir içerik paketi oluştur"""
+    rng = random.Random(SEED)
+    words = ["değişken", "döngü", "fonksiyon", "liste", "sözlük", "dosya", "otomasyon",
+             "koşul", "sınıf", "modül", "hata", "çıktı", "girdi", "veri", "işlem"]
+    catalog = {"modules": {}, "examples": {}}
+    per_module = lessons // modules
+    for m in range(modules):
+        module_key = f"modul_{m:03d}"
+        lesson_titles = {}
+        os.makedirs(os.path.join(root, "lessons", module_key), exist_ok=True)
+        for i in range(per_module):
+            lesson_key = f"ders_{m:03d}_{i:05d}"
+            lesson_titles[lesson_key] = " ".join(rng.choice(words) for _ in range(3)).title()
+            base = os.path.join(root, "lessons", module_key, lesson_key)
+            with open(base + ".txt", 'w', encoding="utf-8") as f:
+                f.write("\n".join(" ".join(rng.choice(words) for _ in range(8)) for _ in range(8)) + "\n")
+            with open(base + ".py", 'w', encoding="utf-8") as f:
+                f.write("".join(f"x{j} = {j}\nprint('{rng.choice(words)}', x{j})\n" for j in range(10)))
+        catalog["modules"][module_key] = {"title": f"Modül {m}", "lessons": lesson_titles}
+    with open(os.path.join(root, "catalog.json"), 'w', encoding="utf-8") as f:
+        json.dump(catalog, f, ensure_ascii=False)
+    return root
+
+
+def measure(fn, iterations, warmup=3):
+    """fn'i tekrar tekrar çalıştırıp gecikmeleri (saniye) döndür"""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return samples
+
+
+def peak_memory(fn, repeat=3):
+    """fn çalışırken ayrılan en yüksek bellek (KiB)"""
+    tracemalloc.start()
+    try:
+        for _ in range(repeat):
+            fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def summarize(samples):
+    """Gecikme yüzdelikleri (milisaniye)"""
+    ordered = sorted(samples)
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))] * 1000
+
+    return {
+        "n": len(ordered),
+        "mean_ms": sum(ordered) / len(ordered) * 1000,
+        "p50_ms": pct(50),
+        "p95_ms": pct(95),
+        "p99_ms": pct(99),
+        "max_ms": ordered[-1] * 1000
+    }
+
+
+def run_case(fn, iterations):
+    result = summarize(measure(fn, iterations))
+    result["peak_kib"] = peak_memory(fn)
+    return result
+
+
+@benchmark("render.main_menu")
+def bench_render_main_menu(ctx):
+    app = ctx.app(ctx.pack)
+
+    def step():
+        app.user_data["score"] += 10
+        app.draw_main_menu()
+        app.screen.present()
+
+    return run_case(step, ctx.iterations(2000))
+
+
+@benchmark("render.module_menu")
+def bench_render_module_menu(ctx):
+    app = ctx.app(ctx.pack)
+    keys = ctx.lesson_keys()
+    module_key = keys[0][0]
+    app.user_data = dict(app.user_data, completed_lessons=app.lesson_index.completions(
+        lesson_key for _, lesson_key in keys[:ctx.completions]))
+    app.prompt = lambda text: (app.screen.present(), "0")[1]
+    app.screen.invalidate()
+    return run_case(lambda: app.module_menu(module_key), ctx.iterations(50))
+
+
+@benchmark("render.statistics")
+def bench_render_statistics(ctx):
+    app = ctx.app(ctx.pack)
+    keys = ctx.lesson_keys()
+    app.user_data = dict(app.user_data, completed_lessons=app.lesson_index.completions(
+        lesson_key for _, lesson_key in keys[:ctx.completions]))
+    app.prompt = lambda text: (app.screen.present(), "")[1]
+    return run_case(app.show_statistics, ctx.iterations(200))
+
+
+def _lookup_case(ctx, content):
+    app = ctx.app(content)
+    keys = ctx.lesson_keys()
+    rng = random.Random(SEED)
+
+    def step():
+        module_key, lesson_key = rng.choice(keys)
+        app.get_lesson_content(module_key, lesson_key)
+        app.get_code_example(module_key, lesson_key)
+
+    return run_case(step, ctx.iterations(5000))
+
+
+@benchmark("content.lookup.bundle")
+def bench_lookup_bundle(ctx):
+    return _lookup_case(ctx, ctx.bundle)
+
+
+@benchmark("content.lookup.pack")
+def bench_lookup_pack(ctx):
+    return _lookup_case(ctx, ctx.pack)
+
+
+def _progress_store(ctx):
+    store = SQLiteProgressStore(tempfile.mkdtemp(dir=ctx.root))
+    user_data = new_progress()
+    for i in range(ctx.completions):
+        lesson_key = f"ders_{i:05d}"
+        user_data["completed_lessons"].append(lesson_key)
+        store.record_completion("bench", lesson_key, user_data)
+    store.flush()
+    return store, user_data
+
+
+@benchmark("storage.save")
+def bench_storage_save(ctx):
+    store, user_data = _progress_store(ctx)
+
+    def step():
+        user_data["score"] += 10
+        store.save("bench", user_data)
+        store.flush()
+
+    try:
+        return run_case(step, ctx.iterations(500))
+    finally:
+        store.close()
+
+
+@benchmark("storage.load")
+def bench_storage_load(ctx):
+    store, _ = _progress_store(ctx)
+    try:
+        return run_case(lambda: store.load("bench"), ctx.iterations(200))
+    finally:
+        store.close()
+
+
+@benchmark("storage.record_completion")
+def bench_storage_record(ctx):
+    store, user_data = _progress_store(ctx)
+    counter = iter(range(10 ** 9))
+
+    def step():
+        store.record_completion("bench", f"yeni_{next(counter)}", user_data)
+
+    try:
+        return run_case(step, ctx.iterations(5000))
+    finally:
+        store.close()
+
+
+@benchmark("exec.run_code_example")
+def bench_run_code(ctx):
+    from ekom_executor import ExecutionPool
+    pool = ExecutionPool(workers=2)
+    code = ctx.pack.code(*ctx.lesson_keys()[0])
+    try:
+        # Bellek ölçümü yalnızca uygulama tarafını kapsar (çalıştırma ayrı süreçte)
+        return run_case(lambda: pool.run(code), ctx.iterations(200))
+    finally:
+        pool.shutdown()
+
+
+@benchmark("exec.compile.uncached")
+def bench_compile_uncached(ctx):
+    code = ctx.pack.code(*ctx.lesson_keys()[0])
+    return run_case(lambda: compile(code, "<ekomcode>", "exec"), ctx.iterations(2000))
+
+
+@benchmark("exec.compile.cached")
+def bench_compile_cached(ctx):
+    from ekom_codecache import CodeCache
+    cache = CodeCache(os.path.join(ctx.root, "codecache"))
+    code = ctx.pack.code(*ctx.lesson_keys()[0])
+    return run_case(lambda: cache.bytecode(code), ctx.iterations(2000))
+
+
+@benchmark("search.query")
+def bench_search_query(ctx):
+    from ekom_search import SearchIndex
+    index = SearchIndex.build(ctx.bundle)
+    path = os.path.join(ctx.root, "search.index")
+    index.save(path)
+    index = SearchIndex.load(path)
+    queries = ["değişken", "DÖNGÜ fonk", "sozluk", "otomasyon veri", "İşlem", "mod"]
+    counter = iter(range(10 ** 9))
+    return run_case(lambda: index.search(queries[next(counter) % len(queries)]), ctx.iterations(500))
+
+
+@benchmark("analytics.cohort")
+def bench_analytics_cohort(ctx):
+    from ekom_analytics import Cohort
+    store = SQLiteProgressStore(tempfile.mkdtemp(dir=ctx.root))
+    keys = [lesson_key for _, lesson_key in ctx.lesson_keys()]
+    rng = random.Random(SEED)
+    learners = 200 if ctx.quick else 2000
+    try:
+        with store.conn:
+            store.conn.executemany("INSERT INTO learners VALUES (?, ?, ?, ?, '{}')", (
+                (f"ogrenci_{i:05d}", "2024-01-01 00:00:00", "python_temelleri", rng.randrange(5000))
+                for i in range(learners)))
+            store.conn.executemany("INSERT OR IGNORE INTO completions VALUES (?, ?, ?)", (
+                (f"ogrenci_{i:05d}", lesson_key, f"2024-{rng.randrange(1, 13):02d}-01 00:00:00")
+                for i in range(learners) for lesson_key in rng.sample(keys, rng.randrange(200))))
+        modules = ctx.pack.catalog()["modules"]
+        return run_case(lambda: Cohort.load(store, modules).report(), ctx.iterations(20))
+    finally:
+        store.close()
+
+
+@benchmark("scrape.fixture")
+def bench_scrape_fixture(ctx):
+    import asyncio
+    from ekom_scraper import benchmark as scrape
+    return run_case(lambda: asyncio.run(scrape(pages=200)), ctx.iterations(20))
+
+
+def run_benchmarks(pattern="*", quick=False, lessons=10000, completions=10000):
+    """Desene uyan ölçümleri çalıştır"""
+    root = tempfile.mkdtemp(prefix="ekom_bench_")
+    ctx = BenchContext(root, lessons=lessons, completions=completions, quick=quick)
+    results = {}
+    try:
+        for name, fn in BENCHMARKS.items():
+            if fnmatch.fnmatch(name, pattern):
+                print(f"{Fore.CYAN}… {name}{Style.RESET_ALL}", file=sys.stderr)
+                results[name] = fn(ctx)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "lessons": lessons,
+            "completions": completions,
+            "quick": quick,
+            "date": time.strftime("%Y-%m-%d %H:%M:%S")
+        },
+        "results": results
+    }
+
+
+def compare(report, baseline, tolerance=0.2):
+    """Temel değerlere göre gerileyen ölçümler: {ad: [açıklamalar]}"""
+    regressions = {}
+    for name, result in report["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        for metric in ("p50_ms", "p95_ms", "peak_kib"):
+            if base[metric] > 0 and result[metric] > base[metric] * (1 + tolerance):
+                change = (result[metric] / base[metric] - 1) * 100
+                regressions.setdefault(name, []).append(f"{metric} +{change:.0f}%")
+    return regressions
+
+
+def print_report(report, regressions=None):
+    regressions = regressions or {}
+    print(f"\n{Fore.CYAN}╔══════════ PERFORMANS ÖLÇÜMLERİ ══════════╗{Style.RESET_ALL}")
+    print(f"║ {'ölçüm':<28}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'tepe KiB':>11}")
+    for name, r in report["results"].items():
+        color = Fore.RED if name in regressions else ""
+        note = f"  ⚠ {', '.join(regressions[name])}" if name in regressions else ""
+        print(f"║ {color}{name:<28}{r['n']:>6}{r['p50_ms']:>10.3f}{r['p95_ms']:>10.3f}"
+              f"{r['p99_ms']:>10.3f}{r['peak_kib']:>11.1f}{note}{Style.RESET_ALL}")
+    print(f"╚══════════════════════════════════════════╝")
+
+
+def main(pattern="*", quick=False, baseline_path=None, save_path=None, tolerance=0.2, json_path=None):
+    """bench komutu; gerileme varsa 1 döndürür"""
+    report = run_benchmarks(pattern, quick)
+    regressions = {}
+    # Dosya verilmezse, varsa çalışma dizinindeki varsayılan temel değerlerle karşılaştırılır
+    if baseline_path is None and os.path.exists(DEFAULT_BASELINE):
+        baseline_path = DEFAULT_BASELINE
+    if baseline_path:
+        try:
+            with open(baseline_path, encoding="utf-8") as f:
+                regressions = compare(report, json.load(f), tolerance)
+        except FileNotFoundError:
+            print(f"{Fore.YELLOW}Temel değer dosyası bulunamadı: {baseline_path}")
+    print_report(report, regressions)
+
+    for path in (save_path, json_path):
+        if path:
+            with open(path, 'w', encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            print(f"{Fore.GREEN}✓ Sonuçlar kaydedildi: {path}")
+
+    if regressions:
+        print(f"{Fore.RED}{len(regressions)} ölçümde gerileme (eşik %{tolerance * 100:.0f})")
+        return 1
+    return 0
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Bellekten büyük dosyaları işleme yöntemleri ve karşılaştırması.
+
+Aynı iş (satır sayısı ve bir kalıbın kaç kez geçtiği) beş yolla yapılır:
+dosyanın tamamını read() ile okumak, satırları bir üreteçle akıtmak,
+sabit boyutlu ikili parçalar okumak, dosyayı mmap ile belleğe eşleyip
+read() çağrısı yapmadan taramak ve dosyayı satır sınırlarına hizalı aralıklara
+bölüp her aralığı ayrı bir süreçte saymak. Parça okumada kalıp iki
+parçanın sınırına denk gelebileceği için önceki parçanın son
+len(kalıp)-1 baytı bir sonrakinin başına eklenir; kendi içinde örtüşebilen
+kalıplarda ("aa" gibi) yalnızca son eşleşmeden sonraki baytlar eklenir ki
+str.count() gibi örtüşmeyen eşleşmeler sayılsın. Ölçüm komutu bir test
+günlüğü üretip yöntemlerin hızını ve bellek tepe değerini karşılaştırır.
+"""
+
+import os
+import sys
+import json
+import mmap
+import time
+import random
+import tempfile
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from colorama import Fore, Style
+
+CHUNK_SIZE = 1024 * 1024
+DEFAULT_PATTERN = "ERROR"
+LEVELS = ("INFO", "INFO", "INFO", "DEBUG", "DEBUG", "WARNING", "ERROR")
+
+
+def _line_total(newlines, size, last_byte):
+    """Son satır satır sonuyla bitmiyorsa o da sayılır"""
+    return newlines + (1 if size and last_byte != b"\n" else 0)
+
+
+def _overlaps(needle):
+    """Kalıbın bir öneki aynı zamanda soneki mi (iki eşleşme örtüşebilir mi)"""
+    return any(needle[:k] == needle[-k:] for k in range(1, len(needle)))
+
+
+def _count_greedy(window, needle):
+    """Örtüşmeyen eşleşmeleri soldan say; (sayı, son eşleşmenin bittiği konum)"""
+    matches = end = 0
+    position = window.find(needle)
+    while position >= 0:
+        matches += 1
+        end = position + len(needle)
+        position = window.find(needle, end)
+    return matches, end
+
+
+def iter_lines(path, encoding="utf-8"):
+    """Dosyanın satırlarını tek tek üret (bellekte yalnızca bir satır tutulur)"""
+    with open(path, encoding=encoding, errors="replace") as f:
+        for line in f:
+            yield line
+
+
+def iter_chunks(path, chunk_size=CHUNK_SIZE):
+    """Dosyayı sabit boyutlu ikili parçalar halinde üret"""
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def count_read_all(path, pattern=DEFAULT_PATTERN):
+    """Tüm dosyayı belleğe okuyarak say (karşılaştırma için)"""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        text = f.read()
+    lines = text.count("\n") + (1 if text and not text.endswith("\n") else 0)
+    return {"lines": lines, "matches": text.count(pattern)}
+
+
+def count_lines(path, pattern=DEFAULT_PATTERN):
+    """Satır üreteciyle say"""
+    lines = matches = 0
+    for line in iter_lines(path):
+        lines += 1
+        matches += line.count(pattern)
+    return {"lines": lines, "matches": matches}
+
+
+def count_chunks(path, pattern=DEFAULT_PATTERN, chunk_size=CHUNK_SIZE):
+    """İkili parçalarla say; sınırdaki kalıplar için önceki parçanın kuyruğu saklanır"""
+    needle = pattern.encode("utf-8")
+    keep = len(needle) - 1
+    overlaps = _overlaps(needle)
+    newlines = matches = 0
+    tail = b""
+    last = b""
+    for chunk in iter_chunks(path, chunk_size):
+        newlines += chunk.count(b"\n")
+        window = tail + chunk if tail else chunk
+        if overlaps:
+            # Sayılmış bir eşleşmenin baytları bir sonraki pencereye taşınmaz
+            found, end = _count_greedy(window, needle)
+            matches += found
+            tail = window[max(end, len(window) - keep):]
+        else:
+            matches += window.count(needle)
+            # Kuyruk, kalıbın tamamını içeremeyecek kadar kısa: aynı eşleşme iki kez sayılmaz
+            tail = window[-keep:] if keep else b""
+        last = chunk[-1:]
+    return {"lines": _line_total(newlines, bool(last), last), "matches": matches}
+
+
+def _scan_mmap(mm, start, end, needle):
+    """mmap üzerinde [start, end) aralığını pencere pencere tara"""
+    keep = len(needle) - 1
+    overlaps = _overlaps(needle)
+    newlines = matches = 0
+    resume = start
+    # Dosya okunmaz: pencere dilimi doğrudan sayfa önbelleğinden kopyalanır
+    for offset in range(start, end, CHUNK_SIZE):
+        stop = min(offset + CHUNK_SIZE, end)
+        newlines += mm[offset:stop].count(b"\n")
+        # Önceki pencerenin kuyruğu eklenir; kuyruk tek başına bir eşleşme içeremez
+        window_start = max(start, offset - keep, resume)
+        if overlaps:
+            found, last_end = _count_greedy(mm[window_start:stop], needle)
+            matches += found
+            if found:
+                resume = window_start + last_end
+        else:
+            matches += mm[window_start:stop].count(needle)
+    return newlines, matches
+
+
+def count_mmap(path, pattern=DEFAULT_PATTERN):
+    """Dosyayı mmap ile eşleyip tara"""
+    size = os.path.getsize(path)
+    if size == 0:
+        return {"lines": 0, "matches": 0}
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        newlines, matches = _scan_mmap(mm, 0, size, pattern.encode("utf-8"))
+        last = mm[size - 1:size]
+    return {"lines": _line_total(newlines, size, last), "matches": matches}
+
+
+def split_ranges(path, parts):
+    """Dosyayı satır sınırlarına hizalı en fazla parts aralığa böl"""
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    bounds = [0]
+    with open(path, 'rb') as f:
+        for i in range(1, parts):
+            f.seek(max(size * i // parts, bounds[-1]))
+            f.readline()
+            position = f.tell()
+            if position >= size:
+                break
+            if position > bounds[-1]:
+                bounds.append(position)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _count_range(path, start, end, needle):
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return _scan_mmap(mm, start, end, needle)
+
+
+def count_parallel(path, pattern=DEFAULT_PATTERN, workers=None):
+    """Aralıkları ayrı süreçlerde mmap ile say ve sonuçları topla"""
+    workers = workers or os.cpu_count() or 1
+    ranges = split_ranges(path, workers * 4)
+    if not ranges:
+        return {"lines": 0, "matches": 0}
+    needle = pattern.encode("utf-8")
+    # Aralıklar satır sınırında başladığı için satır içindeki kalıp bölünmez
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_count_range, [path] * len(ranges), *zip(*ranges), [needle] * len(ranges)))
+    with open(path, 'rb') as f:
+        f.seek(-1, os.SEEK_END)
+        last = f.read(1)
+    return {"lines": _line_total(sum(r[0] for r in results), True, last),
+            "matches": sum(r[1] for r in results)}
+
+
+METHODS = {
+    "read_all": ("read() ile tamamı", count_read_all),
+    "lines": ("satır üreteci", count_lines),
+    "chunks": ("ikili parçalar", count_chunks),
+    "mmap": ("mmap tarama", count_mmap),
+    "parallel": ("paralel aralıklar", count_parallel)
+}
+
+
+def generate_log(path, size_mb=200, seed=1234):
+    """Yaklaşık size_mb büyüklüğünde test günlüğü yaz; yazılan bayt sayısını döndür"""
+    rng = random.Random(seed)
+    words = ["kullanıcı", "giriş", "dosya", "bağlantı", "zaman aşımı", "istek", "yanıt", "önbellek"]
+    # Satırlar her seferinde üretilmez: farklı bloklar sırayla yazılır
+    blocks = []
+    for _ in range(16):
+        lines = []
+        for i in range(2000):
+            level = rng.choice(LEVELS)
+            lines.append(f"2024-05-{rng.randint(1, 28):02d} {rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:"
+                         f"{rng.randint(0, 59):02d} {level:<7} {rng.choice(words)} #{rng.randint(1, 99999)} "
+                         f"{' '.join(rng.choice(words) for _ in range(rng.randint(2, 8)))}\n")
+        blocks.append("".join(lines).encode("utf-8"))
+    target = size_mb * 1024 * 1024
+    written = 0
+    with open(path, 'wb') as f:
+        while written < target:
+            block = blocks[written // len(blocks[0]) % len(blocks)]
+            f.write(block)
+            written += len(block)
+    return written
+
+
+def measure(fn, *args):
+    """fn'in sonucu, süresi ve Python tarafındaki bellek tepe değeri (KiB)"""
+    start = time.perf_counter()
+    result = fn(*args)
+    elapsed = time.perf_counter() - start
+    # tracemalloc her ayırmayı izlediği için süre ayrı bir çalıştırmada ölçülür
+    tracemalloc.start()
+    try:
+        fn(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, elapsed, peak / 1024
+
+
+def benchmark(path, pattern=DEFAULT_PATTERN, methods=None, workers=None):
+    """Yöntemleri aynı dosya üzerinde karşılaştır"""
+    size = os.path.getsize(path)
+    results = {}
+    for name in methods or METHODS:
+        _, fn = METHODS[name]
+        args = (path, pattern, workers) if name == "parallel" else (path, pattern)
+        counts, elapsed, peak_kib = measure(fn, *args)
+        results[name] = dict(counts, seconds=elapsed, mb_per_s=size / 1024 / 1024 / elapsed if elapsed else 0.0,
+                             peak_kib=peak_kib)
+    return {"path": path, "size_mb": size / 1024 / 1024, "pattern": pattern, "results": results}
+
+
+def print_report(report):
+    print(f"\n{Fore.CYAN}╔══════════ BÜYÜK DOSYA İŞLEME ══════════╗{Style.RESET_ALL}")
+    print(f"║ {report['size_mb']:.0f} MiB, kalıp: {report['pattern']!r}")
+    print(f"║ {'yöntem':<20}{'süre s':>9}{'MiB/s':>9}{'tepe KiB':>12}{'satır':>12}{'eşleşme':>10}")
+    expected = None
+    for name, r in report["results"].items():
+        counts = (r["lines"], r["matches"])
+        expected = expected or counts
+        color = "" if counts == expected else Fore.RED
+        print(f"║ {color}{METHODS[name][0]:<20}{r['seconds']:>9.2f}{r['mb_per_s']:>9.0f}{r['peak_kib']:>12.0f}"
+              f"{r['lines']:>12}{r['matches']:>10}{Style.RESET_ALL}")
+    print(f"╚═════════════════════════════════════════╝")
+    print("Bellek ölçümü Python ayırmalarını kapsar; mmap sayfaları ve paralel süreçler dahil değildir.")
+
+
+def main(path=None, size_mb=200, pattern=DEFAULT_PATTERN, methods=None, workers=None, keep=False, json_path=None):
+    """bigfile komutu; dosya verilmezse test günlüğü üretilir"""
+    generated = path is None
+    if generated:
+        fd, path = tempfile.mkstemp(prefix="ekom_bigfile_", suffix=".log")
+        os.close(fd)
+        print(f"{Fore.CYAN}… {size_mb} MiB test günlüğü yazılıyor: {path}{Style.RESET_ALL}", file=sys.stderr)
+        generate_log(path, size_mb)
+    try:
+        report = benchmark(path, pattern, methods, workers)
+    finally:
+        if generated and not keep:
+            os.remove(path)
+    print_report(report)
+    if json_path:
+        with open(json_path, 'w', encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"{Fore.GREEN}✓ Sonuçlar kaydedildi: {json_path}")
+    counts = {(r["lines"], r["matches"]) for r in report["results"].values()}
+    return 0 if len(counts) <= 1 else 1
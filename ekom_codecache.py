@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Derlenmiş kod parçaları için önbellek.
+
+Ders ve alıştırma kodları sınıfta tekrar tekrar çalıştırılır. Kaynağın
+SHA-256 özeti anahtar olarak kullanılır; derlenmiş kod nesnesi marshal
+ile kodlanmış haliyle (çalıştırma havuzuna zaten bu halde gönderilir)
+önce bellekteki LRU tablosunda, sonra __pycache__ benzeri bir disk
+deposunda aranır. Disk kayıtları Python sürümünün magic numarasıyla
+başlar; sürüm değişince kayıt yok sayılıp yeniden derlenir. Metin
+değişince özet de değiştiği için eski kayıt hiç bulunmaz.
+"""
+
+import os
+import sys
+import marshal
+import hashlib
+import warnings
+import threading
+from collections import OrderedDict
+from importlib.util import MAGIC_NUMBER
+
+from ekom_storage import atomic_write
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(BASE_DIR, "__pycache__", "ekomcode")
+CODE_FILENAME = "<ekomcode>"
+
+
+class CodeCache:
+    """Kaynak özetine göre anahtarlanan derlenmiş kod önbelleği"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_entries=256, filename=CODE_FILENAME):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.filename = filename
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def key(self, source):
+        """Kaynak metnin önbellek anahtarı"""
+        digest = hashlib.sha256(self.filename.encode("utf-8") + b"\0" + source.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.{sys.implementation.cache_tag}.bin")
+
+    def _load_disk(self, key):
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self._path(key), 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        if data[:len(MAGIC_NUMBER)] != MAGIC_NUMBER:
+            return None
+        return data[len(MAGIC_NUMBER):]
+
+    def _store_disk(self, key, bytecode):
+        if self.cache_dir is None:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            atomic_write(self._path(key), MAGIC_NUMBER + bytecode)
+        except OSError:
+            # Önbellek yazılamıyorsa yalnızca bellekte tutulur
+            pass
+
+    def bytecode(self, source):
+        """Kaynağın marshal ile kodlanmış derlenmiş hali (SyntaxError yükseltebilir)"""
+        key = self.key(source)
+        with self._lock:
+            bytecode = self._entries.get(key)
+            if bytecode is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return bytecode
+
+        bytecode = self._load_disk(key)
+        if bytecode is not None:
+            with self._lock:
+                self.disk_hits += 1
+        else:
+            with warnings.catch_warnings():
+                # Uyarılar uygulamanın değil öğrenci kodunun; ekrana basılmaz
+                warnings.simplefilter("ignore")
+                bytecode = marshal.dumps(compile(source, self.filename, "exec"))
+            self._store_disk(key, bytecode)
+            with self._lock:
+                self.misses += 1
+
+        with self._lock:
+            self._entries[key] = bytecode
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return bytecode
+
+    def code(self, source):
+        """Kaynağın derlenmiş kod nesnesi"""
+        return marshal.loads(self.bytecode(source))
+
+    def stats(self):
+        """İsabet/ıska sayaçları"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._entries)
+            }
+
+    def clear(self):
+        """Bellekteki kayıtları boşalt (disk deposu kalır)"""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""EkomCode ders içeriği paketi.
+
+Ders metinleri ve kod örnekleri content/ klasöründe düz dosyalar olarak
+durur. build_bundle() bu paketi tek bir ikili dosyaya derler: başta bir
+ofset tablosu, ardından marshal ile kodlanmış kayıtlar. Çalışma anında
+dosya mmap ile açılır ve yalnızca istenen kayıt çözülür. Ofset tablosu
+her kaydın kaynak dosyasının SHA-1 özetini de tutar; stamp() paket ve
+klasör için aynı özeti verdiğinden, derleme sırasında kurulan arama
+indeksi çalışma anında kayıt çözülmeden doğrulanır.
+"""
+
+import os
+import json
+import hashlib
+import mmap
+import struct
+import marshal
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PACK_DIR = os.path.join(BASE_DIR, "content")
+DEFAULT_BUNDLE = os.path.join(BASE_DIR, "content.bundle")
+
+BUNDLE_MAGIC = b"EKOMPAK1"
+# magic + indeks ofseti + indeks uzunluğu
+_HEADER = struct.Struct("<8sQQ")
+
+# kayıt türü -> (paket içindeki klasör, dosya uzantısı)
+_KINDS = {
+    "theory": ("lessons", ".txt"),
+    "code": ("lessons", ".py"),
+    "example": ("examples", ".py"),
+    "exercise": ("exercises", ".py")
+}
+
+
+class ContentSource:
+    """Ders içeriği kaynağı arayüzü"""
+
+    # Kayıtlar değiştikçe artan sayaçlar (izlenmeyen kaynaklarda hep 0)
+    version = 0
+    catalog_version = 0
+
+    def get(self, key):
+        """Anahtara karşılık gelen kaydı getir (yoksa None)"""
+        raise NotImplementedError
+
+    def keys(self):
+        """Kaynaktaki tüm kayıt anahtarları"""
+        raise NotImplementedError
+
+    def stamp(self, key):
+        """Kayıt değişince değişen kısa değer (önbellek ve indeks güncelliği için)"""
+        return hashlib.sha1(marshal.dumps(self.get(key))).digest()
+
+    def catalog(self):
+        """Modül ve örnek listesi"""
+        return self.get("catalog")
+
+    def theory(self, module_key, lesson_key):
+        """Dersin teori satırları"""
+        return self.get(f"theory/{module_key}/{lesson_key}")
+
+    def code(self, module_key, lesson_key):
+        """Dersin örnek kodu"""
+        return self.get(f"code/{module_key}/{lesson_key}")
+
+    def example(self, example_key):
+        """Kod örnekleri menüsündeki örnek"""
+        return self.get(f"example/{example_key}")
+
+    def exercise(self, exercise_key):
+        """Alıştırma çözümü"""
+        return self.get(f"exercise/{exercise_key}")
+
+
+class ContentPack(ContentSource):
+    """Klasördeki düz dosyalardan doğrudan okuyan kaynak"""
+
+    def __init__(self, root=DEFAULT_PACK_DIR):
+        self.root = root
+
+    def path(self, key):
+        """Kayıt anahtarının dosya yolu"""
+        if key == "catalog":
+            return os.path.join(self.root, "catalog.json")
+        kind, _, name = key.partition("/")
+        folder, ext = _KINDS[kind]
+        return os.path.join(self.root, folder, *name.split("/")) + ext
+
+    def parse(self, key, text):
+        """Dosya metnini kayıt değerine çevir"""
+        if key == "catalog":
+            return json.loads(text)
+        if key.startswith("theory/"):
+            return text.rstrip("\n").split("\n")
+        return text
+
+    def read(self, key):
+        """Kaydın kaynak dosyasının baytları (yoksa None)"""
+        try:
+            with open(self.path(key), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def get(self, key):
+        data = self.read(key)
+        return None if data is None else self.parse(key, data.decode("utf-8"))
+
+    def stamp(self, key):
+        # İçerik özeti: mtime'a bağlı değildir, yeni bir kopyada da derlenmiş paketle aynıdır
+        data = self.read(key)
+        return b"" if data is None else hashlib.sha1(data).digest()
+
+    def keys(self):
+        """Paketteki tüm kayıt anahtarları"""
+        yield "catalog"
+        for kind, (folder, ext) in _KINDS.items():
+            top = os.path.join(self.root, folder)
+            for dirpath, _, filenames in os.walk(top):
+                rel = os.path.relpath(dirpath, top)
+                for filename in sorted(filenames):
+                    if filename.endswith(ext):
+                        name = filename[:-len(ext)]
+                        yield f"{kind}/{name}" if rel == "." else f"{kind}/{rel.replace(os.sep, '/')}/{name}"
+
+
+class ContentBundle(ContentSource):
+    """build_bundle() ile derlenmiş ikili paketten okuyan kaynak"""
+
+    def __init__(self, path=DEFAULT_BUNDLE):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, index_offset, index_length = _HEADER.unpack_from(self._map, 0)
+        if magic != BUNDLE_MAGIC:
+            raise ValueError(f"Geçersiz içerik paketi: {path}")
+        self._index = marshal.loads(self._map[index_offset:index_offset + index_length])
+
+    def get(self, key):
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        offset, length = entry[:2]
+        return marshal.loads(self._map[offset:offset + length])
+
+    def stamp(self, key):
+        # Derleme sırasında hesaplanan özet; kayıt çözülmez (eski paketlerde özet yoktur)
+        entry = self._index.get(key)
+        return entry[2] if entry is not None and len(entry) > 2 else b""
+
+    def keys(self):
+        return iter(self._index)
+
+    def close(self):
+        self._map.close()
+
+
+def build_bundle(pack_dir=DEFAULT_PACK_DIR, out_path=DEFAULT_BUNDLE):
+    """İçerik paketini tek bir indeksli ikili dosyaya derle"""
+    pack = ContentPack(pack_dir)
+    index = {}
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(BUNDLE_MAGIC, 0, 0))
+        for key in pack.keys():
+            source = pack.read(key)
+            data = marshal.dumps(pack.parse(key, source.decode("utf-8")))
+            index[key] = (f.tell(), len(data), hashlib.sha1(source).digest())
+            f.write(data)
+        index_data = marshal.dumps(index)
+        index_offset = f.tell()
+        f.write(index_data)
+        f.seek(0)
+        f.write(_HEADER.pack(BUNDLE_MAGIC, index_offset, len(index_data)))
+    os.replace(tmp_path, out_path)
+    return len(index)
+
+
+def load_content(pack_dir=DEFAULT_PACK_DIR, bundle_path=DEFAULT_BUNDLE):
+    """Derlenmiş paket varsa onu, yoksa içerik klasörünü kullan"""
+    if os.path.exists(bundle_path):
+        return ContentBundle(bundle_path)
+    return ContentPack(pack_dir)
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Büyük veri kümelerini SQLite'a toplu yükleme ve akışla sorgulama.
+
+Satır satır execute() ile eklemede her satır ayrı bir deyim çağrısı,
+kendiliğinden işlem (autocommit) açıksa ayrıca ayrı bir işlem ve diske
+yazma demektir. Burada satırlar bir üreteçten sabit boyutlu gruplar
+halinde executemany() ile, tek bir açık BEGIN/COMMIT içinde yazılır;
+bellekte en fazla bir grup tutulur. Yükleme sırasında WAL günlüğü,
+synchronous=OFF ve geniş sayfa önbelleği kullanılır, dizinler veri
+yüklendikten sonra tek geçişte kurulur. Sorgu sonuçları fetchall() ile
+listeye alınmaz, imleç üzerinde dolaşılarak işlenir. Ölçüm komutu aynı
+satırları bu yollarla yükleyip hızlarını karşılaştırır.
+"""
+
+import os
+import re
+import sys
+import csv
+import json
+import time
+import sqlite3
+import tempfile
+import tracemalloc
+from itertools import islice
+from contextlib import contextmanager
+
+from colorama import Fore, Style
+
+BATCH_SIZE = 10000
+BENCH_ROWS = 1_000_000
+# Satır satır ve işlemsiz yöntem çok yavaş olduğu için yalnızca bu kadar satırla ölçülür
+SLOW_ROWS = 20000
+
+# Uygulamanın deposuyla aynı ayarlar: eşzamanlı okuma için WAL
+PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000
+}
+# Toplu yükleme sırasında: yarıda kesilen yükleme baştan yapılabileceği için fsync beklenmez
+BULK_PRAGMAS = {
+    "synchronous": "OFF",
+    "cache_size": -64 * 1024,
+    "temp_store": "MEMORY"
+}
+
+
+def connect(path, **pragmas):
+    """Bağlantı aç; işlemler BEGIN/COMMIT ile açıkça yönetilir"""
+    conn = sqlite3.connect(path, isolation_level=None)
+    for name, value in dict(PRAGMAS, **pragmas).items():
+        conn.execute(f"PRAGMA {name}={value}")
+    return conn
+
+
+def quote(name):
+    """SQL tanımlayıcısını tırnakla"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+@contextmanager
+def transaction(conn):
+    """BEGIN/COMMIT; hata olursa her şey geri alınır. Açık bir işlem varsa ona katılır"""
+    if conn.in_transaction:
+        yield conn
+        return
+    conn.execute("BEGIN")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def bulk_insert(conn, table, columns, rows, batch_size=BATCH_SIZE):
+    """Üreteçten gelen satırları tek işlemde gruplar halinde ekle; eklenen satır sayısı"""
+    sql = (f"INSERT INTO {quote(table)} ({', '.join(map(quote, columns))}) "
+           f"VALUES ({', '.join('?' * len(columns))})")
+    rows = iter(rows)
+    count = 0
+    with transaction(conn):
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            conn.executemany(sql, batch)
+            count += len(batch)
+    return count
+
+
+def create_indexes(conn, table, columns):
+    """Yüklemeden sonra dizinleri kur"""
+    for column in columns:
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {quote(f'{table}_{column}')} "
+                     f"ON {quote(table)} ({quote(column)})")
+    conn.execute("ANALYZE")
+
+
+def stream(conn, sql, params=(), arraysize=1000):
+    """Sorgu sonuçlarını imleç üzerinden tek tek üret (fetchall yok)"""
+    cursor = conn.execute(sql, params)
+    cursor.arraysize = arraysize
+    try:
+        yield from cursor
+    finally:
+        cursor.close()
+
+
+def _affinity(values):
+    """Örnek değerlere göre sütun türü"""
+    kind = "INTEGER"
+    for value in values:
+        if value == "":
+            continue
+        # Başında sıfır olan değerler (öğrenci no, posta kodu) sayıya çevrilirse sıfırlar kaybolur
+        if re.match(r"[+-]?0\d", value):
+            return "TEXT"
+        if kind == "INTEGER" and not re.fullmatch(r"[+-]?\d+", value):
+            kind = "REAL"
+        if kind == "REAL":
+            try:
+                float(value)
+            except ValueError:
+                return "TEXT"
+    return kind
+
+
+def table_exists(conn, table):
+    """Tablo veritabanında var mı"""
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                        (table,)).fetchone() is not None
+
+
+def load_csv(conn, path, table=None, indexes=(), batch_size=BATCH_SIZE, delimiter=",", replace=False):
+    """CSV dosyasını tabloya akışla yükle; (tablo, yüklenen, atlanan satır sayısı)"""
+    table = table or re.sub(r"\W", "_", os.path.splitext(os.path.basename(path))[0])
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        columns = next(reader, None)
+        if not columns:
+            raise ValueError(f"{path}: dosya boş ya da başlık satırı yok")
+        # Aynı dosyanın ikinci yüklemesi satırları çoğaltmasın
+        if table_exists(conn, table) and not replace:
+            raise ValueError(f"{table} tablosu zaten var (yeniden yüklemek için --replace)")
+        skipped = 0
+
+        def matching(rows):
+            nonlocal skipped
+            for row in rows:
+                if len(row) == len(columns):
+                    yield row
+                elif row:
+                    # Boş satırlar sayılmaz; eksik ya da fazla alanlı satırlar atlanır
+                    skipped += 1
+
+        # Türler ilk satırlardan tahmin edilir; bu satırlar yüklemeye geri eklenir
+        sample = list(matching(islice(reader, 1000)))
+        types = [_affinity(row[i] for row in sample) for i in range(len(columns))]
+        # Silme, oluşturma ve ekleme tek işlemde: yarıda kalan yükleme eski tabloyu geri getirir
+        with transaction(conn):
+            conn.execute(f"DROP TABLE IF EXISTS {quote(table)}")
+            conn.execute(f"CREATE TABLE {quote(table)} "
+                         f"({', '.join(f'{quote(c)} {t}' for c, t in zip(columns, types))})")
+            count = bulk_insert(conn, table, columns,
+                                (row for rows in (sample, matching(reader)) for row in rows), batch_size)
+            create_indexes(conn, table, indexes)
+    return table, count, skipped
+
+
+def load_progress(conn, store, batch_size=BATCH_SIZE):
+    """İlerleme deposundaki tüm öğrencileri ve tamamlanan dersleri tablolara yükle"""
+    # Depo imleçle akıtılır (iter_learners/iter_completions): kohort belleğe alınmaz.
+    # Her dışa aktarım güncel bir kopyadır: önceki tablolar aynı işlemde silinir
+    with transaction(conn):
+        conn.execute("DROP TABLE IF EXISTS learners")
+        conn.execute("DROP TABLE IF EXISTS completions")
+        conn.execute("CREATE TABLE learners (learner_id TEXT, score INTEGER, start_date TEXT, last_completed TEXT)")
+        conn.execute("CREATE TABLE completions (learner_id TEXT, lesson_key TEXT)")
+        counts = {
+            "learners": bulk_insert(conn, "learners", ("learner_id", "score", "start_date", "last_completed"),
+                                    store.iter_learners(), batch_size),
+            "completions": bulk_insert(conn, "completions", ("learner_id", "lesson_key"),
+                                       ((learner_id, lesson_key) for learner_id, lesson_key, _ in
+                                        store.iter_completions()), batch_size)
+        }
+        create_indexes(conn, "completions", ("learner_id", "lesson_key"))
+    return counts
+
+
+BENCH_COLUMNS = ("id", "learner_id", "lesson_key", "score", "completed_at")
+
+
+def generate_rows(count):
+    """Ölçüm için ilerleme kaydı benzeri satırlar üret"""
+    # Rastgele sayı üretimi ekleme süresini gölgelemesin diye değerler aritmetikle dağıtılır
+    learners = [f"ogrenci_{i}" for i in range(count // 20 + 1)]
+    lessons = [f"ders_{i}" for i in range(40)]
+    dates = [f"2024-{month:02d}-{day:02d}" for month in range(1, 13) for day in range(1, 29)]
+    for i in range(count):
+        yield (i, learners[i * 7919 % len(learners)], lessons[i * 31 % 40], i * 37 % 101,
+               dates[i * 13 % len(dates)])
+
+
+def _create_bench_table(conn):
+    conn.execute("DROP TABLE IF EXISTS records")
+    conn.execute("CREATE TABLE records (id INTEGER PRIMARY KEY, learner_id TEXT, lesson_key TEXT, "
+                 "score INTEGER, completed_at TEXT)")
+
+
+BENCH_INDEXES = ("learner_id", "lesson_key")
+
+
+# Her yöntem aynı sonuca ulaşır: satırlar ve iki dizin
+def _insert_autocommit(conn, rows):
+    # Her execute kendi işlemini açıp kapatır
+    for row in rows:
+        conn.execute("INSERT INTO records VALUES (?, ?, ?, ?, ?)", row)
+    create_indexes(conn, "records", BENCH_INDEXES)
+
+
+def _insert_transaction(conn, rows):
+    conn.execute("BEGIN")
+    for row in rows:
+        conn.execute("INSERT INTO records VALUES (?, ?, ?, ?, ?)", row)
+    conn.execute("COMMIT")
+    create_indexes(conn, "records", BENCH_INDEXES)
+
+
+def _insert_indexed(conn, rows):
+    # Dizinler önceden kurulu: her satırda iki B-ağacı da güncellenir
+    create_indexes(conn, "records", BENCH_INDEXES)
+    bulk_insert(conn, "records", BENCH_COLUMNS, rows)
+
+
+def _insert_bulk(conn, rows):
+    for name, value in BULK_PRAGMAS.items():
+        conn.execute(f"PRAGMA {name}={value}")
+    bulk_insert(conn, "records", BENCH_COLUMNS, rows)
+    create_indexes(conn, "records", BENCH_INDEXES)
+
+
+INSERT_METHODS = {
+    "autocommit": ("satır satır, işlemsiz", _insert_autocommit),
+    "transaction": ("satır satır, tek işlem", _insert_transaction),
+    "indexed": ("executemany, dizin önce", _insert_indexed),
+    "bulk": ("executemany, dizin sonra", _insert_bulk)
+}
+
+
+def _average_scores(rows):
+    totals = {}
+    for learner_id, score in rows:
+        total = totals.get(learner_id)
+        totals[learner_id] = (score, 1) if total is None else (total[0] + score, total[1] + 1)
+    return totals
+
+
+def _measure_query(conn, use_stream):
+    """Öğrenci başına ortalama puan; sonuçlar listeye alınarak ya da akışla işlenir"""
+    sql = "SELECT learner_id, score FROM records ORDER BY learner_id"
+
+    def run():
+        _average_scores(stream(conn, sql) if use_stream else conn.execute(sql).fetchall())
+
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    # tracemalloc her ayırmayı izlediği için bellek ayrı bir çalıştırmada ölçülür
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak / 1024
+
+
+def benchmark(rows=BENCH_ROWS, methods=None, directory=None):
+    """Ekleme yöntemlerini ve sorgu okuma biçimlerini karşılaştır"""
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="ekom_db_", dir=directory) as tmp:
+        for name in methods or INSERT_METHODS:
+            _, insert = INSERT_METHODS[name]
+            count = min(rows, SLOW_ROWS) if name == "autocommit" else rows
+            conn = connect(os.path.join(tmp, f"{name}.sqlite"))
+            try:
+                _create_bench_table(conn)
+                start = time.perf_counter()
+                insert(conn, generate_rows(count))
+                elapsed = time.perf_counter() - start
+                stored = conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+            finally:
+                conn.close()
+            results[name] = {"rows": stored, "seconds": elapsed, "rows_per_s": stored / elapsed if elapsed else 0.0}
+
+        queries = {}
+        # Sorgular en çok satırı olan tabloda ölçülür
+        path = os.path.join(tmp, f"{max(results, key=lambda name: results[name]['rows'])}.sqlite")
+        conn = connect(path)
+        try:
+            for name, use_stream in (("fetchall", False), ("stream", True)):
+                elapsed, peak_kib = _measure_query(conn, use_stream)
+                queries[name] = {"seconds": elapsed, "peak_kib": peak_kib}
+        finally:
+            conn.close()
+    return {"rows": rows, "inserts": results, "queries": queries}
+
+
+def print_report(report):
+    print(f"\n{Fore.CYAN}╔══════════ SQLITE TOPLU YÜKLEME ══════════╗{Style.RESET_ALL}")
+    print(f"║ {report['rows']} satır (işlemsiz yöntem en fazla {SLOW_ROWS} satırla ölçülür)")
+    print(f"║ {'yöntem':<28}{'satır':>10}{'süre s':>9}{'satır/s':>11}")
+    for name, r in report["inserts"].items():
+        print(f"║ {INSERT_METHODS[name][0]:<28}{r['rows']:>10}{r['seconds']:>9.2f}{r['rows_per_s']:>11.0f}")
+    if report["queries"]:
+        print(f"║")
+        print(f"║ {'sorgu okuma':<28}{'süre s':>19}{'tepe KiB':>11}")
+        for name, r in report["queries"].items():
+            label = "fetchall() listesi" if name == "fetchall" else "imleç üzerinde akış"
+            print(f"║ {label:<28}{r['seconds']:>19.2f}{r['peak_kib']:>11.0f}")
+    print(f"╚══════════════════════════════════════════╝")
+
+
+def main(csv_path=None, db_path=None, table=None, indexes=(), progress_store=None, rows=BENCH_ROWS,
+         methods=None, json_path=None, replace=False):
+    """db komutu; CSV ya da ilerleme verisi verilmezse hız ölçümü yapılır"""
+    if csv_path is None and progress_store is None:
+        report = benchmark(rows, methods)
+        print_report(report)
+    else:
+        if db_path is None:
+            print(f"{Fore.RED}Hedef veritabanı gerekli: --db yol.sqlite{Style.RESET_ALL}", file=sys.stderr)
+            return 2
+        conn = connect(db_path, **BULK_PRAGMAS)
+        start = time.perf_counter()
+        skipped = 0
+        try:
+            if csv_path is not None:
+                table, count, skipped = load_csv(conn, csv_path, table, indexes, replace=replace)
+                counts = {table: count}
+            else:
+                counts = load_progress(conn, progress_store)
+        except ValueError as e:
+            print(f"{Fore.RED}{e}{Style.RESET_ALL}", file=sys.stderr)
+            return 2
+        finally:
+            conn.close()
+        elapsed = time.perf_counter() - start
+        report = {"db": db_path, "tables": counts, "skipped": skipped, "seconds": elapsed}
+        for name, count in counts.items():
+            print(f"{Fore.GREEN}✓ {name}: {count} satır{Style.RESET_ALL}")
+        if skipped:
+            print(f"{Fore.YELLOW}⚠ Sütun sayısı başlıkla uyuşmayan {skipped} satır atlandı{Style.RESET_ALL}")
+        total = sum(counts.values())
+        print(f"{elapsed:.2f} s ({total / elapsed if elapsed else 0:.0f} satır/s) → {db_path}")
+    if json_path:
+        with open(json_path, 'w', encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"{Fore.GREEN}✓ Sonuçlar kaydedildi: {json_path}")
+    return 0
@@ -0,0 +1,522 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""EkomCode kod çalıştırma motoru.
+
+Ders kodları uygulama sürecinde değil, önceden başlatılmış işçi
+süreçlerinde çalışır. Her işçi sık kullanılan modülleri bir kez içe
+aktarır; her çalıştırma için kendinden bir alt süreç çatallar (fork),
+alt süreç kendi geçici klasöründe CPU, bellek ve süre sınırlarıyla
+çalışır. Böylece kod uygulamanın global değişkenlerini göremez, takılan
+bir örnek de menüyü kilitleyemez.
+
+Çıktı işçi tarafında OutputCapture'dan geçer: bayt/satır bütçesi
+dolana kadar parça parça ekrana akıtılır, sonrasında bir kesilme
+işaretiyle durur. Bellekte yalnızca son çıktıyı tutan sabit boyutlu bir
+halka tampon kalır; sonsuz print döngüsü ne ekranı ne belleği doldurur.
+"""
+
+import os
+import sys
+import time
+import codecs
+import marshal
+import queue
+import select
+import shutil
+import signal
+import tempfile
+import threading
+import traceback
+import subprocess
+import multiprocessing
+from concurrent.futures import Future
+
+from ekom_codecache import CodeCache, CODE_FILENAME
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# İşçilerin önceden yüklediği modüller (kurulu olmayanlar atlanır)
+PRELOAD_MODULES = (
+    "os", "re", "sys", "json", "math", "time", "random", "string",
+    "datetime", "collections", "requests", "bs4", "openpyxl"
+)
+
+DEFAULT_LIMITS = {
+    "cpu_time": 5,      # saniye
+    "wall_time": 10,    # saniye
+    "memory_mb": 256,
+    "file_mb": 16,
+    "output_kb": 64,        # ekrana akıtılan ve saklanan çıktı sınırı
+    "output_lines": 2000
+}
+
+_READ_SIZE = 4096
+# Profil raporunda gösterilen en yoğun fonksiyon sayısı
+PROFILE_TOP = 10
+
+
+class RunResult:
+    """Bir kod çalıştırmasının sonucu"""
+
+    def __init__(self, output="", error=None, returncode=0, timed_out=False, wall_time=0.0,
+                 output_bytes=None, output_lines=None, truncated=False, profile=None):
+        self.output = output
+        self.error = error
+        self.returncode = returncode
+        self.timed_out = timed_out
+        self.wall_time = wall_time
+        # Kodun ürettiği toplam çıktı (output kesilmişse bundan kısadır)
+        self.output_bytes = len(output.encode("utf-8")) if output_bytes is None else output_bytes
+        self.output_lines = output.count("\n") if output_lines is None else output_lines
+        self.truncated = truncated
+        # profile=True ile çalıştırıldıysa: süre, bellek tepe değeri ve yoğun fonksiyonlar
+        self.profile = profile
+
+    @property
+    def ok(self):
+        return self.returncode == 0 and not self.timed_out and self.error is None
+
+    def __repr__(self):
+        return (f"RunResult(returncode={self.returncode}, timed_out={self.timed_out}, "
+                f"error={self.error!r}, wall_time={self.wall_time:.3f})")
+
+
+class RingBuffer:
+    """Son yazılan size baytı tutan sabit boyutlu halka tampon"""
+
+    def __init__(self, size):
+        self._buf = bytearray(size)
+        self._pos = 0
+        self._full = False
+
+    def write(self, data):
+        size = len(self._buf)
+        if len(data) >= size:
+            self._buf[:] = data[-size:]
+            self._pos = 0
+            self._full = True
+            return
+        end = self._pos + len(data)
+        if end <= size:
+            self._buf[self._pos:end] = data
+        else:
+            first = size - self._pos
+            self._buf[self._pos:] = data[:first]
+            self._buf[:end - size] = data[first:]
+        if end >= size:
+            self._full = True
+        self._pos = end % size
+
+    def getvalue(self):
+        if not self._full:
+            return bytes(self._buf[:self._pos])
+        return bytes(self._buf[self._pos:] + self._buf[:self._pos])
+
+
+def _char_boundary(data, index):
+    """index'i UTF-8 karakterinin ortasına düşmeyecek şekilde geri çek"""
+    while 0 < index < len(data) and data[index] & 0xC0 == 0x80:
+        index -= 1
+    return index
+
+
+def _skip_continuation(data, index):
+    """index'i yarım kalmış karakterin devam baytlarının ötesine ilerlet"""
+    while index < len(data) and data[index] & 0xC0 == 0x80:
+        index += 1
+    return index
+
+
+class OutputCapture:
+    """Çıktıyı bütçe dahilinde akıtır, son kısmını halka tamponda saklar"""
+
+    def __init__(self, send_chunk, max_bytes, max_lines):
+        self.send_chunk = send_chunk
+        self.max_bytes = max_bytes
+        self.max_lines = max_lines
+        self.ring = RingBuffer(max_bytes)
+        self.total_bytes = 0
+        self.total_lines = 0
+        self.streamed_bytes = 0
+        self.truncated = False
+
+    def feed(self, data):
+        """Alt süreçten okunan bir parçayı işle"""
+        self.ring.write(data)
+        lines_before = self.total_lines
+        self.total_bytes += len(data)
+        self.total_lines += data.count(b"\n")
+        if self.truncated:
+            return
+
+        cut = min(len(data), self.max_bytes - self.streamed_bytes)
+        reason = f"{self.max_bytes // 1024} KiB"
+        if self.total_lines > self.max_lines:
+            # Bütçedeki son satırın sonunu bul
+            end = -1
+            for _ in range(self.max_lines - lines_before):
+                end = data.index(b"\n", end + 1)
+            if end + 1 < cut:
+                cut, reason = end + 1, f"{self.max_lines} satır"
+        if cut >= len(data):
+            self.streamed_bytes += len(data)
+            self.send_chunk(data)
+            return
+
+        cut = _char_boundary(data, cut)
+        if cut == 0:
+            # Önceki parçada yarım kalan karakter tamamlanır
+            cut = _skip_continuation(data, 0)
+        self.truncated = True
+        self.streamed_bytes += cut
+        self.send_chunk(data[:cut] + f"\n… çıktı {reason} sınırında kesildi …\n".encode("utf-8"))
+
+    def result(self):
+        """Saklanan çıktı metni ve sayaçlar"""
+        tail = self.ring.getvalue()
+        if self.total_bytes > len(tail):
+            # Baştaki kısım halka tampondan taşmış; yalnızca son kısım var
+            start = _skip_continuation(tail, 0)
+            skipped = self.total_bytes - len(tail) + start
+            text = f"… ilk {skipped} bayt atlandı …\n" + tail[start:].decode("utf-8", "replace")
+        else:
+            text = tail.decode("utf-8", "replace")
+        return {
+            "output": text,
+            "output_bytes": self.total_bytes,
+            "output_lines": self.total_lines,
+            "truncated": self.truncated
+        }
+
+
+def _address_space():
+    """Sürecin o anki sanal bellek boyutu (bayt)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * resource.getpagesize()
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _set_limits(limits):
+    """Alt süreçte kaynak sınırlarını uygula"""
+    if resource is None:
+        return
+    cpu = limits["cpu_time"]
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu + 1))
+    # Önceden yüklenen modüllerin kapladığı alan sınıra dahil edilmez
+    memory = _address_space() + limits["memory_mb"] * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+    file_size = limits["file_mb"] * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_FSIZE, (file_size, file_size))
+
+
+def _function_name(key):
+    """pstats anahtarını okunur fonksiyon adına çevir"""
+    filename, line, name = key
+    if filename == "~":
+        return name
+    if filename == CODE_FILENAME:
+        return f"{name} (satır {line})"
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def _profiled_exec(code, namespace, prof_w):
+    """Kodu cProfile ve tracemalloc altında çalıştır, raporu prof_w'ye yaz"""
+    import cProfile
+    import pstats
+    import tracemalloc
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        profiler.runcall(exec, code, namespace)
+    finally:
+        wall_time = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        stats = pstats.Stats(profiler).stats
+        functions = []
+        for key, (_, calls, own_time, total_time, _) in stats.items():
+            name = _function_name(key)
+            # Profil altyapısının kendi kayıtları gösterilmez
+            if name in ("<built-in method builtins.exec>", "<method 'disable' of '_lsprof.Profiler' objects>"):
+                continue
+            functions.append({"name": name, "calls": calls, "own_time": own_time, "total_time": total_time})
+        functions.sort(key=lambda f: f["own_time"], reverse=True)
+        report = {"wall_time": wall_time, "peak_kib": peak / 1024, "functions": functions[:PROFILE_TOP]}
+        os.write(prof_w, marshal.dumps(report))
+
+
+def _child_main(code, workdir, limits, in_fd, out_w, err_w, prof_w=None):
+    """Çatallanan alt süreçte kodu çalıştır (geri dönmez)"""
+    status = 0
+    try:
+        os.setpgid(0, 0)
+        os.dup2(in_fd, 0)
+        os.dup2(out_w, 1)
+        os.dup2(out_w, 2)
+        sys.stdin = open(0, 'r', encoding="utf-8", closefd=False)
+        sys.stdout = open(1, 'w', encoding="utf-8", closefd=False, buffering=1)
+        sys.stderr = sys.stdout
+        os.chdir(workdir)
+        _set_limits(limits)
+        # Havuz önbellekten derlenmiş kodu gönderir; derlenemeyen kaynak burada derlenip hatası raporlanır
+        if isinstance(code, bytes):
+            code = marshal.loads(code)
+        else:
+            code = compile(code, CODE_FILENAME, "exec")
+        namespace = {"__name__": "__main__", "__builtins__": __builtins__}
+        if prof_w is None:
+            exec(code, namespace)
+        else:
+            _profiled_exec(code, namespace, prof_w)
+    except SystemExit as e:
+        status = e.code if isinstance(e.code, int) else 0
+    except BaseException as e:
+        status = 1
+        try:
+            message = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+            os.write(err_w, message.encode("utf-8", "replace"))
+            # Çalıştırma altyapısının çerçeveleri öğrenciye gösterilmez
+            tb = e.__traceback__
+            while tb is not None and tb.tb_frame.f_code.co_filename != CODE_FILENAME:
+                tb = tb.tb_next
+            traceback.print_exception(type(e), e, tb)
+        except BaseException:
+            pass
+    finally:
+        try:
+            sys.stdout.flush()
+        except BaseException:
+            pass
+        os._exit(status)
+
+
+def _run_forked(job, send_chunk):
+    """İşçi içinde bir çalıştırmayı çatallanmış alt süreçte yürüt"""
+    limits = job["limits"]
+    workdir = tempfile.mkdtemp(prefix="ekom_run_")
+    # Girdi isimsiz bir geçici dosyadan verilir; böylece büyük girdiler boruyu tıkayamaz
+    stdin_file = tempfile.TemporaryFile()
+    stdin_file.write(job["stdin"].encode("utf-8"))
+    stdin_file.seek(0)
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    prof_r, prof_w = os.pipe() if job.get("profile") else (None, None)
+    start = time.perf_counter()
+
+    pid = os.fork()
+    if pid == 0:
+        os.close(out_r)
+        os.close(err_r)
+        if prof_r is not None:
+            os.close(prof_r)
+        _child_main(job.get("bytecode") or job["code"], workdir, limits, stdin_file.fileno(),
+                    out_w, err_w, prof_w)
+
+    stdin_file.close()
+    os.close(out_w)
+    os.close(err_w)
+    if prof_w is not None:
+        os.close(prof_w)
+
+    capture = OutputCapture(send_chunk, limits["output_kb"] * 1024, limits["output_lines"])
+    # Hata ve profil boruları da çalışma sırasında boşaltılır: boru tamponunu aşan
+    # bir yazma alt süreci bekletip zaman aşımına düşürmesin
+    collected = {err_r: bytearray()}
+    if prof_r is not None:
+        collected[prof_r] = bytearray()
+    open_fds = [out_r, *collected]
+    timed_out = False
+    deadline = start + limits["wall_time"]
+    while open_fds:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            timed_out = True
+            break
+        ready, _, _ = select.select(open_fds, [], [], remaining)
+        for fd in ready:
+            data = os.read(fd, _READ_SIZE)
+            if not data:
+                open_fds.remove(fd)
+            elif fd == out_r:
+                capture.feed(data)
+            elif fd == err_r:
+                # Hata iletisi tek satır gösterilir; fazlası okunup atılır
+                collected[fd] += data[:_READ_SIZE - len(collected[fd])]
+            else:
+                collected[fd] += data
+
+    if timed_out:
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except OSError:
+            os.kill(pid, signal.SIGKILL)
+    _, status = os.waitpid(pid, 0)
+    wall_time = time.perf_counter() - start
+
+    error = bytes(collected[err_r]).decode("utf-8", "replace") or None
+    profile = None
+    if prof_r is not None and not timed_out and collected[prof_r]:
+        profile = marshal.loads(bytes(collected[prof_r]))
+    for fd in (out_r, *collected):
+        os.close(fd)
+    shutil.rmtree(workdir, ignore_errors=True)
+
+    if os.WIFSIGNALED(status):
+        returncode = -os.WTERMSIG(status)
+        if not timed_out and error is None:
+            if -returncode in (signal.SIGXCPU, signal.SIGKILL):
+                error = "CPU süresi sınırı aşıldı"
+            else:
+                error = f"Süreç {signal.Signals(-returncode).name} sinyaliyle sonlandı"
+    else:
+        returncode = os.WEXITSTATUS(status)
+
+    result = capture.result()
+    result.update(error=error, returncode=returncode, timed_out=timed_out, wall_time=wall_time, profile=profile)
+    return result
+
+
+def _run_subprocess(job, send_chunk):
+    """fork olmayan sistemlerde (Windows) yedek çalıştırma yolu"""
+    workdir = tempfile.mkdtemp(prefix="ekom_run_")
+    start = time.perf_counter()
+    try:
+        # Çalışma klasörü geçici olduğundan ekom_* modülleri uygulama klasöründen bulunur
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+            filter(None, (os.path.dirname(os.path.abspath(__file__)), os.environ.get("PYTHONPATH")))))
+        proc = subprocess.run([sys.executable, "-c", job["code"]], input=job["stdin"],
+                              capture_output=True, text=True, encoding="utf-8", env=env,
+                              cwd=workdir, timeout=job["limits"]["wall_time"])
+        limits = job["limits"]
+        capture = OutputCapture(send_chunk, limits["output_kb"] * 1024, limits["output_lines"])
+        capture.feed((proc.stdout + proc.stderr).encode("utf-8"))
+        error = proc.stderr.strip().splitlines()[-1] if proc.returncode and proc.stderr.strip() else None
+        result = dict(capture.result(), error=error, returncode=proc.returncode, timed_out=False)
+    except subprocess.TimeoutExpired:
+        result = {"output": "", "error": None, "returncode": -1, "timed_out": True}
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    result["wall_time"] = time.perf_counter() - start
+    return result
+
+
+def _worker_main(conn, preload):
+    """Önceden ısıtılmış işçi süreci: işleri sırayla alır ve çalıştırır"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for name in preload:
+        try:
+            __import__(name)
+        except Exception:
+            pass
+
+    run = _run_forked if hasattr(os, "fork") else _run_subprocess
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+        result = run(job, lambda data: conn.send(("chunk", data)))
+        conn.send(("done", result))
+
+
+class ExecutionPool:
+    """Önceden başlatılmış işçi süreçlerinden oluşan çalıştırma havuzu"""
+
+    def __init__(self, workers=None, preload=PRELOAD_MODULES, code_cache=None, **limits):
+        self.size = workers or int(os.environ.get("EKOMCODE_WORKERS", min(4, os.cpu_count() or 1)))
+        self.preload = preload
+        # code_cache=False önbelleği kapatır
+        self.code_cache = CodeCache() if code_cache is None else code_cache or None
+        self.limits = dict(DEFAULT_LIMITS, **limits)
+        methods = multiprocessing.get_all_start_methods()
+        self._ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+        self._jobs = queue.Queue()
+        self._closed = False
+
+        # Önce tüm işçileri çatalla, sonra dağıtıcı iş parçacıklarını başlat
+        workers = [self._spawn() for _ in range(self.size)]
+        self._threads = []
+        for worker in workers:
+            thread = threading.Thread(target=self._dispatch, args=worker, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _spawn(self):
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(target=_worker_main, args=(child_conn, self.preload), daemon=True)
+        process.start()
+        child_conn.close()
+        return parent_conn, process
+
+    def _dispatch(self, conn, process):
+        """Kuyruktaki işleri bir işçiye iletip sonuçları topla"""
+        while True:
+            item = self._jobs.get()
+            if item is None:
+                try:
+                    conn.send(None)
+                except OSError:
+                    pass
+                process.join(timeout=1)
+                return
+
+            future, job, on_output = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            # Parça sınırında bölünen çok baytlı karakterler için
+            decoder = codecs.getincrementaldecoder("utf-8")("replace")
+            try:
+                conn.send(job)
+                while True:
+                    kind, payload = conn.recv()
+                    if kind == "chunk":
+                        if on_output is not None:
+                            text = decoder.decode(payload)
+                            if text:
+                                on_output(text)
+                    else:
+                        future.set_result(RunResult(**payload))
+                        break
+            except (EOFError, OSError) as e:
+                future.set_exception(RuntimeError(f"Çalıştırma işçisi beklenmedik şekilde kapandı: {e}"))
+                process.join(timeout=1)
+                conn, process = self._spawn()
+
+    def submit(self, code, stdin="", on_output=None, profile=False, **limits):
+        """Kodu kuyruğa ekle; sonucu taşıyan bir Future döner"""
+        if self._closed:
+            raise RuntimeError("Çalıştırma havuzu kapatıldı")
+        bytecode = None
+        if self.code_cache is not None:
+            try:
+                bytecode = self.code_cache.bytecode(code)
+            except (SyntaxError, ValueError):
+                # Hata, kaynak alt süreçte derlenirken öğrenciye gösterilir
+                pass
+        job = {"code": code, "bytecode": bytecode, "stdin": stdin, "profile": profile,
+               "limits": dict(self.limits, **limits)}
+        future = Future()
+        self._jobs.put((future, job, on_output))
+        return future
+
+    def run(self, code, stdin="", on_output=None, profile=False, **limits):
+        """Kodu çalıştır ve sonucunu bekle"""
+        return self.submit(code, stdin, on_output, profile, **limits).result()
+
+    def shutdown(self):
+        """İşçileri kapat"""
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join(timeout=2)
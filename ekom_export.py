@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""İlerleme ve istatistiklerin Excel/CSV olarak dışa aktarımı.
+
+Satırlar depodan imleçle akıtılan iki sıralı akıştan (öğrenciler ve
+tamamlanan dersler) üretilir: öğrenci kimliğine göre sıralı oldukları
+için bir öğrencinin tamamlamaları groupby ile yanına eklenir, hiçbir
+aşamada tüm kohort belleğe alınmaz. Ders ve modül özetleri akış
+sırasında ders başına sayaçlarla biriktirilir. Excel dosyası openpyxl'in
+write-only kipiyle yazılır; bu kipte satırlar hücre nesnesi olarak
+tutulmaz, doğrudan sıkıştırılmış sayfa dosyasına akar. CSV yolu
+openpyxl gerektirmez ve en hızlısıdır; her sayfa ayrı bir dosyaya
+yazılır. Excel'in sayfa başına satır sınırı aşılırsa satırlar devam
+sayfalarına bölünür.
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import random
+from itertools import groupby
+
+from colorama import Fore, Style
+
+from ekom_progress import LessonIndex
+
+# Excel sayfası başına satır sınırı (başlık satırı dahil)
+XLSX_MAX_ROWS = 1_048_576
+SHEETS = {
+    "ogrenciler": "Öğrenciler",
+    "dersler": "Dersler",
+    "moduller": "Modüller",
+    "tamamlamalar": "Tamamlamalar"
+}
+
+
+class CSVExport:
+    """Her sayfayı ayrı CSV dosyasına yazan hızlı yol"""
+
+    def __init__(self, path):
+        self.path = path
+        self.paths = []
+        self._files = []
+
+    def _sheet_path(self, key):
+        # İlk sayfa verilen dosyaya, diğerleri dosya_<sayfa>.csv'ye yazılır
+        if not self.paths:
+            return self.path
+        stem, ext = os.path.splitext(self.path)
+        return f"{stem}_{key}{ext or '.csv'}"
+
+    def sheet(self, key, header):
+        """Satır yazma işlevi döndür"""
+        path = self._sheet_path(key)
+        # Excel'in UTF-8'i tanıması için BOM
+        f = open(path, 'w', newline="", encoding="utf-8-sig")
+        self._files.append(f)
+        self.paths.append(path)
+        writer = csv.writer(f)
+        writer.writerow(header)
+        return writer.writerow
+
+    def close(self):
+        for f in self._files:
+            f.close()
+
+
+class XLSXExport:
+    """openpyxl write-only kipinde çok sayfalı çalışma kitabı"""
+
+    def __init__(self, path):
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            raise ImportError("openpyxl kurulu değil (pip install openpyxl); CSV için .csv uzantısı kullanın")
+        self.path = path
+        self.paths = [path]
+        self.workbook = Workbook(write_only=True)
+
+    def _new_sheet(self, title, header):
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
+        from openpyxl.utils import get_column_letter
+        sheet = self.workbook.create_sheet(title[:31])
+        # Sütun genişliği ve dondurulan başlık satırlardan önce ayarlanmalı
+        for column, name in enumerate(header, 1):
+            sheet.column_dimensions[get_column_letter(column)].width = max(12, len(str(name)) + 2)
+        sheet.freeze_panes = "A2"
+        cells = []
+        for name in header:
+            cell = WriteOnlyCell(sheet, value=name)
+            cell.font = Font(bold=True)
+            cells.append(cell)
+        sheet.append(cells)
+        return sheet
+
+    def sheet(self, key, header):
+        title = SHEETS.get(key, key)
+        state = {"sheet": self._new_sheet(title, header), "rows": 1, "part": 1}
+
+        def append(row):
+            if state["rows"] >= XLSX_MAX_ROWS:
+                state["part"] += 1
+                state["sheet"] = self._new_sheet(f"{title} {state['part']}", header)
+                state["rows"] = 1
+            state["sheet"].append(row)
+            state["rows"] += 1
+        return append
+
+    def close(self):
+        self.workbook.save(self.path)
+
+
+def open_export(path):
+    """Uzantıya göre dışa aktarıcı"""
+    return CSVExport(path) if path.lower().endswith(".csv") else XLSXExport(path)
+
+
+def learner_rows(learners, completions, index, modules, counters=None):
+    """Öğrenci başına özet satırları; iki akış da öğrenci kimliğine göre sıralı olmalı"""
+    module_keys = list(modules)
+    module_of = index.module_of
+    groups = groupby(completions, key=lambda row: row[0])
+    pending = next(groups, None)
+    for learner_id, score, start_date, last_completed in learners:
+        # Öğrenci tablosunda olmayan kayıtlar atlanır
+        while pending is not None and pending[0] < learner_id:
+            pending = next(groups, None)
+        per_module = dict.fromkeys(module_keys, 0)
+        completed = 0
+        if pending is not None and pending[0] == learner_id:
+            for _, lesson_key, _ in pending[1]:
+                module_key = module_of.get(lesson_key)
+                if module_key is None:
+                    continue
+                per_module[module_key] += 1
+                completed += 1
+                if counters is not None:
+                    counters[lesson_key] += 1
+            pending = next(groups, None)
+        rate = round(100 * completed / len(index), 1) if len(index) else 0.0
+        yield [learner_id, start_date, last_completed or start_date, score, completed, rate,
+               *per_module.values()]
+
+
+def event_rows(completions, index, modules):
+    """Tamamlanan her ders için bir satır"""
+    module_of = index.module_of
+    for learner_id, lesson_key, completed_at in completions:
+        module_key = module_of.get(lesson_key)
+        if module_key is not None:
+            yield [learner_id, modules[module_key]["title"], modules[module_key]["lessons"][lesson_key],
+                   lesson_key, completed_at]
+
+
+def export(path, learners, completions, modules, events=None):
+    """Akışları dosyaya yaz; events ikinci bir tamamlama akışı (olay sayfası için)"""
+    index = LessonIndex(modules)
+    counters = dict.fromkeys(index.keys, 0)
+    writer = open_export(path)
+    counts = {}
+    try:
+        append = writer.sheet("ogrenciler", ["Öğrenci", "Başlangıç", "Son etkinlik", "Puan", "Tamamlanan",
+                                             "Oran (%)", *(module["title"] for module in modules.values())])
+        learner_total = 0
+        for row in learner_rows(learners, completions, index, modules, counters):
+            append(row)
+            learner_total += 1
+        counts["ogrenciler"] = learner_total
+
+        append = writer.sheet("dersler", ["Modül", "Ders", "Anahtar", "Tamamlayan", "Oran (%)"])
+        for lesson_key in index.keys:
+            module = modules[index.module_of[lesson_key]]
+            rate = round(100 * counters[lesson_key] / learner_total, 1) if learner_total else 0.0
+            append([module["title"], module["lessons"][lesson_key], lesson_key, counters[lesson_key], rate])
+        counts["dersler"] = len(index)
+
+        append = writer.sheet("moduller", ["Modül", "Ders sayısı", "Tamamlama", "Oran (%)"])
+        for module_key, module in modules.items():
+            keys = [key for key in module["lessons"] if index.module_of.get(key) == module_key]
+            done = sum(counters[key] for key in keys)
+            cells = learner_total * len(keys)
+            append([module["title"], len(keys), done, round(100 * done / cells, 1) if cells else 0.0])
+        counts["moduller"] = len(modules)
+
+        if events is not None:
+            append = writer.sheet("tamamlamalar", ["Öğrenci", "Modül", "Ders", "Anahtar", "Tamamlanma"])
+            total = 0
+            for row in event_rows(events, index, modules):
+                append(row)
+                total += 1
+            counts["tamamlamalar"] = total
+    finally:
+        writer.close()
+    return counts, writer.paths
+
+
+def sample_streams(count, modules, seed=1234):
+    """Hız ölçümü için sıralı yapay öğrenci ve tamamlama akışları (bellekte tutulmaz)"""
+    keys = LessonIndex(modules).keys
+    # Kimlikler sıfırla doldurulur: metin sırası sayı sırasıyla aynı olsun
+    width = len(str(count))
+
+    def learner(i):
+        rng = random.Random(seed * 1_000_003 + i)
+        done = rng.sample(keys, rng.randint(0, len(keys)))
+        day = rng.randint(1, 28)
+        return f"ogrenci{i:0{width}d}", done, f"2024-01-{day:02d} 10:00:00"
+
+    def learners():
+        for i in range(count):
+            learner_id, done, start = learner(i)
+            yield learner_id, 10 * len(done), start, None
+
+    def completions():
+        for i in range(count):
+            learner_id, done, start = learner(i)
+            for lesson_key in done:
+                yield learner_id, lesson_key, start
+    return learners, completions
+
+
+def _peak_rss_kib():
+    """Sürecin en yüksek bellek kullanımı (KiB); ölçülemiyorsa None"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS bayt, Linux KiB döndürür
+    return peak / 1024 if sys.platform == "darwin" else peak
+
+
+def main(store, modules, path, events=False, sample=None, json_path=None):
+    """export komutu; sample verilirse depo yerine yapay kohort yazılır"""
+    if sample:
+        learners, completions = sample_streams(sample, modules)
+    else:
+        learners, completions = store.iter_learners, store.iter_completions
+    start = time.perf_counter()
+    try:
+        counts, paths = export(path, learners(), completions(), modules, completions() if events else None)
+    except ImportError as e:
+        print(f"{Fore.RED}{e}{Style.RESET_ALL}", file=sys.stderr)
+        return 2
+    elapsed = time.perf_counter() - start
+    rows = sum(counts.values())
+    print(f"\n{Fore.CYAN}╔══════════ DIŞA AKTARIM ══════════╗{Style.RESET_ALL}")
+    for key, count in counts.items():
+        print(f"║ {SHEETS[key]:<16} {count:>10} satır")
+    for written in paths:
+        print(f"║ {Fore.GREEN}✓ {written}{Style.RESET_ALL} ({os.path.getsize(written) / 1024:.0f} KiB)")
+    print(f"╚══════════════════════════════════╝")
+    peak_kib = _peak_rss_kib()
+    memory = f", süreç tepe belleği {peak_kib / 1024:.0f} MiB" if peak_kib else ""
+    print(f"{elapsed:.2f} s, {rows / elapsed if elapsed else 0:.0f} satır/s{memory}")
+    if json_path:
+        with open(json_path, 'w', encoding="utf-8") as f:
+            json.dump({"paths": paths, "rows": counts, "seconds": elapsed, "peak_rss_kib": peak_kib},
+                      f, ensure_ascii=False, indent=2)
+        print(f"{Fore.GREEN}✓ Sonuçlar kaydedildi: {json_path}")
+    return 0
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Alıştırma çözümlerini otomatik değerlendirme.
+
+Her alıştırmanın sınamaları catalog.json içindeki "grading" bölümünde
+tanımlıdır: verilecek girdi, çıktıda sırayla geçmesi gereken metinler,
+düzenli ifadeler ve şifre uzunluğu/karakter sınıfı gibi özellik
+denetimleri. Her sınama çalıştırma havuzunda, kendi alt sürecinde ve
+süre sınırlarıyla yürütülür. Bir sınıfın tüm teslimlerinin tüm
+sınamaları havuza birlikte gönderildiği için toplu değerlendirme işçi
+sayısı kadar paralel ilerler; sonuçta sınama başına süreler ve
+alıştırma puanı raporlanır.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import string
+
+from colorama import Fore, Style
+
+from ekom_executor import ExecutionPool
+
+DEFAULT_POINTS = 20
+
+# Özellik denetimlerindeki karakter sınıfları
+CHAR_CLASSES = {
+    "lower": ("küçük harf", str.islower),
+    "upper": ("büyük harf", str.isupper),
+    "digit": ("rakam", str.isdigit),
+    "punct": ("noktalama", lambda c: c in string.punctuation)
+}
+
+
+class TestResult:
+    """Tek bir sınamanın sonucu"""
+
+    def __init__(self, name, passed, wall_time=0.0, detail=""):
+        self.name = name
+        self.passed = passed
+        self.wall_time = wall_time
+        self.detail = detail
+
+
+class Grade:
+    """Bir teslimin tüm sınama sonuçları ve puanı"""
+
+    def __init__(self, learner_id, exercise_key, tests, points):
+        self.learner_id = learner_id
+        self.exercise_key = exercise_key
+        self.tests = tests
+        self.max_points = points
+
+    @property
+    def passed(self):
+        return sum(1 for test in self.tests if test.passed)
+
+    @property
+    def points(self):
+        """Geçilen sınamalar oranında puan"""
+        return self.max_points * self.passed // len(self.tests) if self.tests else 0
+
+    @property
+    def wall_time(self):
+        return sum(test.wall_time for test in self.tests)
+
+    def as_dict(self):
+        return {
+            "learner": self.learner_id,
+            "exercise": self.exercise_key,
+            "points": self.points,
+            "max_points": self.max_points,
+            "passed": self.passed,
+            "tests": [{"name": test.name, "passed": test.passed, "wall_ms": test.wall_time * 1000,
+                       "detail": test.detail} for test in self.tests]
+        }
+
+
+def load_spec(content, exercise_key):
+    """Alıştırmanın sınama tanımı (yoksa None)"""
+    return content.catalog().get("grading", {}).get(exercise_key)
+
+
+def _check_contains(output, expected):
+    """Metinler çıktıda verilen sırayla geçiyor mu"""
+    position = 0
+    for text in expected:
+        found = output.find(text, position)
+        if found < 0:
+            return f"çıktıda bulunamadı: {text!r}"
+        position = found + len(text)
+    return None
+
+
+def _check_property(output, check):
+    """Düzenli ifadeyle yakalanan her değer istenen özellikleri taşıyor mu"""
+    values = re.findall(check["pattern"], output, re.MULTILINE)
+    if len(values) < check.get("count", 1):
+        return f"en az {check.get('count', 1)} değer bekleniyordu, {len(values)} bulundu"
+    for value in values:
+        if "length" in check and len(value) != check["length"]:
+            return f"{value!r}: uzunluk {len(value)}, beklenen {check['length']}"
+        for class_name in check.get("classes", ()):
+            label, test = CHAR_CLASSES[class_name]
+            if not any(test(c) for c in value):
+                return f"{value!r}: {label} içermiyor"
+    if check.get("distinct") and len(set(values)) < len(values):
+        return "aynı değer birden fazla üretildi"
+    return None
+
+
+def check_output(output, test):
+    """Çıktıyı sınamanın beklentilerine göre denetle; hata açıklaması ya da None"""
+    if "stdout" in test and output.rstrip() != test["stdout"].rstrip():
+        return "çıktı beklenenle aynı değil"
+    problem = _check_contains(output, test.get("contains", ()))
+    if problem:
+        return problem
+    for pattern in test.get("regex", ()):
+        if not re.search(pattern, output, re.MULTILINE):
+            return f"çıktı kalıba uymuyor: {pattern}"
+    for check in test.get("checks", ()):
+        problem = _check_property(output, check)
+        if problem:
+            return problem
+    return None
+
+
+class Grader:
+    """Teslimleri çalıştırma havuzunda sınayan değerlendirici"""
+
+    def __init__(self, content, pool=None, workers=None, timeout=5):
+        self.content = content
+        self.timeout = timeout
+        self._own_pool = pool is None
+        self.pool = pool if pool is not None else ExecutionPool(
+            workers=workers or os.cpu_count(), wall_time=timeout, cpu_time=timeout)
+
+    def _submit(self, code, test):
+        future = self.pool.submit(code, stdin=test.get("stdin", ""),
+                                  wall_time=self.timeout, cpu_time=self.timeout)
+        return test, future
+
+    def _result(self, test, future):
+        run = future.result()
+        name = test.get("name", "sınama")
+        if run.timed_out:
+            return TestResult(name, False, run.wall_time, f"{self.timeout} saniyede bitmedi")
+        if not run.ok:
+            return TestResult(name, False, run.wall_time, run.error or f"çıkış kodu {run.returncode}")
+        problem = check_output(run.output, test)
+        return TestResult(name, problem is None, run.wall_time, problem or "")
+
+    def grade_batch(self, submissions):
+        """[(öğrenci, alıştırma, kod)] teslimlerini paralel sına; Grade listesi döner"""
+        pending = []
+        for learner_id, exercise_key, code in submissions:
+            spec = load_spec(self.content, exercise_key)
+            if spec is None:
+                raise KeyError(f"Sınaması tanımlı olmayan alıştırma: {exercise_key}")
+            # Rastgelelik içeren sınamalar birkaç kez çalıştırılır
+            futures = [self._submit(code, test) for test in spec["tests"]
+                       for _ in range(test.get("repeat", 1))]
+            pending.append((learner_id, exercise_key, spec.get("points", DEFAULT_POINTS), futures))
+        return [Grade(learner_id, exercise_key, [self._result(test, future) for test, future in futures], points)
+                for learner_id, exercise_key, points, futures in pending]
+
+    def grade(self, code, exercise_key, learner_id=None):
+        """Tek bir çözümü sına"""
+        return self.grade_batch([(learner_id, exercise_key, code)])[0]
+
+    def close(self):
+        if self._own_pool:
+            self.pool.shutdown()
+
+
+def credit(user_data, grade):
+    """Alıştırmanın en iyi puanını kaydet; yalnızca artış user_data["score"]'a eklenir"""
+    from datetime import datetime
+    exercises = user_data.setdefault("exercises", {})
+    previous = exercises.get(grade.exercise_key, {}).get("best", 0)
+    gained = max(0, grade.points - previous)
+    if gained:
+        user_data["score"] += gained
+        exercises[grade.exercise_key] = {"best": grade.points,
+                                         "date": datetime.now().strftime("%Y-%m-%d %H:%M")}
+    return gained
+
+
+def grade_lines(grade):
+    """Sınama sonuçlarının renklendirilmiş satırları"""
+    yield f"\n{Fore.CYAN}╔══════════ DEĞERLENDİRME ══════════╗{Style.RESET_ALL}"
+    for test in grade.tests:
+        mark = f"{Fore.GREEN}✓" if test.passed else f"{Fore.RED}✗"
+        detail = f" ({test.detail})" if test.detail else ""
+        yield f"║ {mark} {test.name}{Style.RESET_ALL}  {test.wall_time * 1000:.1f} ms{detail}"
+    color = Fore.GREEN if grade.passed == len(grade.tests) else Fore.YELLOW
+    yield f"║"
+    yield (f"║ {color}{grade.passed}/{len(grade.tests)} sınama geçti, "
+           f"{grade.points}/{grade.max_points} puan{Style.RESET_ALL}")
+    yield f"╚═══════════════════════════════════╝"
+
+
+def collect_submissions(exercise_key, paths):
+    """Dosya ve klasörlerden teslimler; öğrenci kimliği dosya adından alınır.
+
+    (teslimler, okunamayanlar) döner; okunamayan her dosya (öğrenci, açıklama)
+    olarak bildirilir ve toplu değerlendirmeyi durdurmaz.
+    """
+    submissions, unreadable = [], []
+    for path in paths:
+        try:
+            files = ([os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith(".py")]
+                     if os.path.isdir(path) else [path])
+        except OSError as e:
+            unreadable.append((os.path.basename(path.rstrip(os.sep)), f"klasör okunamadı: {e.strerror}"))
+            continue
+        for file_path in files:
+            learner_id = os.path.splitext(os.path.basename(file_path))[0]
+            try:
+                with open(file_path, encoding="utf-8") as f:
+                    submissions.append((learner_id, exercise_key, f.read()))
+            except UnicodeDecodeError:
+                unreadable.append((learner_id, "dosya UTF-8 değil; UTF-8 olarak kaydedip yeniden gönderin"))
+            except OSError as e:
+                unreadable.append((learner_id, f"dosya okunamadı: {e.strerror}"))
+    return submissions, unreadable
+
+
+def unreadable_grade(content, exercise_key, learner_id, problem):
+    """Okunamayan teslim için sıfır puanlı sonuç"""
+    points = load_spec(content, exercise_key).get("points", DEFAULT_POINTS)
+    return Grade(learner_id, exercise_key, [TestResult("teslim", False, 0.0, problem)], points)
+
+
+def main(content, exercise_key, paths=(), store=None, workers=None, timeout=5, verbose=False, json_path=None):
+    """grade komutu; dosya verilmezse örnek çözüm sınanır"""
+    if load_spec(content, exercise_key) is None:
+        print(f"{Fore.RED}Sınaması tanımlı olmayan alıştırma: {exercise_key}{Style.RESET_ALL}", file=sys.stderr)
+        return 2
+    unreadable = []
+    if paths:
+        submissions, unreadable = collect_submissions(exercise_key, paths)
+    else:
+        submissions = [("örnek_çözüm", exercise_key, content.exercise(exercise_key))]
+
+    start = time.perf_counter()
+    grader = Grader(content, workers=workers, timeout=timeout)
+    try:
+        grades = grader.grade_batch(submissions)
+    finally:
+        grader.close()
+    grades += [unreadable_grade(content, exercise_key, learner_id, problem) for learner_id, problem in unreadable]
+    duration = time.perf_counter() - start
+
+    print(f"\n{Fore.CYAN}╔══════════ DEĞERLENDİRME: {exercise_key} ══════════╗{Style.RESET_ALL}")
+    for grade in grades:
+        color = Fore.GREEN if grade.passed == len(grade.tests) else Fore.YELLOW if grade.passed else Fore.RED
+        gained = ""
+        if store is not None:
+            user_data = store.load(grade.learner_id)
+            gained = f"  +{credit(user_data, grade)} puan"
+            store.save(grade.learner_id, user_data)
+        print(f"║ {color}{grade.learner_id[:24]:<24} {grade.passed:>3}/{len(grade.tests):<3} "
+              f"{grade.points:>4}/{grade.max_points} puan{Style.RESET_ALL}  "
+              f"{grade.wall_time * 1000:8.1f} ms{gained}")
+        if verbose:
+            for test in grade.tests:
+                mark = f"{Fore.GREEN}✓" if test.passed else f"{Fore.RED}✗"
+                detail = f" ({test.detail})" if test.detail else ""
+                print(f"║     {mark} {test.name}{Style.RESET_ALL}  {test.wall_time * 1000:.1f} ms{detail}")
+    print(f"╚══════════════════════════════════════════╝")
+    for learner_id, problem in unreadable:
+        print(f"{Fore.RED}✗ {learner_id}: {problem}{Style.RESET_ALL}", file=sys.stderr)
+    tests = sum(len(grade.tests) for grade in grades)
+    print(f"{len(grades)} teslim, {tests} sınama, {duration:.2f} s ({tests / duration:.0f} sınama/s)")
+
+    if json_path:
+        with open(json_path, 'w', encoding="utf-8") as f:
+            json.dump({"duration_s": duration, "grades": [grade.as_dict() for grade in grades]},
+                      f, ensure_ascii=False, indent=2)
+        print(f"{Fore.GREEN}✓ Sonuçlar kaydedildi: {json_path}")
+    return 0 if all(grade.passed == len(grade.tests) for grade in grades) else 1
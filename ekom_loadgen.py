@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Başsız oturumlarla yük simülasyonu.
+
+Kayıtlı (ekomcode --record ile) ya da rastgele üretilen gezinme
+betikleri binlerce Session üzerinde, birden çok süreçte paralel olarak
+oynatılır. Bir süreçteki oturumların hepsi aynı anda açık tutulur ve
+sırayla birer adım ilerletilir; böylece sunucudaki gibi çok sayıda
+eşzamanlı öğrencinin bellek ve depo yükü de ölçülmüş olur. Her geçiş
+(görünüm -> görünüm) için gecikme kaydedilir; sonuçta toplam geçiş hızı
+ve geçiş başına gecikme yüzdelikleri raporlanır.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import resource
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from colorama import Fore, Style
+
+from ekom_bench import summarize, SEED
+from ekom_content import ContentPack, load_content
+from ekom_executor import RunResult
+from ekom_storage import SQLiteProgressStore
+from ekomcode import build_catalog
+from ekom_session import Session
+
+# Kod çalıştırılmadığında oturuma verilen sonuç
+SKIPPED_RUN = RunResult()
+
+
+def load_script(path):
+    """Kayıtlı betik: her satır bir girdi (boş satır = Enter)"""
+    with open(path, encoding="utf-8") as f:
+        return f.read().splitlines()
+
+
+def _next_input(session, script, position, rng):
+    if script is None:
+        return rng.choice(session.choices())
+    return script[position] if position < len(script) else None
+
+
+def _simulate_shard(shard, count, scripts, steps, seed, pack_dir, execute):
+    """Bir süreçteki oturumları çalıştır; geçiş gecikmelerini döndür"""
+    content = ContentPack(pack_dir) if pack_dir else load_content()
+    catalog = build_catalog(content)
+    data_dir = tempfile.mkdtemp(prefix="ekom_loadgen_")
+    store = SQLiteProgressStore(data_dir)
+    executor = None
+    if execute:
+        from ekom_executor import ExecutionPool
+        executor = ExecutionPool(workers=1)
+    rng = random.Random(seed + shard)
+    transitions = {}
+    sent = 0
+
+    def record(name, elapsed):
+        transitions.setdefault(name, []).append(elapsed)
+
+    try:
+        sessions = []
+        for i in range(count):
+            session = Session(store, content, catalog, executor=executor, learner_id=f"sim{shard}_{i}")
+            script = scripts[(shard * count + i) % len(scripts)] if scripts else None
+            start = time.perf_counter()
+            sent += len(session.start())
+            record("başlangıç→main", time.perf_counter() - start)
+            sessions.append([session, script, 0])
+
+        step = 0
+        while sessions and step < steps:
+            active = []
+            for entry in sessions:
+                session, script, position = entry
+                line = _next_input(session, script, position, rng)
+                if line is None:
+                    session.close()
+                    continue
+                before = session.view
+                start = time.perf_counter()
+                text = session.handle(line)
+                if session.pending_run is not None:
+                    text += session.run_started()
+                    if executor is not None:
+                        result = executor.run(session.pending_run, profile=session.pending_profile)
+                    else:
+                        result = SKIPPED_RUN
+                    text += session.finish_run(result)
+                elapsed = time.perf_counter() - start
+                if text is None or session.closed:
+                    record(f"{before}→çıkış", elapsed)
+                    continue
+                record(f"{before}→{session.view}", elapsed)
+                sent += len(text)
+                entry[2] = position + 1
+                active.append(entry)
+            sessions = active
+            step += 1
+        for session, _, _ in sessions:
+            session.close()
+        store.flush()
+    finally:
+        store.close()
+        if executor is not None:
+            executor.shutdown()
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    return {
+        "transitions": transitions,
+        "sent_chars": sent,
+        "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    }
+
+
+def simulate(scripts=None, sessions=1000, workers=None, steps=50, seed=SEED, pack_dir=None, execute=False):
+    """Oturumları süreçlere bölüp paralel çalıştır ve sonuçları birleştir"""
+    workers = max(1, min(workers or os.cpu_count() or 1, sessions))
+    per_worker = [sessions // workers + (1 if i < sessions % workers else 0) for i in range(workers)]
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_simulate_shard, shard, count, scripts, steps, seed, pack_dir, execute)
+                   for shard, count in enumerate(per_worker)]
+        shards = [future.result() for future in futures]
+    duration = time.perf_counter() - start
+
+    merged = {}
+    for shard in shards:
+        for name, samples in shard["transitions"].items():
+            merged.setdefault(name, []).extend(samples)
+    total = sum(len(samples) for samples in merged.values())
+    return {
+        "meta": {
+            "sessions": sessions,
+            "workers": workers,
+            "steps": steps,
+            "scripts": len(scripts) if scripts else 0,
+            "execute": execute,
+            "seed": seed
+        },
+        "duration_s": duration,
+        "transitions_total": total,
+        "transitions_per_s": total / duration if duration > 0 else 0.0,
+        "sent_chars": sum(shard["sent_chars"] for shard in shards),
+        "max_rss_kib": max(shard["max_rss_kib"] for shard in shards),
+        "transitions": {name: summarize(samples) for name, samples in sorted(merged.items())}
+    }
+
+
+def print_report(report):
+    meta = report["meta"]
+    source = f"{meta['scripts']} kayıtlı betik" if meta["scripts"] else "rastgele gezinme"
+    print(f"\n{Fore.CYAN}╔══════════ YÜK SİMÜLASYONU ══════════╗{Style.RESET_ALL}")
+    print(f"║ {meta['sessions']} oturum, {meta['workers']} süreç, {source}, en fazla {meta['steps']} adım")
+    print(f"║ {'geçiş':<32}{'n':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, r in report["transitions"].items():
+        print(f"║ {name:<32}{r['n']:>8}{r['p50_ms']:>10.3f}{r['p95_ms']:>10.3f}"
+              f"{r['p99_ms']:>10.3f}{r['max_ms']:>10.3f}")
+    print(f"║")
+    print(f"║ {Fore.GREEN}Toplam: {report['transitions_total']} geçiş, {report['duration_s']:.2f} s, "
+          f"{report['transitions_per_s']:.0f} geçiş/s{Style.RESET_ALL}")
+    print(f"║ Gönderilen: {report['sent_chars'] / 1024:.0f} KiB metin, "
+          f"süreç başına tepe bellek: {report['max_rss_kib'] / 1024:.1f} MiB")
+    print(f"╚══════════════════════════════════════╝")
+
+
+def main(script_paths=(), sessions=1000, workers=None, steps=50, seed=SEED, pack_dir=None,
+         execute=False, json_path=None):
+    """loadgen komutu; çıkış kodunu döndürür"""
+    scripts = [load_script(path) for path in script_paths]
+    print(f"{Fore.CYAN}… {sessions} oturum simüle ediliyor{Style.RESET_ALL}", file=sys.stderr)
+    report = simulate(scripts, sessions, workers, steps, seed, pack_dir, execute)
+    print_report(report)
+    if json_path:
+        with open(json_path, 'w', encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"{Fore.GREEN}✓ Sonuçlar kaydedildi: {json_path}")
+    return 0
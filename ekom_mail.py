@@ -0,0 +1,554 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Toplu e-posta: ilerleme raporları, kalıcı SMTP bağlantı havuzu ve yerel SMTP sunucusu.
+
+Haftalık raporlar depodaki tüm öğrenciler için tek sorguyla okunan
+kohort verisinden üretilir ve bir üreteçle havuza verilir; bellekte
+yalnızca kuyruktaki birkaç ileti bulunur. SMTPPool sabit sayıda iş
+parçacığı çalıştırır, her biri kendi SMTP bağlantısını açık tutar ve
+bağlantı başına en fazla belirli sayıda ileti gönderdikten sonra
+yeniler. Sunucu PIPELINING desteğini bildirirse MAIL FROM, RCPT TO ve
+DATA komutları tek yazımda gönderilip yanıtları birlikte okunur
+(RFC 2920); böylece ileti başına gidiş-dönüş sayısı dörtten ikiye iner.
+smtplib bunu kendisi yapmadığı için gönderim smtplib'in send() ve
+getreply() yöntemleriyle yapılır. Geçici (4xx) hatalar ve kopan
+bağlantılar artan beklemeyle yeniden denenir, tüm iş parçacıkları
+ortak bir hız sınırına uyar.
+
+SMTPSink aynı süreçte, kendi iş parçacığındaki asyncio döngüsünde
+çalışan küçük bir SMTP sunucusudur: iletileri yalnızca sayar, istenirse
+her okuma turuna gecikme ve geçici hata ekler. Hız ölçümü ve ders
+örnekleri internet ya da gerçek bir posta sunucusu olmadan çalışır.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import queue
+import random
+import asyncio
+import smtplib
+import threading
+from email.message import EmailMessage
+from email.policy import SMTP as SMTP_POLICY
+from email.utils import parseaddr
+
+from colorama import Fore, Style
+
+from ekom_progress import LessonIndex
+
+DEFAULT_SENDER = "ekomcode@ornek.com"
+# Yalnızca hız ölçümü ve kuru çalıştırma önizlemesi içindir; gerçek gönderimde --domain gerekir
+DEFAULT_DOMAIN = "ornek.com"
+MAX_PER_CONNECTION = 100
+_TEMPORARY = (421, 450, 451, 452)
+_RCPT_ADDRESS = re.compile(rb"<([^>]*)>")
+
+
+# ---------------------------------------------------------------- raporlar
+
+def learner_address(learner_id, domain=None):
+    """Öğrencinin e-posta adresi: kimlik zaten bir adresse kendisi, yoksa <kimlik>@<alan adı> ya da None"""
+    if "@" in learner_id:
+        return learner_id
+    return f"{learner_id}@{domain}" if domain else None
+
+
+def render_report(learner_id, score, completed, modules, sender=DEFAULT_SENDER, domain=DEFAULT_DOMAIN,
+                  index=None):
+    """Bir öğrencinin haftalık ilerleme raporu iletisi"""
+    index = index or LessonIndex(modules)
+    done = set(completed)
+    lines = [f"Merhaba {learner_id},", "", f"Bu haftaki puanınız: {score}",
+             f"Tamamlanan ders: {len(done)}/{len(index)}", ""]
+    next_lesson = None
+    for module_key, module in modules.items():
+        lessons = list(module["lessons"])
+        finished = sum(1 for lesson_key in lessons if lesson_key in done)
+        bar = "█" * (10 * finished // len(lessons)) if lessons else ""
+        lines.append(f"  {module['title']:<30} {bar:<10} {finished}/{len(lessons)}")
+        if next_lesson is None:
+            next_lesson = next((module["lessons"][key] for key in lessons if key not in done), None)
+    lines.append("")
+    lines.append(f"Sıradaki ders: {next_lesson}" if next_lesson else "Tüm dersleri tamamladınız, tebrikler!")
+    lines += ["", "İyi çalışmalar,", "EkomCode"]
+
+    message = EmailMessage()
+    message["From"] = sender
+    message["To"] = learner_address(learner_id, domain)
+    message["Subject"] = f"Haftalık ilerleme raporu: {len(done)}/{len(index)} ders"
+    message.set_content("\n".join(lines))
+    return message
+
+
+def reports(learners, completions, modules, sender=DEFAULT_SENDER, domain=DEFAULT_DOMAIN):
+    """Kohort verisinden (ProgressStore.cohort) rapor iletileri üret"""
+    index = LessonIndex(modules)
+    by_learner = {}
+    for learner_id, lesson_key in completions:
+        by_learner.setdefault(learner_id, []).append(lesson_key)
+    for learner_id, score, _, _ in learners:
+        yield render_report(learner_id, score, by_learner.get(learner_id, ()), modules, sender, domain, index)
+
+
+def sample_cohort(count, modules, seed=1234):
+    """Hız ölçümü için yapay kohort verisi"""
+    rng = random.Random(seed)
+    keys = LessonIndex(modules).keys
+    learners, completions = [], []
+    for i in range(count):
+        learner_id = f"ogrenci{i}"
+        done = rng.sample(keys, rng.randint(0, len(keys)))
+        learners.append((learner_id, 10 * len(done), "2024-01-01 00:00:00", None))
+        completions.extend((learner_id, key) for key in done)
+    return learners, completions
+
+
+# ---------------------------------------------------------------- gönderim
+
+def _message_bytes(message, utf8=False):
+    """İletinin CRLF satır sonlu hali (nokta kaçışı gönderen tarafta yapılır)"""
+    data = message.as_bytes(policy=SMTP_POLICY.clone(utf8=True) if utf8 else SMTP_POLICY)
+    return data if data.endswith(b"\r\n") else data + b"\r\n"
+
+
+def _recipients(message):
+    addresses = [parseaddr(value)[1] for field in ("To", "Cc", "Bcc") for value in message.get_all(field, ())]
+    return [address for address in addresses if address]
+
+
+def pipelined_send(smtp, sender, recipients, data):
+    """MAIL/RCPT/DATA komutlarını tek yazımda gönder; reddedilen alıcıları döndür"""
+    commands = [f"MAIL FROM:<{sender}>"] + [f"RCPT TO:<{address}>" for address in recipients] + ["DATA"]
+    smtp.send("".join(command + "\r\n" for command in commands))
+    replies = [smtp.getreply() for _ in commands]
+    (mail_code, mail_text), rcpt_replies, (data_code, data_text) = replies[0], replies[1:-1], replies[-1]
+    refused = {address: reply for address, reply in zip(recipients, rcpt_replies) if reply[0] not in (250, 251)}
+    if data_code == 354 and (mail_code != 250 or len(refused) == len(recipients)):
+        # Sunucu veri bekliyor ama ileti geçersiz: boş veriyle bitirip durumu sıfırla
+        smtp.send(".\r\n")
+        smtp.getreply()
+    if mail_code != 250:
+        smtp.rset()
+        raise smtplib.SMTPSenderRefused(mail_code, mail_text, sender)
+    if len(refused) == len(recipients):
+        smtp.rset()
+        raise smtplib.SMTPRecipientsRefused(refused)
+    if data_code != 354:
+        smtp.rset()
+        raise smtplib.SMTPDataError(data_code, data_text)
+    # smtplib.sendmail gibi: nokta ile başlayan satırlar çift noktayla kaçışlanır
+    smtp.send(re.sub(rb"(?m)^\.", b"..", data) + b".\r\n")
+    code, text = smtp.getreply()
+    if code != 250:
+        raise smtplib.SMTPDataError(code, text)
+    return refused
+
+
+def _temporary(error):
+    """Yeniden denenebilecek hata mı"""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code in _TEMPORARY for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code in _TEMPORARY
+    # SMTPException da bir OSError'dır; kopan bağlantı ve ağ hataları yeniden denenir
+    return isinstance(error, smtplib.SMTPServerDisconnected) or not isinstance(error, smtplib.SMTPException)
+
+
+def _broken(error):
+    """Hatadan sonra bağlantı yeniden açılmalı mı"""
+    return (isinstance(error, smtplib.SMTPServerDisconnected) or not isinstance(error, smtplib.SMTPException)
+            or getattr(error, "smtp_code", None) == 421)
+
+
+class RateLimiter:
+    """Tüm iş parçacıklarının paylaştığı saniyede en fazla rate işlem sınırı"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next, now)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class SMTPPool:
+    """Kalıcı bağlantılarla paralel gönderim yapan sınırlı SMTP havuzu"""
+
+    def __init__(self, host="127.0.0.1", port=25, size=4, retries=3, rate=None, timeout=10, backoff=0.2,
+                 starttls=False, user=None, password=None, max_per_connection=MAX_PER_CONNECTION,
+                 pipelining=True):
+        self.host = host
+        self.port = port
+        self.size = size
+        self.retries = retries
+        self.timeout = timeout
+        self.backoff = backoff
+        self.starttls = starttls
+        self.user = user
+        self.password = password
+        self.max_per_connection = max_per_connection
+        self.pipelining = pipelining
+        self.limiter = RateLimiter(rate)
+        self.stats = {"sent": 0, "partial": 0, "failed": 0, "retries": 0, "connections": 0, "pipelined": 0}
+        self.failures = []
+        self._lock = threading.Lock()
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self.stats[name] += amount
+
+    def _connect(self):
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            smtp.ehlo()
+            if self.starttls:
+                smtp.starttls()
+                smtp.ehlo()
+            if self.user:
+                smtp.login(self.user, self.password or "")
+        except BaseException:
+            smtp.close()
+            raise
+        self._count("connections")
+        return smtp
+
+    @staticmethod
+    def _close(smtp):
+        try:
+            smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            smtp.close()
+
+    def _send(self, smtp, message):
+        """İletiyi gönder; reddedilen alıcıları {adres: (kod, yanıt)} olarak döndür"""
+        sender = parseaddr(message["From"])[1]
+        recipients = _recipients(message)
+        if sender.isascii() and all(address.isascii() for address in recipients):
+            data = _message_bytes(message)
+            if self.pipelining and smtp.has_extn("pipelining"):
+                self._count("pipelined")
+                return pipelined_send(smtp, sender, recipients, data)
+            return smtp.sendmail(sender, recipients, data)
+        # ASCII dışı adres (ör. şule@okul.edu) yalnızca SMTPUTF8 bildiren sunucuya gönderilebilir
+        if not smtp.has_extn("smtputf8"):
+            raise smtplib.SMTPNotSupportedError("ASCII dışı adres için sunucu SMTPUTF8 desteklemiyor")
+        return smtp.sendmail(sender, recipients, _message_bytes(message, utf8=True), mail_options=["SMTPUTF8"])
+
+    def _worker(self, messages):
+        smtp = None
+        used = 0
+        try:
+            while True:
+                message = messages.get()
+                if message is None:
+                    return
+                for attempt in range(self.retries + 1):
+                    try:
+                        if smtp is None or used >= self.max_per_connection:
+                            if smtp is not None:
+                                self._close(smtp)
+                            smtp, used = None, 0
+                            smtp = self._connect()
+                        self.limiter.wait()
+                        used += 1
+                        refused = self._send(smtp, message)
+                        if refused:
+                            # Bazı alıcılar reddedildi: ileti gönderilmiş sayılmaz, adresler hataya yazılır
+                            self._count("partial")
+                            with self._lock:
+                                self.failures.extend((address, f"{code} {text.decode(errors='replace')}")
+                                                     for address, (code, text) in refused.items())
+                        else:
+                            self._count("sent")
+                        break
+                    except (smtplib.SMTPException, OSError) as e:
+                        if _broken(e):
+                            # Bağlantı kullanılamaz: sonraki denemede yeniden açılır
+                            if smtp is not None:
+                                smtp.close()
+                            smtp = None
+                        if attempt < self.retries and _temporary(e):
+                            self._count("retries")
+                            time.sleep(self.backoff * 2 ** attempt)
+                            continue
+                        self._count("failed")
+                        with self._lock:
+                            self.failures.append((message["To"], f"{type(e).__name__}: {e}"))
+                        break
+                    except Exception as e:
+                        # Beklenmeyen hata yalnızca bu iletiyi düşürür; iş parçacığı ölürse kuyruk
+                        # boşalmaz ve send_all sonsuza dek bekler. Bağlantının durumu belirsizdir.
+                        if smtp is not None:
+                            smtp.close()
+                        smtp = None
+                        self._count("failed")
+                        with self._lock:
+                            self.failures.append((message["To"], f"{type(e).__name__}: {e}"))
+                        break
+        finally:
+            if smtp is not None:
+                self._close(smtp)
+
+    def send_all(self, messages):
+        """İletileri (liste ya da üreteç) gönder; istatistikleri döndür"""
+        # Kuyruk sınırlı: üreteç, gönderimin ancak birkaç ileti önünde ilerler
+        pending = queue.Queue(maxsize=self.size * 4)
+        workers = [threading.Thread(target=self._worker, args=(pending,), name=f"ekom-smtp-{i}", daemon=True)
+                   for i in range(self.size)]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        try:
+            for message in messages:
+                pending.put(message)
+        finally:
+            for _ in workers:
+                pending.put(None)
+            for worker in workers:
+                worker.join()
+        duration = time.perf_counter() - start
+        return dict(self.stats, duration_s=duration,
+                    messages_per_s=self.stats["sent"] / duration if duration > 0 else 0.0)
+
+
+# ---------------------------------------------------------------- yerel sunucu
+
+class SMTPSink:
+    """İletileri sayıp atan, kendi iş parçacığında çalışan SMTP sunucusu"""
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, fail_every=0, max_per_connection=0, keep=0,
+                 refuse=(), smtputf8=True):
+        self.host = host
+        self.port = port
+        # Her okuma turunda bekleme: ağ gidiş-dönüş süresinin yerine geçer
+        self.latency = latency
+        # Her fail_every. ileti 451 ile geri çevrilir (yeniden denemeyi göstermek için)
+        self.fail_every = fail_every
+        self.max_per_connection = max_per_connection
+        self.keep = keep
+        # Bu adreslere RCPT TO 550 ile geri çevrilir (kısmen reddedilen iletileri göstermek için)
+        self.refuse = {address.encode() for address in refuse}
+        self.smtputf8 = smtputf8
+        self.messages = []
+        self.stats = {"messages": 0, "recipients": 0, "bytes": 0, "connections": 0, "rejected": 0}
+        self._loop = None
+        self._thread = None
+        self._server = None
+        self._handlers = {}
+
+    def _command(self, line, session):
+        """Tek bir SMTP komutunun yanıtı"""
+        verb = line[:4].upper()
+        if verb == b"EHLO":
+            return (b"250-ekom-sink\r\n250-PIPELINING\r\n250-8BITMIME\r\n"
+                    + (b"250-SMTPUTF8\r\n" if self.smtputf8 else b"") + b"250 SIZE 10485760\r\n")
+        if verb == b"HELO":
+            return b"250 ekom-sink\r\n"
+        if verb == b"MAIL":
+            if self.max_per_connection and session["count"] >= self.max_per_connection:
+                session["close"] = True
+                return b"421 Too many messages on this connection\r\n"
+            session["recipients"] = 0
+            return b"250 OK\r\n"
+        if verb == b"RCPT":
+            address = _RCPT_ADDRESS.search(line)
+            if address and address.group(1) in self.refuse:
+                return b"550 No such user\r\n"
+            session["recipients"] += 1
+            return b"250 OK\r\n"
+        if verb == b"DATA":
+            if not session["recipients"]:
+                return b"503 No valid recipients\r\n"
+            session["data"] = []
+            return b"354 End data with <CR><LF>.<CR><LF>\r\n"
+        if verb in (b"RSET", b"NOOP"):
+            session["recipients"] = 0
+            return b"250 OK\r\n"
+        if verb == b"QUIT":
+            session["close"] = True
+            return b"221 Bye\r\n"
+        return b"502 Command not implemented\r\n"
+
+    def _end_of_data(self, session):
+        lines = session.pop("data")
+        session["count"] += 1
+        self.stats["messages"] += 1
+        if self.fail_every and self.stats["messages"] % self.fail_every == 0:
+            self.stats["rejected"] += 1
+            return b"451 Temporary failure, try again later\r\n"
+        data = b"".join(line[1:] if line.startswith(b"..") else line for line in lines)
+        self.stats["recipients"] += session["recipients"]
+        self.stats["bytes"] += len(data)
+        if self.keep:
+            self.messages.append(data)
+            del self.messages[:-self.keep]
+        return b"250 Queued\r\n"
+
+    async def _handle(self, reader, writer):
+        self.stats["connections"] += 1
+        task = asyncio.current_task()
+        self._handlers[task] = writer
+        session = {"count": 0, "recipients": 0, "close": False}
+        buffer = b""
+        try:
+            writer.write(b"220 ekom-sink ESMTP\r\n")
+            await writer.drain()
+            while not session["close"]:
+                chunk = await reader.read(64 * 1024)
+                if not chunk:
+                    break
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                buffer += chunk
+                replies = []
+                # Bir okumada gelen tüm komutlar (pipelining) birlikte yanıtlanır
+                while not session["close"]:
+                    end = buffer.find(b"\n")
+                    if end < 0:
+                        break
+                    line, buffer = buffer[:end + 1], buffer[end + 1:]
+                    if "data" in session:
+                        if line.rstrip(b"\r\n") == b".":
+                            replies.append(self._end_of_data(session))
+                        else:
+                            session["data"].append(line)
+                    else:
+                        replies.append(self._command(line.rstrip(b"\r\n"), session))
+                writer.write(b"".join(replies))
+                await writer.drain()
+        except OSError:
+            pass
+        finally:
+            self._handlers.pop(task, None)
+            writer.close()
+
+    def start(self):
+        """Sunucuyu arka plandaki döngüde başlat"""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="ekom-smtp-sink", daemon=True)
+        self._thread.start()
+
+        async def serve():
+            return await asyncio.start_server(self._handle, self.host, self.port)
+
+        self._server = asyncio.run_coroutine_threadsafe(serve(), self._loop).result()
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def _shutdown(self):
+        self._server.close()
+        handlers = list(self._handlers.items())
+        for _, writer in handlers:
+            writer.close()
+        await asyncio.gather(*(task for task, _ in handlers), return_exceptions=True)
+        await self._server.wait_closed()
+
+    def close(self):
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ---------------------------------------------------------------- ölçüm ve komut
+
+BENCH_MODES = {
+    "per_message": ("ileti başına bağlantı", {"max_per_connection": 1, "pipelining": False}),
+    "persistent": ("kalıcı bağlantı", {"pipelining": False}),
+    "pipelined": ("kalıcı + pipelining", {})
+}
+
+
+def benchmark(modules, messages=1000, workers=4, latency=0.002, fail_every=0, rate=None):
+    """Yerel sunucuya rapor gönderimini farklı bağlantı biçimleriyle ölç"""
+    learners, completions = sample_cohort(messages, modules)
+    runs = {}
+    for name, (_, options) in BENCH_MODES.items():
+        with SMTPSink(latency=latency, fail_every=fail_every) as sink:
+            pool = SMTPPool(sink.host, sink.port, size=workers, rate=rate, backoff=0.01, **options)
+            result = pool.send_all(reports(learners, completions, modules))
+        runs[name] = dict(result, received=sink.stats["messages"] - sink.stats["rejected"],
+                          server_connections=sink.stats["connections"])
+    return {"messages": messages, "workers": workers, "latency_ms": latency * 1000, "runs": runs}
+
+
+def print_benchmark(report):
+    print(f"\n{Fore.CYAN}╔══════════ E-POSTA HIZ ÖLÇÜMÜ (yerel sunucu) ══════════╗{Style.RESET_ALL}")
+    print(f"║ {report['messages']} rapor, {report['workers']} bağlantı, "
+          f"tur başına {report['latency_ms']:.1f} ms gecikme")
+    for name, run in report["runs"].items():
+        print(f"║ {BENCH_MODES[name][0]:<24} {run['messages_per_s']:8.0f} ileti/s  {run['duration_s']:6.2f} s  "
+              f"{run['connections']:>5} bağlantı  {run['retries']:>3} yeniden deneme  "
+              f"{run['received']}/{report['messages']} teslim")
+    print(f"╚═══════════════════════════════════════════════════════╝")
+
+
+def main(store=None, modules=None, host=None, port=25, sender=DEFAULT_SENDER, domain=None, workers=4,
+         rate=None, retries=3, starttls=False, user=None, limit=None, dry_run=False, messages=1000,
+         latency=0.002, json_path=None):
+    """mail komutu; sunucu verilmezse yerel SMTP sunucusunda hız ölçülür"""
+    if host is None and not dry_run:
+        report = benchmark(modules, messages, workers, latency, fail_every=50, rate=rate)
+        print_benchmark(report)
+        ok = all(run["received"] == messages for run in report["runs"].values())
+    else:
+        learners, completions = store.cohort()
+        learners = learners[:limit] if limit else learners
+        unaddressed = sum(1 for learner in learners if learner_address(learner[0], domain) is None)
+        if unaddressed and not dry_run:
+            print(f"{Fore.RED}--domain gerekli: {unaddressed} öğrencinin kimliği bir e-posta adresi değil"
+                  f"{Style.RESET_ALL}", file=sys.stderr)
+            return 2
+        outgoing = reports(learners, completions, modules, sender, domain or DEFAULT_DOMAIN)
+        if dry_run:
+            first = next(outgoing, None)
+            if first is not None:
+                for name in ("From", "To", "Subject"):
+                    print(f"{name}: {first[name]}")
+                print()
+                print(first.get_content())
+            print(f"{Fore.YELLOW}Kuru çalıştırma: {len(learners)} rapor gönderilmedi{Style.RESET_ALL}")
+            if unaddressed:
+                print(f"{Fore.YELLOW}Önizlemede {DEFAULT_DOMAIN} kullanıldı; gerçek gönderimde "
+                      f"{unaddressed} öğrenci için --domain gerekir{Style.RESET_ALL}")
+            report = {"learners": len(learners), "dry_run": True}
+            ok = True
+        else:
+            pool = SMTPPool(host, port, size=workers, retries=retries, rate=rate, starttls=starttls, user=user,
+                            password=os.environ.get("EKOMCODE_SMTP_PASSWORD"))
+            report = pool.send_all(outgoing)
+            report["failures"] = pool.failures
+            color = Fore.YELLOW if pool.failures else Fore.GREEN
+            print(f"{color}✓ {report['sent']} rapor gönderildi{Style.RESET_ALL} "
+                  f"({report['messages_per_s']:.0f} ileti/s, {report['connections']} bağlantı, "
+                  f"{report['retries']} yeniden deneme)")
+            if report["partial"]:
+                print(f"{Fore.YELLOW}! {report['partial']} rapor bazı alıcılara ulaşmadı{Style.RESET_ALL}")
+            for address, error in pool.failures:
+                print(f"{Fore.RED}✗ {address}: {error}{Style.RESET_ALL}", file=sys.stderr)
+            ok = not pool.failures
+    if json_path:
+        with open(json_path, 'w', encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"{Fore.GREEN}✓ Sonuçlar kaydedildi: {json_path}")
+    return 0 if ok else 1
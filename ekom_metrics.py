@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Sayaç ve gecikme histogramları.
+
+Ölçüm kapalıyken hiçbir şey kurulmaz: enable() çağrılmadıkça uygulama
+kodunda tek bir ek satır bile çalışmaz. enable() ekran çizimi, ders
+gösterimi, kod çalıştırma ve depo işlemlerini saran ölçüm katmanını
+sınıflara yerleştirir ve çıkışta sonuçları Prometheus metin biçiminde
+ya da JSON olarak dosyaya yazar.
+"""
+
+import json
+import time
+import atexit
+import bisect
+import functools
+import threading
+
+# Saniye cinsinden histogram kova sınırları
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+REGISTRY = None
+
+
+class Counter:
+    """Etiketlere göre artan sayaç"""
+
+    kind = "counter"
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, label_values=(), amount=1):
+        with self._lock:
+            self.values[label_values] = self.values.get(label_values, 0) + amount
+
+    def snapshot(self):
+        with self._lock:
+            return [{"labels": dict(zip(self.labels, key)), "value": value}
+                    for key, value in sorted(self.values.items())]
+
+    def prometheus(self):
+        with self._lock:
+            for key, value in sorted(self.values.items()):
+                yield f"{self.name}{_label_text(self.labels, key)} {value}"
+
+
+class Histogram:
+    """Etiketlere göre gecikme dağılımı (kümülatif kovalar)"""
+
+    kind = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = buckets
+        # etiket değerleri -> [kova sayıları..., toplam süre, adet]
+        self.values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, seconds, label_values=()):
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            entry = self.values.get(label_values)
+            if entry is None:
+                entry = self.values[label_values] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+            entry[index] += 1
+            entry[-2] += seconds
+            entry[-1] += 1
+
+    def snapshot(self):
+        with self._lock:
+            series = []
+            for key, entry in sorted(self.values.items()):
+                cumulative, buckets = 0, {}
+                for bound, count in zip(self.buckets + (float("inf"),), entry):
+                    cumulative += count
+                    buckets["+Inf" if bound == float("inf") else repr(bound)] = cumulative
+                series.append({"labels": dict(zip(self.labels, key)), "buckets": buckets,
+                               "sum": entry[-2], "count": entry[-1]})
+            return series
+
+    def prometheus(self):
+        for series in self.snapshot():
+            key = tuple(series["labels"].values())
+            for bound, count in series["buckets"].items():
+                yield f"{self.name}_bucket{_label_text(self.labels + ('le',), key + (bound,))} {count}"
+            yield f"{self.name}_sum{_label_text(self.labels, key)} {series['sum']!r}"
+            yield f"{self.name}_count{_label_text(self.labels, key)} {series['count']}"
+
+
+def _label_text(names, values):
+    if not names:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for value in values)
+    return "{" + ",".join(f'{name}="{value}"' for name, value in zip(names, escaped)) + "}"
+
+
+class Registry:
+    """Ad -> ölçüm tablosu"""
+
+    def __init__(self):
+        self.metrics = {}
+
+    def _get(self, cls, name, help, labels):
+        metric = self.metrics.get(name)
+        if metric is None:
+            metric = self.metrics[name] = cls(name, help, labels)
+        return metric
+
+    def counter(self, name, help, labels=()):
+        return self._get(Counter, name, help, labels)
+
+    def histogram(self, name, help, labels=()):
+        return self._get(Histogram, name, help, labels)
+
+    def prometheus(self):
+        """Prometheus metin biçimi"""
+        lines = []
+        for metric in self.metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.prometheus())
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self):
+        """JSON olarak yazılabilecek anlık görüntü"""
+        return {
+            "time": time.time(),
+            "metrics": {name: {"type": metric.kind, "help": metric.help, "series": metric.snapshot()}
+                        for name, metric in self.metrics.items()}
+        }
+
+
+def export(path):
+    """Ölçümleri dosyaya yaz (.json uzantısı JSON, diğerleri Prometheus metni)"""
+    if REGISTRY is None:
+        return
+    if path.endswith(".json"):
+        data = json.dumps(REGISTRY.snapshot(), ensure_ascii=False, indent=2)
+    else:
+        data = REGISTRY.prometheus()
+    with open(path, 'w', encoding="utf-8") as f:
+        f.write(data)
+
+
+def _wrap(cls, name, histogram, labels):
+    """cls.name metodunu süresini histograma yazan sarmalayıcıyla değiştir"""
+    original = getattr(cls, name)
+
+    @functools.wraps(original)
+    def timed(*args, **kwargs):
+        label_values = labels(*args)
+        start = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            histogram.observe(time.perf_counter() - start, label_values)
+
+    setattr(cls, name, timed)
+
+
+def _instrument_app(registry, app_class):
+    draw = registry.histogram("ekom_screen_draw_seconds", "Ekran karesini kurma süresi", ("screen",))
+    for name in dir(app_class):
+        if name.startswith("draw_") and callable(getattr(app_class, name)):
+            screen = (name[len("draw_"):],)
+            _wrap(app_class, name, draw, lambda *args, screen=screen: screen)
+
+    views = registry.counter("ekom_lesson_views_total", "Açılan ders sayısı", ("module", "lesson"))
+    completions = registry.counter("ekom_lessons_completed_total", "Tamamlanan ders sayısı")
+    draw_lesson, complete_lesson = app_class.draw_lesson, app_class.complete_lesson
+
+    @functools.wraps(draw_lesson)
+    def counted_draw_lesson(self, module_key, lesson_key):
+        views.inc((module_key, lesson_key))
+        return draw_lesson(self, module_key, lesson_key)
+
+    @functools.wraps(complete_lesson)
+    def counted_complete_lesson(self, lesson_key):
+        before = len(self.user_data["completed_lessons"])
+        result = complete_lesson(self, lesson_key)
+        if len(self.user_data["completed_lessons"]) > before:
+            completions.inc()
+        return result
+
+    app_class.draw_lesson = counted_draw_lesson
+    app_class.complete_lesson = counted_complete_lesson
+
+
+def _instrument_render(registry):
+    from ekom_render import Renderer
+    present = registry.histogram("ekom_screen_present_seconds", "Karenin terminale yazılma süresi")
+    _wrap(Renderer, "present", present, lambda *args: ())
+
+
+def _instrument_storage(registry):
+    from ekom_storage import STORES
+    operations = registry.histogram("ekom_store_operation_seconds", "İlerleme deposu işlem süresi",
+                                    ("backend", "operation"))
+    for backend, store_class in STORES.items():
+        for operation in ("load", "save", "record_completion", "reset", "flush"):
+            _wrap(store_class, operation, operations,
+                  lambda *args, key=(backend, operation): key)
+
+
+def _instrument_executor(registry):
+    from ekom_executor import ExecutionPool
+    runs = registry.counter("ekom_code_runs_total", "Kod çalıştırma sayısı", ("outcome",))
+    durations = registry.histogram("ekom_code_run_seconds", "Kod çalıştırma süresi", ("outcome",))
+    submit = ExecutionPool.submit
+
+    def observe(future):
+        if future.cancelled() or future.exception() is not None:
+            runs.inc(("crash",))
+            return
+        result = future.result()
+        outcome = "timeout" if result.timed_out else "ok" if result.ok else "error"
+        runs.inc((outcome,))
+        durations.observe(result.wall_time, (outcome,))
+
+    @functools.wraps(submit)
+    def observed_submit(self, *args, **kwargs):
+        future = submit(self, *args, **kwargs)
+        future.add_done_callback(observe)
+        return future
+
+    ExecutionPool.submit = observed_submit
+
+
+def _instrument_session(registry):
+    from ekom_session import Session
+    inputs = registry.histogram("ekom_session_input_seconds", "Oturumda bir girdinin işlenme süresi", ("view",))
+    _wrap(Session, "handle", inputs, lambda self, *args: (self.view if self._view else "start",))
+
+
+def enable(path=None):
+    """Ölçümü aç; path verilirse çıkışta oraya yazılır"""
+    global REGISTRY
+    if REGISTRY is not None:
+        return REGISTRY
+    REGISTRY = Registry()
+    # Betik olarak çalışan ekomcode, içe aktarılan ekomcode ile aynı modüldür
+    import ekomcode
+    _instrument_app(REGISTRY, ekomcode.EkomCode)
+    _instrument_render(REGISTRY)
+    _instrument_storage(REGISTRY)
+    _instrument_executor(REGISTRY)
+    _instrument_session(REGISTRY)
+    if path:
+        atexit.register(export, path)
+    return REGISTRY
+
+
+def enabled():
+    return REGISTRY is not None
@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Dosya düzenleyici: türe veya tarihe göre klasörleme ve kopya bulma.
+
+Klasör ağacı os.scandir ile dolaşılır; dizin girdisi türü ve stat
+bilgisini birlikte verdiği için dosya başına ayrı bir os.stat çağrısı
+gerekmez. Kopyalar üç aşamada bulunur: önce yalnızca boyutu aynı olan
+dosyalar aday kalır, sonra adayların ilk ve son baytlarından kısmi bir
+özet alınır, en son kısmi özeti de aynı olan dosyaların tamamı mmap ile
+eşlenip özetlenir. Özetleme hashlib'in GIL'i bıraktığı büyük
+tamponlarla yapıldığından iş parçacığı havuzunda paralel ilerler.
+Önce bir plan hazırlanır (kuru çalıştırma); uygulama sırasında
+taşımalar kaynak/hedef klasör çiftlerine göre gruplanır, her klasör bir
+kez açılır ve yeniden adlandırmalar klasör tanıtıcısı üzerinden
+yapılır.
+"""
+
+import os
+import sys
+import json
+import mmap
+import time
+import random
+import hashlib
+import tempfile
+from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from colorama import Fore, Style
+
+PARTIAL_SIZE = 16 * 1024
+DUPLICATES_FOLDER = "Kopyalar"
+OTHER_FOLDER = "Diğer"
+
+CATEGORIES = {
+    "Resimler": (".jpg", ".jpeg", ".png", ".gif", ".bmp", ".svg", ".webp", ".heic"),
+    "Belgeler": (".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".txt", ".odt", ".csv", ".md"),
+    "Videolar": (".mp4", ".mkv", ".avi", ".mov", ".webm"),
+    "Müzik": (".mp3", ".wav", ".flac", ".ogg", ".m4a"),
+    "Arşivler": (".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".xz"),
+    "Kod": (".py", ".js", ".html", ".css", ".json", ".java", ".c", ".cpp", ".sh"),
+    "Programlar": (".exe", ".msi", ".deb", ".rpm", ".dmg", ".apk")
+}
+_CATEGORY_OF = {ext: folder for folder, exts in CATEGORIES.items() for ext in exts}
+MODES = ("type", "ext", "date")
+
+
+class FileEntry:
+    """Taramada bulunan dosya"""
+
+    __slots__ = ("path", "name", "size", "mtime")
+
+    def __init__(self, path, name, size, mtime):
+        self.path = path
+        self.name = name
+        self.size = size
+        self.mtime = mtime
+
+    @property
+    def ext(self):
+        return os.path.splitext(self.name)[1].lower()
+
+
+def scan(root, recursive=True, skip=()):
+    """Klasördeki dosyalar; sembolik bağlar ve gizli girdiler atlanır"""
+    entries = []
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        try:
+            it = os.scandir(folder)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive and entry.name not in skip:
+                        stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    try:
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    entries.append(FileEntry(entry.path, entry.name, stat.st_size, stat.st_mtime))
+    return entries
+
+
+def scan_listdir(root, recursive=True, skip=()):
+    """os.listdir ve dosya başına os.stat ile aynı tarama (karşılaştırma için)"""
+    import stat as stat_module
+    entries = []
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        try:
+            names = os.listdir(folder)
+        except OSError:
+            continue
+        for name in names:
+            if name.startswith("."):
+                continue
+            path = os.path.join(folder, name)
+            try:
+                stat = os.lstat(path)
+            except OSError:
+                continue
+            if stat_module.S_ISDIR(stat.st_mode):
+                if recursive and name not in skip:
+                    stack.append(path)
+            elif stat_module.S_ISREG(stat.st_mode):
+                entries.append(FileEntry(path, name, stat.st_size, stat.st_mtime))
+    return entries
+
+
+def folder_for(entry, by="type"):
+    """Dosyanın düzenleme kökü altındaki hedef klasörü"""
+    if by == "date":
+        return datetime.fromtimestamp(entry.mtime).strftime("%Y/%m")
+    if by == "ext":
+        return entry.ext[1:].upper() or OTHER_FOLDER
+    return _CATEGORY_OF.get(entry.ext, OTHER_FOLDER)
+
+
+def partial_hash(path, size=PARTIAL_SIZE):
+    """Dosyanın başından ve sonundan alınan kısmi özet; 2*size'a kadar dosyanın tamamı"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        digest.update(f.read(size))
+        if os.fstat(f.fileno()).st_size > 2 * size:
+            f.seek(-size, os.SEEK_END)
+            digest.update(f.read(size))
+        else:
+            # Baş ile son arasında okunmayan bayt kalmasın: find_duplicates bu dosyaları yeniden özetlemez
+            digest.update(f.read())
+    return digest.digest()
+
+
+def full_hash(path):
+    """Dosyanın tamamının özeti; dosya mmap ile kopyalanmadan okunur"""
+    digest = hashlib.blake2b()
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return digest.digest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            digest.update(mm)
+    return digest.digest()
+
+
+def _safe(fn):
+    def call(path):
+        try:
+            return fn(path)
+        except OSError:
+            # Tarama ile özetleme arasında silinen ya da okunamayan dosya kopya sayılmaz
+            return None
+    return call
+
+
+def _group_by(entries, hash_fn, pool):
+    """Girdileri boyut ve özete göre grupla; tek kalan gruplar elenir"""
+    groups = defaultdict(list)
+    # Tüm aşama tek bir map ile havuza verilir; küçük gruplar işçileri bekletmez
+    for entry, digest in zip(entries, pool.map(_safe(hash_fn), [entry.path for entry in entries])):
+        if digest is not None:
+            groups[entry.size, digest].append(entry)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def find_duplicates(entries, workers=None, stats=None):
+    """Aynı içerikli dosya grupları; her grup en eski dosyayla başlar"""
+    stats = stats if stats is not None else {}
+    by_size = defaultdict(list)
+    for entry in entries:
+        if entry.size > 0:
+            by_size[entry.size].append(entry)
+    candidates = [entry for group in by_size.values() if len(group) > 1 for entry in group]
+    stats["size_candidates"] = len(candidates)
+    with ThreadPoolExecutor(max_workers=workers or min(32, (os.cpu_count() or 1) + 4)) as pool:
+        partial = _group_by(candidates, partial_hash, pool)
+        stats["partial_candidates"] = sum(len(group) for group in partial)
+        # Kısmi özet dosyanın tamamını kapsıyorsa yeniden özetlemeye gerek yok
+        duplicates = [group for group in partial if group[0].size <= 2 * PARTIAL_SIZE]
+        large = [entry for group in partial if group[0].size > 2 * PARTIAL_SIZE for entry in group]
+        stats["full_hashed"] = len(large)
+        duplicates.extend(_group_by(large, full_hash, pool))
+    for group in duplicates:
+        group.sort(key=lambda entry: (entry.mtime, entry.path))
+    duplicates.sort(key=lambda group: group[0].path)
+    return duplicates
+
+
+class Plan:
+    """Uygulanmadan önce gösterilebilen taşıma listesi"""
+
+    def __init__(self, root, by):
+        self.root = root
+        self.by = by
+        self.moves = []
+        self.duplicates = []
+        self.skipped = 0
+
+    def folders(self):
+        """Hedef klasör başına taşınacak dosya sayısı"""
+        counts = defaultdict(int)
+        for _, target in self.moves:
+            counts[os.path.relpath(os.path.dirname(target), self.root)] += 1
+        return dict(sorted(counts.items()))
+
+    def as_dict(self):
+        return {"root": self.root, "by": self.by, "moves": len(self.moves), "skipped": self.skipped,
+                "folders": self.folders(),
+                "duplicates": [[entry.path for entry in group] for group in self.duplicates]}
+
+
+def _free_name(target, taken):
+    """Hedefte ya da planda aynı ad varsa 'ad (2).uzantı' biçiminde boş ad bul"""
+    if target not in taken and not os.path.lexists(target):
+        return target
+    stem, ext = os.path.splitext(target)
+    number = 2
+    while True:
+        candidate = f"{stem} ({number}){ext}"
+        if candidate not in taken and not os.path.lexists(candidate):
+            return candidate
+        number += 1
+
+
+def make_plan(root, by="type", duplicates=False, recursive=True, workers=None, entries=None):
+    """Kuru çalıştırma: hangi dosyanın nereye taşınacağı"""
+    root = os.path.abspath(root)
+    plan = Plan(root, by)
+    if entries is None:
+        # Ayrılan kopyalar ve türe göre düzenlemede oluşturulan klasörler yeniden dağıtılmaz
+        skip = set(CATEGORIES) | {OTHER_FOLDER, DUPLICATES_FOLDER} if by == "type" else {DUPLICATES_FOLDER}
+        entries = scan(root, recursive, skip)
+    duplicate_of = {}
+    if duplicates:
+        plan.duplicates = find_duplicates(entries, workers)
+        for group in plan.duplicates:
+            for entry in group[1:]:
+                duplicate_of[entry.path] = group[0]
+    taken = set()
+    for entry in sorted(entries, key=lambda entry: entry.path):
+        folder = DUPLICATES_FOLDER if entry.path in duplicate_of else folder_for(entry, by)
+        target = os.path.join(root, folder, entry.name)
+        if os.path.dirname(entry.path) == os.path.dirname(target):
+            plan.skipped += 1
+            continue
+        target = _free_name(target, taken)
+        taken.add(target)
+        plan.moves.append((entry.path, target))
+    return plan
+
+
+def _remove_empty(folders, root):
+    """Taşımadan sonra boşalan klasörleri (düzenleme kökü hariç) sil"""
+    for folder in sorted(folders, key=len, reverse=True):
+        while folder != root and folder.startswith(root + os.sep):
+            try:
+                os.rmdir(folder)
+            except OSError:
+                break
+            folder = os.path.dirname(folder)
+
+
+def apply_plan(plan, batch_size=1000, on_batch=None, remove_empty=True):
+    """Planı uygula; taşınan dosya sayısını döndür"""
+    # Hedef klasörler taşımadan önce bir kez oluşturulur
+    for folder in {os.path.dirname(target) for _, target in plan.moves}:
+        os.makedirs(folder, exist_ok=True)
+    moves = sorted((os.path.dirname(source), os.path.dirname(target),
+                    os.path.basename(source), os.path.basename(target)) for source, target in plan.moves)
+    if os.rename not in os.supports_dir_fd:
+        for source_dir, target_dir, source, target in moves:
+            os.rename(os.path.join(source_dir, source), os.path.join(target_dir, target))
+        moved = len(moves)
+    else:
+        moved = 0
+        source_fd = target_fd = None
+        opened = (None, None)
+        try:
+            for source_dir, target_dir, source, target in moves:
+                # Her ad için yol yeniden çözülmez: sıralı taşımalarda klasörler bir kez açılır
+                if opened != (source_dir, target_dir):
+                    for fd in (source_fd, target_fd):
+                        if fd is not None:
+                            os.close(fd)
+                    source_fd = target_fd = None
+                    source_fd = os.open(source_dir, os.O_RDONLY | os.O_DIRECTORY)
+                    target_fd = os.open(target_dir, os.O_RDONLY | os.O_DIRECTORY)
+                    opened = (source_dir, target_dir)
+                os.rename(source, target, src_dir_fd=source_fd, dst_dir_fd=target_fd)
+                moved += 1
+                if on_batch is not None and moved % batch_size == 0:
+                    on_batch(moved, len(moves))
+        finally:
+            for fd in (source_fd, target_fd):
+                if fd is not None:
+                    os.close(fd)
+    if on_batch is not None and moved % batch_size:
+        on_batch(moved, len(moves))
+    if remove_empty:
+        _remove_empty({source_dir for source_dir, _, _, _ in moves}, plan.root)
+    return moved
+
+
+def generate_tree(root, files=20000, folders=50, duplicate_ratio=0.1, seed=1234):
+    """Hız ölçümü için rastgele dosya ağacı; oluşturulan kopya sayısını döndür"""
+    rng = random.Random(seed)
+    extensions = [ext for exts in CATEGORIES.values() for ext in exts] + [".dat", ""]
+    paths = [os.path.join(root, *(f"klasor{rng.randrange(folders)}" for _ in range(rng.randint(0, 2))))
+             for _ in range(folders)]
+    for path in paths:
+        os.makedirs(path, exist_ok=True)
+    # Boyutu aynı ama içeriği farklı dosyalar da olsun diye boyutlar az sayıda değerden seçilir;
+    # indirme klasörlerindeki gibi dosyaların çoğu küçüktür
+    sizes = rng.choices((256, 1024, 4096, 16384, 65536, 262144), (30, 25, 20, 15, 8, 2), k=files)
+    written = []
+    duplicates = 0
+    for i, size in enumerate(sizes):
+        path = os.path.join(rng.choice(paths), f"dosya{i}{rng.choice(extensions)}")
+        if written and rng.random() < duplicate_ratio:
+            data = rng.choice(written)
+            duplicates += 1
+        else:
+            data = rng.randbytes(size)
+            if len(written) < 256:
+                written.append(data)
+        with open(path, 'wb') as f:
+            f.write(data)
+        mtime = 1_700_000_000 + rng.randrange(60 * 86400 * 12)
+        os.utime(path, (mtime, mtime))
+    return duplicates
+
+
+def benchmark(root, by="type", workers=None):
+    """Tarama, kopya bulma, planlama ve uygulama sürelerini ölç"""
+    timings = {}
+    start = time.perf_counter()
+    scan_listdir(root)
+    timings["scan_listdir"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    entries = scan(root)
+    timings["scan"] = time.perf_counter() - start
+
+    stats = {}
+    start = time.perf_counter()
+    duplicates = find_duplicates(entries, workers, stats)
+    timings["duplicates"] = time.perf_counter() - start
+
+    # Karşılaştırma: her dosyanın tamamını özetlemek
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers or min(32, (os.cpu_count() or 1) + 4)) as pool:
+        list(pool.map(full_hash, [entry.path for entry in entries if entry.size > 0]))
+    timings["hash_all"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    plan = make_plan(root, by, duplicates=False, entries=entries)
+    plan.duplicates = duplicates
+    timings["plan"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    moved = apply_plan(plan)
+    timings["apply"] = time.perf_counter() - start
+
+    return {"files": len(entries), "bytes": sum(entry.size for entry in entries),
+            "duplicate_groups": len(duplicates), "duplicate_files": sum(len(group) - 1 for group in duplicates),
+            "moved": moved, "stages": stats, "timings": timings}
+
+
+BENCH_LABELS = {
+    "scan_listdir": "listdir + stat tarama",
+    "scan": "scandir tarama",
+    "duplicates": "aşamalı kopya bulma",
+    "hash_all": "tüm dosyaları özetleme",
+    "plan": "plan",
+    "apply": "taşıma"
+}
+
+
+def print_plan(plan, limit=20):
+    print(f"\n{Fore.CYAN}╔══════════ DÜZENLEME PLANI ══════════╗{Style.RESET_ALL}")
+    print(f"║ {plan.root} ({plan.by})")
+    print(f"║ {len(plan.moves)} dosya taşınacak, {plan.skipped} dosya zaten yerinde")
+    for folder, count in plan.folders().items():
+        print(f"║   {folder[:40]:<40} {count:>7}")
+    if plan.duplicates:
+        print(f"║")
+        print(f"║ {Fore.YELLOW}{len(plan.duplicates)} kopya grubu, "
+              f"{sum(len(group) - 1 for group in plan.duplicates)} fazla dosya "
+              f"→ {DUPLICATES_FOLDER}/{Style.RESET_ALL}")
+        for group in plan.duplicates[:limit]:
+            print(f"║   {os.path.relpath(group[0].path, plan.root)}")
+            for entry in group[1:]:
+                print(f"║     = {os.path.relpath(entry.path, plan.root)}")
+    print(f"║")
+    for source, target in plan.moves[:limit]:
+        print(f"║ {os.path.relpath(source, plan.root)} → {os.path.relpath(target, plan.root)}")
+    if len(plan.moves) > limit:
+        print(f"║ … {len(plan.moves) - limit} taşıma daha")
+    print(f"╚═════════════════════════════════════╝")
+
+
+def print_benchmark(report):
+    timings = report["timings"]
+    print(f"\n{Fore.CYAN}╔══════════ DÜZENLEYİCİ ÖLÇÜMÜ ══════════╗{Style.RESET_ALL}")
+    print(f"║ {report['files']} dosya, {report['bytes'] / 1024 / 1024:.0f} MiB, "
+          f"{report['duplicate_groups']} kopya grubu ({report['duplicate_files']} fazla dosya)")
+    stages = report["stages"]
+    print(f"║ aday: boyut {stages['size_candidates']} → kısmi özet {stages['partial_candidates']} "
+          f"→ tam özet {stages['full_hashed']}")
+    for name, label in BENCH_LABELS.items():
+        rate = report["files"] / timings[name] if timings[name] else 0
+        print(f"║ {label:<26}{timings[name] * 1000:>10.1f} ms{rate:>12.0f} dosya/s")
+    print(f"╚════════════════════════════════════════╝")
+
+
+def main(root=None, by="type", apply=False, duplicates=False, recursive=True, workers=None,
+         files=20000, json_path=None):
+    """organize komutu; klasör verilmezse üretilen ağaçta hız ölçümü yapılır"""
+    if root is None:
+        with tempfile.TemporaryDirectory(prefix="ekom_organizer_") as tmp:
+            print(f"{Fore.CYAN}… {files} dosyalık deneme ağacı oluşturuluyor{Style.RESET_ALL}", file=sys.stderr)
+            generate_tree(tmp, files)
+            report = benchmark(tmp, by, workers)
+        print_benchmark(report)
+    else:
+        if not os.path.isdir(root):
+            print(f"{Fore.RED}Klasör bulunamadı: {root}{Style.RESET_ALL}", file=sys.stderr)
+            return 2
+        plan = make_plan(root, by, duplicates, recursive, workers)
+        print_plan(plan)
+        report = plan.as_dict()
+        if apply:
+            def progress(done, total):
+                print(f"\r{done}/{total} dosya taşındı", end="", file=sys.stderr)
+            report["moved"] = apply_plan(plan, on_batch=progress)
+            print(file=sys.stderr)
+            print(f"{Fore.GREEN}✓ {report['moved']} dosya taşındı{Style.RESET_ALL}")
+        else:
+            print(f"{Fore.YELLOW}Kuru çalıştırma: uygulamak için --apply{Style.RESET_ALL}")
+    if json_path:
+        with open(json_path, 'w', encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"{Fore.GREEN}✓ Sonuçlar kaydedildi: {json_path}")
+    return 0
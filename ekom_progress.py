@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tamamlanan derslerin sıkıştırılmış gösterimi.
+
+Katalogdaki her derse bir kez sıra numarası verilir (LessonIndex).
+Öğrencinin tamamladığı dersler bu numaralara göre bir bit dizisinde
+tutulur ve modül başına tamamlanan ders sayaçları ders işaretlendiği
+anda güncellenir. Böylece "bu ders bitti mi?" ve "bu modülde kaç ders
+bitti?" soruları katalog büyüklüğünden bağımsız olarak yanıtlanır.
+"""
+
+
+class LessonIndex:
+    """Ders anahtarı -> (sıra numarası, modül) eşlemesi"""
+
+    def __init__(self, modules):
+        self.keys = []
+        self.position = {}
+        self.module_of = {}
+        self.module_totals = {}
+        for module_key, module in modules.items():
+            self.module_totals[module_key] = len(module["lessons"])
+            for lesson_key in module["lessons"]:
+                if lesson_key in self.position:
+                    continue
+                self.position[lesson_key] = len(self.keys)
+                self.module_of[lesson_key] = module_key
+                self.keys.append(lesson_key)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def completions(self, lessons=()):
+        """Verilen ders listesinden bir CompletedLessons oluştur"""
+        completed = CompletedLessons(self)
+        for lesson_key in lessons:
+            completed.add(lesson_key)
+        return completed
+
+
+class CompletedLessons:
+    """Bit dizisi tabanlı tamamlanan dersler kümesi, modül sayaçlarıyla"""
+
+    def __init__(self, index):
+        self.index = index
+        self._bits = bytearray((len(index) + 7) // 8)
+        self._module_counts = dict.fromkeys(index.module_totals, 0)
+        self._count = 0
+        # Katalogda artık bulunmayan eski ders anahtarları kaybolmasın
+        self._unknown = set()
+
+    def __contains__(self, lesson_key):
+        position = self.index.position.get(lesson_key)
+        if position is None:
+            return lesson_key in self._unknown
+        return bool(self._bits[position >> 3] & (1 << (position & 7)))
+
+    def add(self, lesson_key):
+        """Dersi tamamlandı olarak işaretle; yeni eklendiyse True döner"""
+        position = self.index.position.get(lesson_key)
+        if position is None:
+            if lesson_key in self._unknown:
+                return False
+            self._unknown.add(lesson_key)
+            self._count += 1
+            return True
+
+        byte, mask = position >> 3, 1 << (position & 7)
+        if self._bits[byte] & mask:
+            return False
+        self._bits[byte] |= mask
+        self._module_counts[self.index.module_of[lesson_key]] += 1
+        self._count += 1
+        return True
+
+    # Eski kod completed_lessons'ı liste olarak kullanıyordu
+    append = add
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for byte_index, byte in enumerate(self._bits):
+            if not byte:
+                continue
+            for bit in range(8):
+                if byte & (1 << bit):
+                    yield self.index.keys[(byte_index << 3) | bit]
+        yield from self._unknown
+
+    def module_completed(self, module_key):
+        """Modülde tamamlanan ders sayısı"""
+        return self._module_counts.get(module_key, 0)
+
+    def module_total(self, module_key):
+        """Modüldeki toplam ders sayısı"""
+        return self.index.module_totals.get(module_key, 0)
+
+    def __eq__(self, other):
+        return set(self) == set(other)
+
+    def __reduce__(self):
+        # pickle ile kaydedilirken eski dosyalarla uyumlu düz liste yazılır
+        return (list, (list(self),))
+
+    def __repr__(self):
+        return f"CompletedLessons({list(self)!r})"
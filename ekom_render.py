@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""EkomCode ekran çizici.
+
+Her ekran önce bellekteki bir karede (satır listesi) kurulur. present()
+yeni kareyi ekranda olduğu bilinen önceki kareyle karşılaştırır ve
+yalnızca değişen satırları ANSI imleç komutlarıyla, tek bir write()
+çağrısında yazar. Böylece her menüde 'clear' süreci başlatılmaz ve
+ekran titremez. Satır adresli fark her kare satırının tek bir terminal
+satırı olduğunu varsayar; terminal genişliğini aşan (sarılan) bir satır
+varsa kare baştan çizilir.
+"""
+
+import os
+import re
+import sys
+import unicodedata
+from functools import lru_cache
+
+from colorama import Fore, Style
+
+CSI = "\x1b["
+RESET = Style.RESET_ALL
+# Karenin altında istem ve kısa mesajlar için bırakılan satır sayısı
+PROMPT_MARGIN = 6
+
+_SGR = re.compile(r"\x1b\[[0-9;]*m")
+
+
+@lru_cache(maxsize=4096)
+def display_width(line):
+    """Satırın terminalde kapladığı sütun sayısı (renk kodları sayılmaz)"""
+    width = 0
+    for char in _SGR.sub("", line):
+        if char == "\t":
+            width += 8 - width % 8
+        elif unicodedata.combining(char):
+            continue
+        else:
+            width += 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+    return width
+
+
+@lru_cache(maxsize=64)
+def menu_frame(title, items):
+    """Numaralı menü kutusunun satırları (aynı menü için bir kez kurulur)"""
+    lines = [f"\n{Fore.GREEN}╔══ {title} {Fore.GREEN}══╗"]
+    for key, option in items:
+        lines.append(f"║ {Fore.YELLOW}{key}.{Style.RESET_ALL} {option}")
+    lines.append(f"╚{'═' * (len(title) + 8)}╝")
+    return tuple(lines)
+
+
+class Renderer:
+    """Kareleri tamponda kurup farkları tek seferde yazan çizici"""
+
+    def __init__(self, stream=None, ansi=None):
+        self.stream = stream or sys.stdout
+        self.ansi = self.stream.isatty() if ansi is None else ansi
+        self._lines = []
+        self._previous = None
+        self._dirty = False
+
+    def clear(self):
+        """Yeni bir kareye başla"""
+        self._lines = []
+        self._dirty = True
+
+    def write(self, text=""):
+        """Kareye metin ekle (print gibi, satır sonu otomatik)"""
+        # Satırlar tek tek yeniden çizilebildiği için, aynı metin içinde
+        # önceki satırdan taşan renk her satırın başına eklenir
+        active = ""
+        for line in text.split("\n"):
+            self._lines.append(active + line)
+            for code in _SGR.findall(line):
+                active = "" if code in (RESET, f"{CSI}m") else active + code
+        self._dirty = True
+
+    def invalidate(self):
+        """Ekrana çizici dışında yazıldı; sonraki kare baştan çizilsin"""
+        self._previous = None
+
+    def frame(self):
+        """Kurulmakta olan karenin metni"""
+        return "\n".join(self._lines)
+
+    def present(self):
+        """Kareyi ekrana yaz (değişmediyse hiçbir şey yapmaz)"""
+        if not self._dirty:
+            return
+        self._dirty = False
+        frame = self._lines
+
+        if not self.ansi:
+            self.stream.write("\n".join(frame) + "\n")
+            self.stream.flush()
+            return
+
+        try:
+            width, height = os.get_terminal_size(self.stream.fileno())
+        except (OSError, ValueError, AttributeError):
+            width, height = 80, 24
+        # Sarılan satır birden çok terminal satırı kaplar ve alttaki satırları kaydırır
+        # (her karakteri iki sütun sayılsa bile sığan kısa satırlar ölçülmez)
+        rows = sum(1 if len(line) * 2 <= width else max(1, -(-display_width(line) // width)) for line in frame)
+        fits = rows == len(frame) and rows + PROMPT_MARGIN < height
+        previous = self._previous
+        out = []
+        if previous is None or not fits:
+            out.append(f"{CSI}H{CSI}2J")
+            out.append("".join(f"{line}{RESET}{CSI}K\n" for line in frame))
+        else:
+            for row, line in enumerate(frame):
+                if row >= len(previous) or previous[row] != line:
+                    out.append(f"{CSI}{row + 1};1H{line}{RESET}{CSI}K")
+            out.append(f"{CSI}{len(frame) + 1};1H")
+        # Kare altındaki eski istem ve mesajları sil
+        out.append(f"{CSI}J")
+
+        self.stream.write("".join(out))
+        self.stream.flush()
+        # Ekrana sığmayan ya da sarılan kare kaydırma yaptığından konumlar artık bilinmiyor
+        self._previous = list(frame) if fits else None
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tekrar aralıklı ders planlayıcısı ("sıradaki ders" önerisi).
+
+Her dersin tekrar durumu öğrencinin kaydında (user_data["schedule"])
+tutulur: bir sonraki tekrar zamanı, kaçıncı aralıkta olduğu ve kaç
+çalıştırmanın hatayla bittiği. Başarılı her tekrar aralığı uzatır, hata
+ya da zaman aşımı dersi ilk aralığa döndürüp kısa süre sonra yeniden
+önerir; sık hata alınan derslerin aralıkları da kısalır. Planlayıcı bu
+kayıtlardan oturumda bir kez bir yığın kurar, sonra her çalıştırma
+yalnızca o dersin yeni girdisini yığına ekler. Eski girdiler silinmez;
+yığının tepesine geldiklerinde kayıtla karşılaştırılıp atılır. Henüz
+tamamlanmamış dersler modül başına ayrı yığınlarda katalog sırasıyla
+durur. Öneri önce zamanı gelmiş tekrara, yoksa öğrencinin çalıştığı
+modüldeki (current_module) ilk yeni derse bakar; ikisi de modülleri
+yeniden taramadan O(log n) sürer.
+"""
+
+import time
+import heapq
+
+# Başarılı tekrarlardan sonraki bekleme süreleri (gün); son aralık tekrarlanır
+REVIEW_DAYS = (1, 3, 7, 16, 35, 90)
+# Hatayla biten çalıştırmadan sonra ders bu kadar saniye sonra yeniden önerilir
+RETRY_DELAY = 10 * 60
+# Aralık en fazla bu kadar hataya göre kısaltılır
+MAX_FAILURE_PENALTY = 3
+DAY = 24 * 60 * 60
+
+
+def review_interval(step, failures):
+    """Aralık (saniye); her hata aralığı biraz daha kısaltır"""
+    return REVIEW_DAYS[step] * DAY // (1 + min(failures, MAX_FAILURE_PENALTY))
+
+
+class LessonScheduler:
+    """Bir öğrencinin tekrar yığını ve modül başına yeni ders yığınları"""
+
+    def __init__(self, index, user_data, now=None):
+        now = int(time.time() if now is None else now)
+        self.index = index
+        self.completed = user_data["completed_lessons"]
+        self.state = user_data.setdefault("schedule", {})
+        # Planlayıcıdan önce tamamlanmış dersler ilk aralıktan başlar
+        for lesson_key in self.completed:
+            if lesson_key in index.position and lesson_key not in self.state:
+                self.state[lesson_key] = {"due": now + review_interval(0, 0), "step": 0, "failures": 0,
+                                          "last": now}
+        self._reviews = [(entry["due"], index.position[lesson_key])
+                         for lesson_key, entry in self.state.items() if lesson_key in index.position]
+        heapq.heapify(self._reviews)
+        # Sıra numaraları katalog sırasında olduğu için sıralı liste zaten bir yığındır
+        self._new = {module_key: [] for module_key in index.module_totals}
+        for position, lesson_key in enumerate(index.keys):
+            if lesson_key not in self.completed:
+                self._new[index.module_of[lesson_key]].append(position)
+
+    def record(self, lesson_key, ok, now=None):
+        """Dersin çalıştırma sonucunu işle; dersin yeni kaydını döndürür"""
+        position = self.index.position.get(lesson_key)
+        if position is None:
+            return None
+        now = int(time.time() if now is None else now)
+        entry = self.state.get(lesson_key)
+        if entry is None:
+            entry = self.state[lesson_key] = {"due": now, "step": 0, "failures": 0, "last": now}
+        elif ok and now >= entry["due"]:
+            # Erken tekrar aralığı uzatmaz, yalnızca zamanı yeniler
+            entry["step"] = min(entry["step"] + 1, len(REVIEW_DAYS) - 1)
+        if ok:
+            entry["due"] = now + review_interval(entry["step"], entry["failures"])
+        else:
+            entry["step"] = 0
+            entry["failures"] += 1
+            entry["due"] = now + RETRY_DELAY
+        entry["last"] = now
+        heapq.heappush(self._reviews, (entry["due"], position))
+        return entry
+
+    def next_review(self):
+        """En yakın tekrar: (ders anahtarı, zaman) ya da None"""
+        reviews = self._reviews
+        while reviews:
+            due, position = reviews[0]
+            lesson_key = self.index.keys[position]
+            entry = self.state.get(lesson_key)
+            # Sonradan yeniden planlanan dersin eski girdisi atılır
+            if entry is not None and entry["due"] == due:
+                return lesson_key, due
+            heapq.heappop(reviews)
+        return None
+
+    def next_new(self, current_module=None):
+        """Tamamlanmamış ilk ders; önce current_module, sonra katalog sırasıyla diğer modüller"""
+        module_keys = list(self._new)
+        start = module_keys.index(current_module) if current_module in self._new else 0
+        for module_key in module_keys[start:] + module_keys[:start]:
+            lessons = self._new[module_key]
+            while lessons:
+                lesson_key = self.index.keys[lessons[0]]
+                if lesson_key not in self.completed:
+                    return lesson_key
+                heapq.heappop(lessons)
+        return None
+
+    def next(self, current_module=None, now=None):
+        """Sıradaki ders: zamanı gelmiş tekrar, yoksa yeni ders; hiçbiri yoksa None"""
+        now = time.time() if now is None else now
+        review = self.next_review()
+        if review is not None and review[1] <= now:
+            return review[0]
+        return self.next_new(current_module)
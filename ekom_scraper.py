@@ -0,0 +1,531 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Eşzamanlı web kazıma motoru ve yerel deneme sunucusu.
+
+Scraper, asyncio akışları üzerinde küçük bir HTTP/1.1 istemcisidir:
+her sunucu için bir bağlantı havuzu tutar (keep-alive), aynı sunucuya
+aynı anda açılan istek sayısını ve istek hızını sınırlar, bağlantı
+hatası ve 429/5xx yanıtlarında artan beklemeyle yeniden dener;
+yönlendirmeleri (3xx + Location) en fazla MAX_REDIRECTS kez izler ve
+yalnızca http/https adreslerini kabul eder. Yanıt
+gövdesi geldikçe parça parça HTMLParser'a verilir; sayfanın tamamı
+bellekte birleştirilmez.
+
+FixtureServer aynı süreçte çalışan, bağlantıları açık tutan bir deneme
+sunucusudur. Birbirine bağlantı veren yapay sayfalar üretir, istenirse
+gecikme ve geçici hata ekler; böylece ders örneği ve hız ölçümü
+internet olmadan çalışır.
+"""
+
+import ssl
+import json
+import time
+import codecs
+import asyncio
+from html.parser import HTMLParser
+from urllib.parse import urlsplit, urljoin
+
+from colorama import Fore, Style
+
+USER_AGENT = "EkomCode-Scraper/1.0"
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 5
+_READ_SIZE = 64 * 1024
+
+
+class Page:
+    """Bir sayfanın kazıma sonucu"""
+
+    def __init__(self, url, status=None, title="", headings=(), links=(), size=0,
+                 elapsed=0.0, attempts=1, error=None):
+        self.url = url
+        self.status = status
+        self.title = title
+        self.headings = list(headings)
+        self.links = list(links)
+        self.size = size
+        self.elapsed = elapsed
+        self.attempts = attempts
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None and self.status is not None and 200 <= self.status < 300
+
+    def __repr__(self):
+        return f"Page({self.url!r}, status={self.status}, title={self.title!r})"
+
+
+class PageParser(HTMLParser):
+    """Başlık, h1/h2 metinleri ve bağlantıları parça parça toplayan ayrıştırıcı"""
+
+    HEADINGS = ("h1", "h2")
+
+    def __init__(self, base_url):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.title = ""
+        self.headings = []
+        self.links = []
+        self._capture = None
+        self._text = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "a":
+            href = dict(attrs).get("href")
+            if href:
+                self.links.append(urljoin(self.base_url, href))
+        elif tag == "title" or tag in self.HEADINGS:
+            self._capture = tag
+            self._text = []
+
+    def handle_endtag(self, tag):
+        if tag != self._capture:
+            return
+        text = " ".join("".join(self._text).split())
+        if tag == "title":
+            self.title = text
+        else:
+            self.headings.append(text)
+        self._capture = None
+
+    def handle_data(self, data):
+        if self._capture is not None:
+            self._text.append(data)
+
+
+class HTTPError(Exception):
+    """Yeniden denenebilir HTTP hatası"""
+
+    def __init__(self, status, retry_after=None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+class _Connection:
+    """Tek bir keep-alive bağlantı"""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.requests = 0
+
+    @property
+    def usable(self):
+        return not self.writer.is_closing() and not self.reader.at_eof()
+
+    def close(self):
+        self.writer.close()
+
+    async def request(self, host, path, parser, keep_alive=True):
+        """GET isteği gönder, gövdeyi ayrıştırıcıya akıt: (durum, boyut, yeniden kullanılabilir mi, başlıklar)"""
+        self.requests += 1
+        self.writer.write(
+            f"GET {path} HTTP/1.1\r\nHost: {host}\r\nUser-Agent: {USER_AGENT}\r\n"
+            f"Accept-Encoding: identity\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+            .encode("ascii"))
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("sunucu bağlantıyı kapattı")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        charset = "utf-8"
+        for part in headers.get("content-type", "").split(";"):
+            key, _, value = part.strip().partition("=")
+            if key.lower() == "charset" and value:
+                charset = value.strip('"')
+        try:
+            decoder = codecs.getincrementaldecoder(charset)("replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")("replace")
+
+        size = 0
+        reusable = keep_alive and headers.get("connection", "").lower() != "close"
+        async for chunk in self._body(headers):
+            size += len(chunk)
+            if status < 300:
+                parser.feed(decoder.decode(chunk))
+        if status < 300:
+            parser.feed(decoder.decode(b"", final=True))
+            parser.close()
+        if "content-length" not in headers and "chunked" not in headers.get("transfer-encoding", ""):
+            # Gövde bağlantı kapanınca bittiyse bağlantı tükenmiştir
+            reusable = False
+        return status, size, reusable, headers
+
+    async def _body(self, headers):
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            while True:
+                size_line = await self.reader.readline()
+                length = int(size_line.split(b";")[0].strip() or b"0", 16)
+                if length == 0:
+                    # Son parçadan sonraki başlıklar ve boş satır
+                    while (await self.reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    return
+                while length:
+                    chunk = await self.reader.readexactly(min(length, _READ_SIZE))
+                    length -= len(chunk)
+                    yield chunk
+                await self.reader.readexactly(2)
+        elif "content-length" in headers:
+            remaining = int(headers["content-length"])
+            while remaining:
+                chunk = await self.reader.readexactly(min(remaining, _READ_SIZE))
+                remaining -= len(chunk)
+                yield chunk
+        else:
+            while True:
+                chunk = await self.reader.read(_READ_SIZE)
+                if not chunk:
+                    return
+                yield chunk
+
+
+class HostPool:
+    """Bir sunucuya açılan bağlantılar: eşzamanlılık sınırı, boşta bekleyenler ve hız sınırı"""
+
+    def __init__(self, scheme, host, port, limit, rate=None):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.semaphore = asyncio.Semaphore(limit)
+        self.idle = []
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next_slot = 0.0
+        self.opened = 0
+
+    async def acquire(self, timeout):
+        await self.semaphore.acquire()
+        try:
+            if self.interval:
+                loop = asyncio.get_running_loop()
+                now = loop.time()
+                slot = max(now, self._next_slot)
+                self._next_slot = slot + self.interval
+                if slot > now:
+                    await asyncio.sleep(slot - now)
+            while self.idle:
+                connection = self.idle.pop()
+                if connection.usable:
+                    return connection
+                connection.close()
+            context = ssl.create_default_context() if self.scheme == "https" else None
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port, ssl=context, limit=_READ_SIZE), timeout)
+            self.opened += 1
+            return _Connection(reader, writer)
+        except BaseException:
+            self.semaphore.release()
+            raise
+
+    def release(self, connection, reusable):
+        if reusable and connection.usable:
+            self.idle.append(connection)
+        else:
+            connection.close()
+        self.semaphore.release()
+
+    def close(self):
+        for connection in self.idle:
+            connection.close()
+        self.idle.clear()
+
+
+class Scraper:
+    """Sunucu başına bağlantı havuzlu, yeniden denemeli eşzamanlı kazıyıcı"""
+
+    def __init__(self, concurrency=32, per_host=6, retries=3, timeout=10.0, backoff=0.1, rate=None,
+                 keep_alive=True):
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.retries = retries
+        self.timeout = timeout
+        self.backoff = backoff
+        self.rate = rate
+        self.keep_alive = keep_alive
+        self._pools = {}
+        self.stats = {"requests": 0, "retries": 0, "errors": 0, "bytes": 0}
+
+    def _pool(self, scheme, host, port):
+        key = (scheme, host, port)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = HostPool(scheme, host, port, self.per_host, self.rate)
+        return pool
+
+    @property
+    def connections(self):
+        """Açılan toplam bağlantı sayısı"""
+        return sum(pool.opened for pool in self._pools.values())
+
+    async def fetch(self, url, redirects=0):
+        """Sayfayı indir ve ayrıştır; yönlendirmeler izlenir, hatalar Page.error olarak döner"""
+        parts = urlsplit(url)
+        try:
+            port = parts.port or (443 if parts.scheme == "https" else 80)
+        except ValueError:
+            port = None
+        if parts.scheme not in ("http", "https") or not parts.hostname or port is None:
+            # "example.com" gibi şemasız adresler yerel makineye bağlanmaya çalışmasın
+            self.stats["errors"] += 1
+            return Page(url, error="geçersiz adres: http:// ya da https:// ile başlayan tam adres gerekli")
+        host_header = parts.netloc
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        pool = self._pool(parts.scheme, parts.hostname, port)
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            parser = PageParser(url)
+            connection = None
+            reusable = False
+            try:
+                connection = await pool.acquire(self.timeout)
+                self.stats["requests"] += 1
+                status, size, reusable, headers = await asyncio.wait_for(
+                    connection.request(host_header, path, parser, self.keep_alive), self.timeout)
+                self.stats["bytes"] += size
+                if status in RETRY_STATUSES:
+                    retry_after = headers.get("retry-after", "")
+                    raise HTTPError(status, float(retry_after) if retry_after.isdigit() else None)
+                if status in REDIRECT_STATUSES and headers.get("location"):
+                    # Bağlantı havuza bırakıldıktan sonra yeni adres istenir
+                    break
+                return Page(url, status, parser.title, parser.headings, parser.links, size,
+                            time.perf_counter() - start, attempt)
+            except (OSError, EOFError, ValueError, IndexError, HTTPError, asyncio.TimeoutError,
+                    asyncio.IncompleteReadError) as e:
+                if attempt > self.retries:
+                    self.stats["errors"] += 1
+                    status = e.status if isinstance(e, HTTPError) else None
+                    return Page(url, status, size=0, elapsed=time.perf_counter() - start,
+                                attempts=attempt, error=str(e) or type(e).__name__)
+                self.stats["retries"] += 1
+                delay = e.retry_after if isinstance(e, HTTPError) and e.retry_after else self.backoff * 2 ** (attempt - 1)
+            finally:
+                if connection is not None:
+                    pool.release(connection, reusable)
+            await asyncio.sleep(delay)
+        if redirects >= MAX_REDIRECTS:
+            self.stats["errors"] += 1
+            return Page(url, status, elapsed=time.perf_counter() - start, attempts=attempt,
+                        error=f"{MAX_REDIRECTS} yönlendirmeden sonra durduruldu")
+        # Sonuç sayfası son adresle döner; bağlantılar bu adrese göre çözülür
+        return await self.fetch(urljoin(url, headers["location"]), redirects + 1)
+
+    async def crawl(self, urls):
+        """Adresleri eşzamanlı indir; sonuçlar verilen sırayla döner"""
+        limit = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(url):
+            async with limit:
+                return await self.fetch(url)
+
+        return await asyncio.gather(*(bounded(url) for url in urls))
+
+    def close(self):
+        for pool in self._pools.values():
+            pool.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+
+class FixtureServer:
+    """Yapay sayfalar sunan, keep-alive destekli yerel HTTP sunucusu"""
+
+    def __init__(self, host="127.0.0.1", port=0, pages=100, links=5, padding=2048, delay=0.0, fail_every=0):
+        self.host = host
+        self.port = port
+        self.pages = pages
+        self.links = links
+        self.padding = padding
+        self.delay = delay
+        # Her fail_every. sayfanın ilk isteği 503 döner (yeniden denemeyi göstermek için)
+        self.fail_every = fail_every
+        self.requests = 0
+        self.connections = 0
+        self._failed = set()
+        # bağlantıyı işleyen görev -> yazıcı
+        self._handlers = {}
+        self._server = None
+
+    def page(self, number):
+        """Sayfanın HTML metni"""
+        links = "".join(f'<li><a href="/sayfa/{(number * 7 + i) % self.pages}">Bağlantı {i}</a></li>'
+                        for i in range(1, self.links + 1))
+        filler = "<p>" + ("Python ile otomasyon öğreniyoruz. " * (self.padding // 35 + 1))[:self.padding] + "</p>"
+        return (f"<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>Sayfa {number}</title></head>"
+                f"<body><h1>Örnek Başlık {number}</h1><h2>Alt başlık {number}</h2>{filler}"
+                f"<ul>{links}</ul></body></html>")
+
+    def url(self, number):
+        return f"http://{self.host}:{self.port}/sayfa/{number}"
+
+    def urls(self, count=None):
+        """İlk count sayfanın adresleri (sayfa sayısından fazlası baştan tekrarlanır)"""
+        count = self.pages if count is None else count
+        return [self.url(i % self.pages) for i in range(count)]
+
+    def _response(self, path):
+        """(durum, gövde, sayfa numarası, yönlendirme adresi)"""
+        parts = path.strip("/").split("/")
+        if len(parts) == 2 and parts[0] == "sayfa" and parts[1].isdigit() and int(parts[1]) < self.pages:
+            number = int(parts[1])
+            if self.fail_every and number % self.fail_every == 0 and number not in self._failed:
+                self._failed.add(number)
+                return 503, "Geçici hata", number, None
+            return 200, self.page(number), number, None
+        # /yonlendir/<n> sayfaya yönlendirir, /dongu kendine (yönlendirme sınırını göstermek için)
+        if len(parts) == 2 and parts[0] == "yonlendir" and parts[1].isdigit():
+            return 302, "Taşındı", None, f"/sayfa/{parts[1]}"
+        if parts == ["dongu"]:
+            return 302, "Taşındı", None, "/dongu"
+        return 404, "Bulunamadı", None, None
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        task = asyncio.current_task()
+        self._handlers[task] = writer
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                keep_alive = True
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    if name.strip().lower() == "connection" and value.strip().lower() == "close":
+                        keep_alive = False
+                self.requests += 1
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+                status, text, number, location = self._response(request_line.split()[1].decode("latin-1"))
+                body = text.encode("utf-8")
+                head = (f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                        f"Content-Type: text/html; charset=utf-8\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n")
+                if location:
+                    head += f"Location: {location}\r\n"
+                if number is not None and number % 2:
+                    # Tek numaralı sayfalar parça parça (chunked) gönderilir
+                    writer.write((head + "Transfer-Encoding: chunked\r\n\r\n").encode("ascii"))
+                    for i in range(0, len(body), 1024):
+                        piece = body[i:i + 1024]
+                        writer.write(b"%x\r\n%s\r\n" % (len(piece), piece))
+                    writer.write(b"0\r\n\r\n")
+                else:
+                    writer.write((head + f"Content-Length: {len(body)}\r\n\r\n").encode("ascii") + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (OSError, IndexError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._handlers.pop(task, None)
+            writer.close()
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            # Boşta bekleyen keep-alive bağlantıları kapatılınca okuma EOF ile biter
+            handlers = list(self._handlers.items())
+            for _, writer in handlers:
+                writer.close()
+            await asyncio.gather(*(task for task, _ in handlers), return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+async def benchmark(pages=500, concurrency=64, per_host=8, keep_alive=True, delay=0.0, fail_every=0):
+    """Yerel sunucudan sayfaları kazı ve hız ölçümünü döndür"""
+    async with FixtureServer(pages=min(pages, 1000), delay=delay, fail_every=fail_every) as server:
+        async with Scraper(concurrency, per_host, keep_alive=keep_alive, backoff=0.01) as scraper:
+            start = time.perf_counter()
+            results = await scraper.crawl(server.urls(pages))
+            duration = time.perf_counter() - start
+    return {
+        "pages": pages,
+        "ok": sum(1 for page in results if page.ok),
+        "duration_s": duration,
+        "pages_per_s": pages / duration if duration > 0 else 0.0,
+        "connections": scraper.connections,
+        "server_connections": server.connections,
+        "retries": scraper.stats["retries"],
+        "errors": scraper.stats["errors"],
+        "kib": scraper.stats["bytes"] / 1024,
+        "keep_alive": keep_alive
+    }
+
+
+async def _scrape(urls, concurrency, per_host, retries, rate):
+    async with Scraper(concurrency, per_host, retries, rate=rate) as scraper:
+        start = time.perf_counter()
+        results = await scraper.crawl(urls)
+        return results, time.perf_counter() - start, scraper
+
+
+def main(urls=(), pages=500, concurrency=64, per_host=8, retries=3, rate=None, json_path=None):
+    """scrape komutu; adres verilmezse yerel deneme sunucusunda hız ölçülür"""
+    if urls:
+        results, duration, scraper = asyncio.run(_scrape(urls, concurrency, per_host, retries, rate))
+        print(f"\n{Fore.CYAN}╔══════════ WEB KAZIMA ══════════╗{Style.RESET_ALL}")
+        for page in results:
+            if page.ok:
+                print(f"║ {Fore.GREEN}{page.status}{Style.RESET_ALL} {page.url}  {page.title[:50]}  "
+                      f"({len(page.links)} bağlantı, {page.elapsed * 1000:.0f} ms)")
+            else:
+                print(f"║ {Fore.RED}{page.status or 'HATA'}{Style.RESET_ALL} {page.url}  {page.error or ''}")
+        print(f"╚═════════════════════════════════╝")
+        print(f"{len(results)} sayfa, {duration:.2f} s, {scraper.connections} bağlantı, "
+              f"{scraper.stats['retries']} yeniden deneme")
+        report = {"pages": [vars(page) for page in results], "duration_s": duration}
+        ok = all(page.ok for page in results)
+    else:
+        runs = [asyncio.run(benchmark(pages, concurrency, per_host, keep_alive=keep_alive, fail_every=50))
+                for keep_alive in (True, False)]
+        print(f"\n{Fore.CYAN}╔══════════ KAZIMA HIZ ÖLÇÜMÜ (yerel sunucu) ══════════╗{Style.RESET_ALL}")
+        print(f"║ {pages} sayfa, en fazla {concurrency} eşzamanlı istek, sunucu başına {per_host}")
+        for run in runs:
+            label = "keep-alive havuzu" if run["keep_alive"] else "istek başına bağlantı"
+            print(f"║ {label:<22} {run['pages_per_s']:8.0f} sayfa/s  {run['duration_s']:6.2f} s  "
+                  f"{run['connections']:>5} bağlantı  {run['retries']:>3} yeniden deneme  {run['ok']}/{run['pages']} başarılı")
+        print(f"╚══════════════════════════════════════════════════════╝")
+        report = {"runs": runs}
+        ok = all(run["ok"] == run["pages"] for run in runs)
+    if json_path:
+        with open(json_path, 'w', encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"{Fore.GREEN}✓ Sonuçlar kaydedildi: {json_path}")
+    return 0 if ok else 1
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Dersler ve kod örnekleri üzerinde tam metin arama.
+
+Ders başlıkları, teori satırları ve kodlar bir kez ters indekse
+(terim -> belge listesi) dönüştürülür. Metinler Türkçe kurallarına göre
+katlanır: İ/I/ı hepsi 'i' olur, ş/ğ/ç/ö/ü de noktasız karşılıklarına
+indirgenir; böylece "şifre", "SIFRE" ve "Şİfre" aynı terimdir. Terimler
+sıralı tutulduğu için önek araması ikili aramayla yapılır. Belge
+listeleri array baytları olarak saklanır ve yalnızca sorguda eşleşen
+terimler için çözülür; indeks dosyası marshal ile hızlıca yüklenir.
+"""
+
+import os
+import re
+import math
+import json
+import heapq
+import bisect
+import marshal
+import hashlib
+from array import array
+from operator import itemgetter
+
+from colorama import Fore, Style
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_INDEX = os.path.join(BASE_DIR, "search.index")
+INDEX_VERSION = 1
+
+# Alan ağırlıkları: başlıkta geçen terim teoride geçenden daha önemlidir
+FIELD_WEIGHTS = {"title": 5.0, "theory": 1.0, "code": 0.5}
+# Önek eşleşmesi tam eşleşmeden daha düşük puan alır
+PREFIX_FACTOR = 0.6
+MIN_PREFIX = 2
+
+_FOLD = str.maketrans({
+    "İ": "i", "I": "i", "ı": "i",
+    "Ş": "s", "ş": "s", "Ğ": "g", "ğ": "g",
+    "Ç": "c", "ç": "c", "Ö": "o", "ö": "o", "Ü": "u", "ü": "u",
+    "Â": "a", "â": "a", "Î": "i", "î": "i", "Û": "u", "û": "u"
+})
+_WORD = re.compile(r"\w+")
+
+
+def fold(text):
+    """Türkçe büyük/küçük harf ve aksan katlaması"""
+    return text.translate(_FOLD).lower()
+
+
+def tokenize(text):
+    """Katlanmış metindeki terimler"""
+    return [word for word in _WORD.findall(fold(text)) if len(word) >= MIN_PREFIX]
+
+
+def content_fingerprint(content, catalog):
+    """Katalog ve indekslenen tüm kayıtların özeti; indeks dosyasının güncelliğini denetlemek için"""
+    data = json.dumps({"modules": catalog["modules"], "examples": catalog["examples"]},
+                      sort_keys=True, ensure_ascii=False)
+    digest = hashlib.sha1(data.encode("utf-8"))
+    # Ders metni ya da kodu değişince önceden kurulmuş indeks eskir
+    for module_key, module in catalog["modules"].items():
+        for lesson_key in module["lessons"]:
+            digest.update(content.stamp(f"theory/{module_key}/{lesson_key}"))
+            digest.update(content.stamp(f"code/{module_key}/{lesson_key}"))
+    for example in catalog["examples"].values():
+        digest.update(content.stamp(f"example/{example['key']}"))
+    return digest.hexdigest()
+
+
+class SearchIndex:
+    """Önek destekli, ağırlıklı ters indeks"""
+
+    def __init__(self, docs, terms, postings, fingerprint=None):
+        # docs: ("lesson", modül, ders, başlık) veya ("example", anahtar, içerik anahtarı, başlık)
+        self.docs = docs
+        self.terms = terms
+        # postings[i]: (belge numaraları, ağırlıklar) array baytları olarak
+        self.postings = postings
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def build(cls, content, catalog=None):
+        """İçerik kaynağındaki tüm ders ve örneklerden indeks kur"""
+        catalog = catalog or content.catalog()
+        docs = []
+        fields = []
+        for module_key, module in catalog["modules"].items():
+            for lesson_key, title in module["lessons"].items():
+                docs.append(("lesson", module_key, lesson_key, title))
+                fields.append({
+                    "title": title,
+                    "theory": "\n".join(content.theory(module_key, lesson_key) or ()),
+                    "code": content.code(module_key, lesson_key) or ""
+                })
+        for example_key, example in catalog["examples"].items():
+            docs.append(("example", example_key, example["key"], example["title"]))
+            fields.append({"title": example["title"], "code": content.example(example["key"]) or ""})
+
+        raw = {}
+        for doc_id, doc_fields in enumerate(fields):
+            weights = {}
+            for field, text in doc_fields.items():
+                counts = {}
+                for term in tokenize(text):
+                    counts[term] = counts.get(term, 0) + 1
+                for term, tf in counts.items():
+                    weights[term] = weights.get(term, 0.0) + FIELD_WEIGHTS[field] * (1 + math.log(tf))
+            for term, weight in weights.items():
+                raw.setdefault(term, []).append((doc_id, weight))
+
+        terms = sorted(raw)
+        postings = []
+        total = len(docs)
+        for term in terms:
+            entries = raw[term]
+            idf = math.log(1 + total / len(entries))
+            postings.append((array('I', (doc_id for doc_id, _ in entries)).tobytes(),
+                             array('f', (weight * idf for _, weight in entries)).tobytes()))
+        return cls(docs, terms, postings, content_fingerprint(content, catalog))
+
+    def save(self, path=DEFAULT_INDEX):
+        """İndeksi dosyaya yaz"""
+        from ekom_storage import atomic_write
+        atomic_write(path, marshal.dumps({
+            "version": INDEX_VERSION,
+            "fingerprint": self.fingerprint,
+            "docs": self.docs,
+            "terms": self.terms,
+            "postings": self.postings
+        }))
+
+    @classmethod
+    def load(cls, path=DEFAULT_INDEX):
+        """Önceden kurulmuş indeksi oku (uyumsuzsa None)"""
+        try:
+            with open(path, 'rb') as f:
+                data = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return None
+        return cls(data["docs"], data["terms"], data["postings"], data["fingerprint"])
+
+    def _matches(self, token):
+        """Önekle başlayan terimlerin (indeks, katsayı) listesi"""
+        start = bisect.bisect_left(self.terms, token)
+        for i in range(start, len(self.terms)):
+            term = self.terms[i]
+            if not term.startswith(token):
+                break
+            yield i, 1.0 if term == token else PREFIX_FACTOR
+
+    def search(self, query, limit=10):
+        """Sorgudaki tüm kelimeleri içeren belgeler, puana göre: [(puan, belge)]"""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        totals = None
+        for token in dict.fromkeys(tokens):
+            scores = None
+            for i, factor in self._matches(token):
+                doc_ids, weights = self._posting(i)
+                if factor != 1.0:
+                    weights = [weight * factor for weight in weights]
+                if scores is None:
+                    # İlk terimin listesi C düzeyinde sözlüğe çevrilir
+                    scores = dict(zip(doc_ids, weights))
+                    continue
+                get = scores.get
+                for doc_id, weight in zip(doc_ids, weights):
+                    if weight > get(doc_id, 0.0):
+                        scores[doc_id] = weight
+            if not scores:
+                return []
+            if totals is None:
+                totals = scores
+            else:
+                if len(scores) < len(totals):
+                    totals, scores = scores, totals
+                totals = {doc_id: total + scores[doc_id] for doc_id, total in totals.items() if doc_id in scores}
+                if not totals:
+                    return []
+        best = heapq.nlargest(limit, totals.items(), key=itemgetter(1))
+        return [(score, self.docs[doc_id]) for doc_id, score in best]
+
+    def _posting(self, i):
+        """i. terimin belge numaraları ve ağırlıkları"""
+        doc_bytes, weight_bytes = self.postings[i]
+        doc_ids = array('I')
+        doc_ids.frombytes(doc_bytes)
+        weights = array('f')
+        weights.frombytes(weight_bytes)
+        return doc_ids, weights
+
+
+def load_index(content, catalog=None, path=DEFAULT_INDEX):
+    """Güncel indeks dosyası varsa onu yükle, yoksa bellekte kur"""
+    catalog = catalog or content.catalog()
+    index = SearchIndex.load(path)
+    if index is not None and index.fingerprint == content_fingerprint(content, catalog):
+        return index
+    return SearchIndex.build(content, catalog)
+
+
+def snippet(content, doc, query, width=60):
+    """Sonucun sorguyla eşleşen ilk satırı (kısaltılmış)"""
+    kind, key, detail, _ = doc
+    if kind == "lesson":
+        lines = list(content.theory(key, detail) or ()) + (content.code(key, detail) or "").split("\n")
+    else:
+        lines = (content.example(detail) or "").split("\n")
+    tokens = tokenize(query)
+    for line in lines:
+        words = tokenize(line)
+        if any(word.startswith(token) for token in tokens for word in words):
+            line = line.strip()
+            return line if len(line) <= width else line[:width - 1] + "…"
+    return ""
+
+
+def main(content, query, limit=10, rebuild=False):
+    """search komutu; sonuç yoksa 1 döndürür"""
+    import time
+    start = time.perf_counter()
+    catalog = content.catalog()
+    index = SearchIndex.build(content, catalog) if rebuild else load_index(content, catalog)
+    loaded = time.perf_counter()
+    results = index.search(query, limit)
+    done = time.perf_counter()
+
+    print(f"\n{Fore.CYAN}╔══════════ ARAMA: {query} ══════════╗{Style.RESET_ALL}")
+    for i, (score, doc) in enumerate(results, 1):
+        kind, key, _, title = doc
+        where = catalog["modules"][key]["title"] if kind == "lesson" else "Kod Örnekleri"
+        print(f"║ {Fore.YELLOW}{i}.{Style.RESET_ALL} {title} {Fore.BLUE}({where}){Style.RESET_ALL}  [{score:.1f}]")
+        line = snippet(content, doc, query)
+        if line:
+            print(f"║    {Fore.GREEN}{line}{Style.RESET_ALL}")
+    if not results:
+        print(f"║ {Fore.RED}Sonuç bulunamadı{Style.RESET_ALL}")
+    print(f"╚══════════════════════════════════════════╝")
+    print(f"{len(index.docs)} belge, {len(index.terms)} terim | indeks: {(loaded - start) * 1000:.1f} ms, "
+          f"sorgu: {(done - loaded) * 1000:.2f} ms")
+    return 0 if results else 1
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""İçerik paketindeki tüm kod parçalarını etkileşimsiz olarak sınar.
+
+Ders kodları, kod örnekleri ve alıştırma çözümleri çalıştırma havuzunda
+paralel olarak yürütülür. Etkileşimli parçalar için girdiler
+catalog.json içindeki "selftest" bölümünden verilir.
+"""
+
+import os
+import re
+import time
+
+from colorama import Fore, Style
+
+from ekom_executor import ExecutionPool
+from ekom_codecache import CodeCache
+
+SNIPPET_KINDS = ("code/", "example/", "exercise/")
+# Kurulu olmaması hata sayılmayan isteğe bağlı üçüncü parti paketler; diğer eksik
+# modüller (ör. ekom_* içe aktarmaları) gerçek hatadır
+OPTIONAL_PACKAGES = ("openpyxl", "requests", "bs4", "numpy", "pandas", "selenium", "PIL", "lxml")
+_MISSING_MODULE = re.compile(r"^ModuleNotFoundError: No module named '([^'.]+)")
+
+
+class SnippetResult:
+    """Tek bir kod parçasının sınama sonucu"""
+
+    def __init__(self, key, status, wall_time=0.0, detail="", output=""):
+        self.key = key
+        self.status = status
+        self.wall_time = wall_time
+        self.detail = detail
+        self.output = output
+
+
+def discover_snippets(content):
+    """Paketteki çalıştırılabilir kod parçalarının anahtarları"""
+    return sorted(key for key in content.keys() if key.startswith(SNIPPET_KINDS))
+
+
+def _compile_only(key, code):
+    start = time.perf_counter()
+    try:
+        compile(code, key, "exec")
+    except SyntaxError as e:
+        return SnippetResult(key, "HATA", time.perf_counter() - start, f"SyntaxError: {e}")
+    return SnippetResult(key, "DERLENDİ", time.perf_counter() - start)
+
+
+def _optional_missing(error):
+    """Hata isteğe bağlı bir paketin kurulu olmamasından mı kaynaklanıyor"""
+    match = _MISSING_MODULE.match(error)
+    return match is not None and match.group(1) in OPTIONAL_PACKAGES
+
+
+def run_selftest(content, workers=None, timeout=10, code_cache=None):
+    """Tüm parçaları çalıştır ve sonuçları anahtar sırasıyla döndür"""
+    settings = content.catalog().get("selftest", {})
+    pool = ExecutionPool(workers=workers or os.cpu_count(), code_cache=code_cache,
+                         wall_time=timeout, cpu_time=timeout)
+    results = []
+    pending = []
+    try:
+        for key in discover_snippets(content):
+            code = content.get(key)
+            options = settings.get(key, {})
+            if options.get("mode") == "compile":
+                result = _compile_only(key, code)
+                result.detail = options.get("reason", "")
+                results.append(result)
+                continue
+            pending.append((key, pool.submit(code, stdin=options.get("stdin", ""))))
+
+        for key, future in pending:
+            run = future.result()
+            if run.timed_out:
+                result = SnippetResult(key, "HATA", run.wall_time, f"{timeout} saniyede bitmedi", run.output)
+            elif run.error and _optional_missing(run.error):
+                result = SnippetResult(key, "ATLANDI", run.wall_time, run.error, run.output)
+            elif not run.ok:
+                result = SnippetResult(key, "HATA", run.wall_time, run.error or f"çıkış kodu {run.returncode}", run.output)
+            else:
+                result = SnippetResult(key, "GEÇTİ", run.wall_time, output=run.output)
+            results.append(result)
+    finally:
+        pool.shutdown()
+    return sorted(results, key=lambda r: r.key)
+
+
+def print_report(results, total_time, verbose=False):
+    """Sonuç tablosunu yazdır; başarısız parça yoksa True döner"""
+    colors = {"GEÇTİ": Fore.GREEN, "DERLENDİ": Fore.CYAN, "ATLANDI": Fore.YELLOW, "HATA": Fore.RED}
+    print(f"\n{Fore.CYAN}╔══════════ KOD PARÇASI SINAMASI ══════════╗{Style.RESET_ALL}")
+    for result in results:
+        detail = f" ({result.detail})" if result.detail else ""
+        print(f"║ {colors[result.status]}{result.status:<8}{Style.RESET_ALL} "
+              f"{result.wall_time * 1000:8.1f} ms  {result.key}{detail}")
+        if verbose and result.status == "HATA" and result.output:
+            for line in result.output.rstrip().split('\n'):
+                print(f"║     {Fore.RED}{line}{Style.RESET_ALL}")
+    print(f"╚══════════════════════════════════════════╝")
+
+    failed = sum(1 for result in results if result.status == "HATA")
+    summary = {status: sum(1 for result in results if result.status == status) for status in colors}
+    print(" | ".join(f"{status}: {count}" for status, count in summary.items()) +
+          f" | Toplam süre: {total_time:.2f} s")
+    return failed == 0
+
+
+def main(content, workers=None, timeout=10, verbose=False):
+    """selftest komutu; çıkış kodunu döndürür"""
+    start = time.perf_counter()
+    code_cache = CodeCache()
+    results = run_selftest(content, workers, timeout, code_cache)
+    ok = print_report(results, time.perf_counter() - start, verbose)
+    stats = code_cache.stats()
+    print(f"Kod önbelleği: {stats['hits']} isabet, {stats['disk_hits']} diskten, {stats['misses']} derleme")
+    return 0 if ok else 1
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""EkomCode ağ sunucusu (telnet uyumlu, asyncio).
+
+Her bağlantı bir Session durum makinesi sürer; bağlantı başına iş
+parçacığı açılmaz, bu yüzden binlerce boşta bekleyen öğrenci tek bir
+olay döngüsünde tutulabilir. Katalog ve içerik tüm oturumlarca salt
+okunur paylaşılır, ilerleme ortak depoya yazılır. Kod çalıştırma
+ExecutionPool'a devredilir ve sonucu olay döngüsünü bloklamadan
+beklenir.
+
+Yavaş istemciler için gönderim tamponu sınırlıdır: tampon dolduğunda
+drain() beklenir, istemci belirli sürede okumazsa bağlantı kesilir.
+
+Sunucu yalnızca güvenilir ağlar (sınıf, laboratuvar, yerel makine)
+içindir: bağlantı şifrelenmez ve öğrenci kimliği doğrulanmaz, herkes
+herhangi bir kimlikle girip o öğrencinin verilerini sıfırlayabilir.
+Aynı kimlikle ikinci bir canlı oturum açılamaz. Varsayılan olarak
+yalnızca 127.0.0.1 dinlenir.
+"""
+
+import asyncio
+
+from colorama import Fore, Style
+
+from ekom_content import load_content
+from ekomcode import build_catalog
+from ekom_session import Session
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 2323
+LOOPBACK_HOSTS = ("127.0.0.1", "::1", "localhost")
+DEFAULT_LIMITS = {
+    "max_sessions": 1000,
+    "idle_timeout": 900,    # girdi beklenirken en uzun sessizlik (saniye)
+    "send_timeout": 30,     # dolu gönderim tamponunun boşalması için süre
+    "write_buffer": 64 * 1024,
+    "line_limit": 4096      # tek girdi satırının en fazla bayt sayısı
+}
+
+# Telnet komut baytları
+IAC, SB, SE = 255, 250, 240
+_NEGOTIATION = (251, 252, 253, 254)  # WILL, WONT, DO, DONT
+
+
+def strip_telnet(data):
+    """Telnet pazarlık dizilerini ve satır sonu karakterlerini ayıkla"""
+    out = bytearray()
+    i, n = 0, len(data)
+    while i < n:
+        byte = data[i]
+        if byte != IAC:
+            if byte not in (13, 10, 0):
+                out.append(byte)
+            i += 1
+            continue
+        command = data[i + 1] if i + 1 < n else None
+        if command == IAC:
+            out.append(IAC)
+            i += 2
+        elif command in _NEGOTIATION:
+            i += 3
+        elif command == SB:
+            end = data.find(bytes((IAC, SE)), i + 2)
+            i = n if end < 0 else end + 2
+        else:
+            i += 2
+    return bytes(out)
+
+
+def to_wire(text):
+    """Oturum metnini telnet satır sonlarıyla bayta çevir"""
+    return text.replace("\n", "\r\n").encode("utf-8")
+
+
+class EkomServer:
+    """Paylaşılan katalog ve depo üzerinde çok oturumlu sunucu"""
+
+    def __init__(self, store, content=None, executor=None, ansi=True, **limits):
+        self.store = store
+        self.content = content or load_content()
+        self.catalog = build_catalog(self.content)
+        self.limits = dict(DEFAULT_LIMITS, **limits)
+        self.ansi = ansi
+        self.sessions = set()
+        # Açık oturumu olan öğrenci kimlikleri; aynı kimlikle ikinci giriş reddedilir
+        self.active = set()
+        self._executor = executor
+        self._server = None
+
+    @property
+    def executor(self):
+        """Kod çalıştırma havuzu (ilk kullanımda başlatılır)"""
+        if self._executor is None:
+            from ekom_executor import ExecutionPool
+            self._executor = ExecutionPool()
+        return self._executor
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """Dinlemeye başla; asyncio.Server döndürür"""
+        self._server = await asyncio.start_server(self.handle_client, host, port,
+                                                  limit=self.limits["line_limit"])
+        watch = getattr(self.content, "watch", None)
+        if watch is not None:
+            loop = asyncio.get_running_loop()
+            watch(on_change=lambda keys: loop.call_soon_threadsafe(self.content_changed, keys))
+        return self._server
+
+    def content_changed(self, keys):
+        """İzlenen içerik değişti: katalog değiştiyse bir kez kurup tüm oturumlara dağıt"""
+        if self.catalog["version"] != self.content.catalog_version:
+            self.catalog = build_catalog(self.content)
+            for session in self.sessions:
+                session.catalog = self.catalog
+        print(f"{Fore.CYAN}İçerik güncellendi: {', '.join(sorted(keys))}{Style.RESET_ALL}")
+
+    async def _send(self, writer, text):
+        """Metni gönder; istemci tamponu boşaltmazsa TimeoutError yükselir"""
+        if not text:
+            return
+        writer.write(to_wire(text))
+        await asyncio.wait_for(writer.drain(), self.limits["send_timeout"])
+
+    async def _run(self, session, writer):
+        """Oturumun istediği kodu havuzda çalıştır, çıktıyı geldikçe gönder"""
+        loop = asyncio.get_running_loop()
+
+        def on_output(chunk):
+            # Havuzun dağıtıcı iş parçacığından çağrılır
+            loop.call_soon_threadsafe(writer.write, to_wire(chunk))
+
+        await self._send(writer, session.run_started())
+        try:
+            future = self.executor.submit(session.pending_run, on_output=on_output,
+                                          profile=session.pending_profile)
+            result = await asyncio.wrap_future(future)
+        except RuntimeError as e:
+            await self._send(writer, f"{Fore.RED}Hata oluştu: {e}{Style.RESET_ALL}\n")
+            result = None
+        await self._send(writer, session.finish_run(result))
+
+    async def handle_client(self, reader, writer):
+        """Tek bir bağlantının yaşam döngüsü"""
+        writer.transport.set_write_buffer_limits(high=self.limits["write_buffer"])
+        if len(self.sessions) >= self.limits["max_sessions"]:
+            try:
+                await self._send(writer, f"{Fore.RED}Sunucu dolu, lütfen daha sonra tekrar deneyin.{Style.RESET_ALL}\n")
+            except (OSError, asyncio.TimeoutError):
+                pass
+            writer.close()
+            return
+
+        session = Session(self.store, self.content, self.catalog, executor=self.executor, ansi=self.ansi,
+                          active=self.active)
+        self.sessions.add(session)
+        try:
+            await self._send(writer, session.start())
+            while not session.closed:
+                line = await asyncio.wait_for(reader.readline(), self.limits["idle_timeout"])
+                if not line:
+                    break
+                text = session.handle(strip_telnet(line).decode("utf-8", "replace"))
+                await self._send(writer, text)
+                if session.pending_run is not None:
+                    await self._run(session, writer)
+        except asyncio.TimeoutError:
+            # Boşta kalan ya da çıktıyı okumayan istemci
+            pass
+        except (OSError, ValueError, asyncio.IncompleteReadError):
+            # Bağlantı koptu veya satır sınırı aşıldı
+            pass
+        finally:
+            self.sessions.discard(session)
+            session.close()
+            writer.close()
+
+    def close(self):
+        """Dinlemeyi bırak, bekleyen kayıtları yaz ve havuzu kapat"""
+        if self._server is not None:
+            self._server.close()
+        if hasattr(self.content, "watch"):
+            self.content.close()
+        for session in list(self.sessions):
+            session.close()
+        self.store.flush()
+        if self._executor is not None:
+            self._executor.shutdown()
+
+
+async def serve(server, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """Sunucuyu başlat ve kapatılana kadar çalıştır"""
+    listener = await server.start(host, port)
+    addresses = ", ".join(str(sock.getsockname()[:2]) for sock in listener.sockets)
+    print(f"{Fore.GREEN}EkomCode sunucusu dinliyor: {addresses} "
+          f"(en fazla {server.limits['max_sessions']} oturum){Style.RESET_ALL}")
+    if host not in LOOPBACK_HOSTS:
+        print(f"{Fore.YELLOW}Uyarı: kimlik doğrulama ve şifreleme yok; sunucuyu yalnızca güvenilir ağlarda "
+              f"açın{Style.RESET_ALL}")
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(store, host=DEFAULT_HOST, port=DEFAULT_PORT, content=None, **limits):
+    """serve komutu"""
+    server = EkomServer(store, content, **limits)
+    try:
+        asyncio.run(serve(server, host, port))
+    except KeyboardInterrupt:
+        print(f"\n{Fore.YELLOW}Sunucu kapatılıyor...")
+    finally:
+        server.close()
+        store.close()
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Girdi/çıktıdan bağımsız EkomCode oturumu.
+
+Terminal sürümündeki menü döngüleri input() ile bekler. Session aynı
+ekranları bir durum makinesi olarak sürer: handle() bir girdi satırı
+alır ve istemciye gönderilecek metni (ANSI farklarıyla çizilmiş kare ve
+istem) döndürür. Kod çalıştırma bir yan etki olarak bırakılır; oturumu
+süren taraf pending_run'daki kodu çalıştırıp sonucu finish_run() ile
+geri verir. Böylece aynı oturum ağ sunucusunda, testlerde veya yük
+simülasyonunda hiçbir G/Ç yapmadan kullanılabilir.
+
+Öğrenci kimliği doğrulanmaz: bağlanan herkes istediği kimlikle girip o
+öğrencinin ilerlemesini değiştirebilir. Aynı kimlikle iki oturum
+birbirinin kaydını ezeceği için, paylaşılan active kümesi verildiğinde
+açık bir oturumu olan kimlikle ikinci giriş reddedilir.
+"""
+
+import io
+import re
+
+from colorama import Fore, Style
+
+from ekomcode import EkomCode
+from ekom_render import Renderer
+
+# Öğrenci kimliği depo anahtarı ve dosya adı olarak da kullanılır
+LEARNER_ID = re.compile(r"^[\w.-]{1,64}$")
+
+MAIN_CHOICES = {
+    "1": "python_temelleri",
+    "2": "otomasyon_egitim",
+    "3": "ornek_projeler"
+}
+EXERCISE_CHOICES = {
+    "1": "hesap_makinesi",
+    "2": "sifre_uretici"
+}
+
+
+class Session(EkomCode):
+    """Tek bir bağlantının durum makinesi olarak EkomCode oturumu"""
+
+    def __init__(self, store, content=None, catalog=None, executor=None, ansi=True, learner_id=None,
+                 active=None):
+        self._out = io.StringIO()
+        super().__init__(learner_id=learner_id or "misafir", store=store, content=content,
+                         catalog=catalog, screen=Renderer(self._out, ansi=ansi))
+        self._executor = executor
+        self.logged_in = learner_id is not None
+        # Açık oturumların kimlikleri (sunucudaki tüm oturumlarca paylaşılır)
+        self._active = active
+        self._claimed = False
+        self.closed = False
+        self.pending_run = None
+        self.pending_profile = False
+        self._view = None
+        self._resume = None
+        self._lesson = None
+        self._back = None
+
+    # --- Çıktı ---
+
+    def _emit(self, text):
+        """Kare dışı metni (mesaj, kod çıktısı) çıktıya ekle"""
+        self._out.write(text)
+
+    def _take(self):
+        """Biriken çıktıyı al ve tamponu boşalt"""
+        text = self._out.getvalue()
+        self._out.seek(0)
+        self._out.truncate()
+        return text
+
+    def _show(self, draw, prompt, handler, *args, notice=None):
+        """Kareyi kur, ekrana bas ve girdiyi bekleyen görünümü ayarla"""
+        self._view = (draw, prompt, handler, args)
+        if draw is not None:
+            draw(*args)
+            self.screen.present()
+        if notice:
+            self._emit(f"{notice}{Style.RESET_ALL}\n")
+        self._emit(prompt)
+        return self._take()
+
+    def _notice(self, text):
+        """Uyarıyı istem olarak göster; Enter'dan sonra aynı görünüme dön"""
+        self._resume = self._view
+        return self._show(None, f"{text} (Enter){Style.RESET_ALL}", self._on_notice)
+
+    def _on_notice(self, _):
+        draw, prompt, handler, args = self._resume
+        return self._show(draw, prompt, handler, *args)
+
+    @property
+    def view(self):
+        """Girdi bekleyen görünümün adı (ör. 'main', 'module')"""
+        return self._view[2].__name__[len("_on_"):]
+
+    def choices(self):
+        """Geçerli görünümde anlamlı girdiler (yük simülasyonu için)"""
+        view = self.view
+        if view == "main":
+            return ["1", "2", "3", "4", "5", "6", "7", "8"]
+        if view == "search":
+            return ["", "python", "dosya", "değiş", "ŞİFRE", "print"]
+        if view == "results":
+            return ["0"] + [str(i) for i in range(1, len(self.search_results) + 1)]
+        if view == "module":
+            return ["0"] + [str(i) for i in range(1, len(self.modules[self._view[3][0]]["lessons"]) + 1)]
+        if view == "examples":
+            return ["0"] + list(self.examples)
+        if view == "practice":
+            return ["1", "2", "3"]
+        if view == "settings":
+            return ["0", "1", "2"]
+        if view == "lesson":
+            return ["e", "h", "p"]
+        if view == "reset":
+            return ["e", "h"]
+        return [""]
+
+    # --- Dış arayüz ---
+
+    def start(self):
+        """Oturumun ilk ekranı"""
+        if self.logged_in:
+            return self._main()
+        self.clear_screen()
+        self.print_header()
+        return self._show(self.screen.present, f"\n{Fore.CYAN}Öğrenci kimliğiniz: {Style.RESET_ALL}", self._on_login)
+
+    def handle(self, line):
+        """Bir girdi satırını işle; oturum bittiyse None döner"""
+        if self.closed:
+            return None
+        if self.pending_run is not None:
+            # Kod çalışırken gelen girdiler yok sayılır
+            return ""
+        handler = self._view[2]
+        return handler(line.strip())
+
+    def finish_run(self, result):
+        """pending_run için çalıştırılan kodun sonucunu işle"""
+        self.pending_run = None
+        lesson_key = self._lesson[1]
+        if result is not None:
+            for line in self.run_footer_lines(result, lesson_key):
+                self._emit(f"{line}{Style.RESET_ALL}\n")
+            self.record_profile(lesson_key, result)
+        self.schedule_review(lesson_key, result)
+        if lesson_key not in self.user_data["completed_lessons"]:
+            self.complete_lesson(lesson_key)
+            self._emit(f"{Fore.GREEN}✓ Ders tamamlandı! +10 puan{Style.RESET_ALL}\n")
+        else:
+            self.save_user_progress()
+        return self._show(None, f"\n{Fore.CYAN}Ana menüye dönmek için Enter...{Style.RESET_ALL}",
+                          self._on_lesson_done)
+
+    def run_started(self):
+        """pending_run çalıştırılmadan önce gönderilecek çerçeve başlığı"""
+        self.screen.invalidate()
+        for line in self.run_header_lines():
+            self._emit(f"{line}{Style.RESET_ALL}\n")
+        return self._take()
+
+    def close(self):
+        """İlerlemeyi depoya bırak (depo ve havuz paylaşıldığı için kapatılmaz)"""
+        if self._user_data is not None:
+            self.save_user_progress()
+        if self._claimed:
+            self._active.discard(self.learner_id)
+            self._claimed = False
+        self.closed = True
+
+    # --- Ekranlar ---
+
+    def _on_login(self, line):
+        if not LEARNER_ID.match(line):
+            return self._notice(f"{Fore.RED}Kimlik harf, rakam, '.', '-' veya '_' içermeli, en fazla 64 karakter")
+        if self._active is not None:
+            if line in self._active:
+                return self._notice(f"{Fore.RED}Bu kimlikle açık bir oturum var; önce o oturumdan çıkın")
+            self._active.add(line)
+            self._claimed = True
+        self.learner_id = line
+        self._user_data = None
+        self.logged_in = True
+        return self._main()
+
+    def _main(self, notice=None):
+        return self._show(self.draw_main_menu, f"\n{Fore.CYAN}Seçiminiz (0-8): {Style.RESET_ALL}",
+                          self._on_main, notice=notice)
+
+    def _on_main(self, choice):
+        if choice in MAIN_CHOICES:
+            return self._module(MAIN_CHOICES[choice])
+        if choice == "4":
+            return self._examples()
+        if choice == "5":
+            return self._show(self.draw_practice_menu, f"\n{Fore.CYAN}Seçiminiz (1-3): {Style.RESET_ALL}",
+                              self._on_practice)
+        if choice == "6":
+            return self._settings()
+        if choice == "7":
+            return self._show(None, f"\n{Fore.CYAN}Aranacak kelime (Enter=Ana menü): {Style.RESET_ALL}",
+                              self._on_search)
+        if choice == "8":
+            found = self.next_lesson()
+            if found is None:
+                return self._notice(self.nothing_due_message())
+            self.user_data["current_module"] = found[0]
+            return self._open_lesson(*found, self._main)
+        if choice == "0":
+            self.close()
+            return f"\n{Fore.GREEN}EkomCode'u kullandığınız için teşekkürler! 🚀{Style.RESET_ALL}\n"
+        return self._notice(f"{Fore.RED}Geçersiz seçim! Tekrar deneyin.")
+
+    def _module(self, module_key):
+        lessons = self.modules[module_key]["lessons"]
+        self.user_data["current_module"] = module_key
+        return self._show(self.draw_module_menu, f"\n{Fore.CYAN}Ders seçin (1-{len(lessons)}): {Style.RESET_ALL}",
+                          self._on_module, module_key)
+
+    def _on_module(self, choice):
+        module_key = self._view[3][0]
+        if choice == "0":
+            return self._main()
+        try:
+            choice_int = int(choice)
+        except ValueError:
+            return self._notice(f"{Fore.RED}Lütfen sayı girin!")
+        lessons = self.modules[module_key]["lessons"]
+        if not 1 <= choice_int <= len(lessons):
+            return self._notice(f"{Fore.RED}Geçersiz seçim!")
+        return self._open_lesson(module_key, list(lessons)[choice_int - 1], lambda: self._module(module_key))
+
+    def _open_lesson(self, module_key, lesson_key, back):
+        """Dersi göster; ders bitince back() ile önceki ekrana dönülür"""
+        self._lesson = (module_key, lesson_key)
+        self._back = back
+        completed = lesson_key in self.user_data["completed_lessons"]
+        return self._show(self.draw_lesson, self.run_question(completed), self._on_lesson, *self._lesson)
+
+    def _on_lesson(self, answer):
+        answer = answer.lower()
+        if answer in ('e', 'p'):
+            self.pending_run = self.get_code_example(*self._lesson)
+            self.pending_profile = answer == 'p'
+            return self.run_started()
+        if self._lesson[1] in self.user_data["completed_lessons"]:
+            return self._back()
+        return self._show(None, f"\n{Fore.CYAN}Ana menüye dönmek için Enter...{Style.RESET_ALL}",
+                          self._on_lesson_done)
+
+    def _on_lesson_done(self, _):
+        return self._back()
+
+    def _examples(self):
+        return self._show(self.draw_code_examples, f"\n{Fore.CYAN}Seçiminiz (1-5, 0=Ana menü): {Style.RESET_ALL}",
+                          self._on_examples)
+
+    def _on_examples(self, choice):
+        if choice == "0":
+            return self._main()
+        if choice not in self.examples:
+            return self._notice(f"{Fore.RED}Geçersiz seçim!")
+        return self._open_example(choice, self._examples)
+
+    def _open_example(self, example_key, back):
+        self._back = back
+        return self._show(self.draw_code_example, f"\n{Fore.CYAN}Devam etmek için Enter...{Style.RESET_ALL}",
+                          self._on_example, example_key)
+
+    def _on_example(self, _):
+        return self._back()
+
+    def _on_search(self, query):
+        if not query:
+            return self._main()
+        return self._search_results(query)
+
+    def _search_results(self, query):
+        return self._show(self.draw_search_results, f"\n{Fore.CYAN}Açmak için numara (0=Ana menü): {Style.RESET_ALL}",
+                          self._on_results, query)
+
+    def _on_results(self, choice):
+        query = self._view[3][0]
+        if choice == "0":
+            return self._main()
+        if not (choice.isdigit() and 1 <= int(choice) <= len(self.search_results)):
+            return self._notice(f"{Fore.RED}Geçersiz seçim!")
+        kind, key, detail, _ = self.search_results[int(choice) - 1]
+        back = lambda: self._search_results(query)
+        if kind == "lesson":
+            return self._open_lesson(key, detail, back)
+        return self._open_example(key, back)
+
+    def _on_practice(self, choice):
+        exercise_key = EXERCISE_CHOICES.get(choice)
+        if exercise_key is None:
+            return self._show(None, f"{Fore.YELLOW}Bu alıştırma yakında eklenecek! (Enter){Style.RESET_ALL}",
+                              self._on_solution)
+        return self._show(self.draw_exercise, f"\n{Fore.CYAN}Çözümü görmek için Enter...{Style.RESET_ALL}",
+                          self._on_exercise, exercise_key)
+
+    def _on_exercise(self, _):
+        exercise_key = self._view[3][0]
+        self.screen.invalidate()
+        for line in self.solution_lines(exercise_key):
+            self._emit(f"{line}{Style.RESET_ALL}\n")
+        return self._show(None, f"\n{Fore.CYAN}Devam etmek için Enter...{Style.RESET_ALL}",
+                          self._on_solution)
+
+    def _on_solution(self, _):
+        return self._main()
+
+    def _settings(self, notice=None):
+        return self._show(self.draw_settings_menu, f"\n{Fore.CYAN}Seçiminiz: {Style.RESET_ALL}",
+                          self._on_settings, notice=notice)
+
+    def _on_settings(self, choice):
+        if choice == "1":
+            return self._show(self.draw_statistics, f"\n{Fore.CYAN}Devam etmek için Enter...{Style.RESET_ALL}",
+                              self._on_statistics)
+        if choice == "2":
+            return self._show(None, f"\n{Fore.RED}Tüm verileriniz silinecek! Emin misiniz? (e/h): {Style.RESET_ALL}",
+                              self._on_reset)
+        if choice == "0":
+            return self._main()
+        return self._notice(f"{Fore.RED}Geçersiz seçim!")
+
+    def _on_statistics(self, _):
+        return self._settings()
+
+    def _on_reset(self, answer):
+        if answer.lower() == 'e':
+            self.reset_progress()
+            return self._settings(notice=f"{Fore.GREEN}✓ Veriler sıfırlandı!")
+        return self._settings()
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""EkomCode ilerleme depolama katmanı.
+
+Her öğrencinin ilerlemesi öğrenci kimliğine göre saklanır. Varsayılan
+arka uç WAL kipinde SQLite'tır; tamamlanan dersler bir yazma tamponunda
+biriktirilip tek bir işlemde diske yazılır. Eski tek dosyalık pickle
+biçimi de ayrı bir arka uç olarak desteklenir.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+
+LEGACY_PROGRESS_FILE = "user_progress.pkl"
+DEFAULT_DB_FILE = "ekomcode.db"
+
+# user_data içinde kendi sütunu olan alanlar; geri kalanlar "extra" içinde saklanır
+_CORE_KEYS = ("start_date", "completed_lessons", "current_module", "score")
+
+
+def _now(fmt="%Y-%m-%d %H:%M:%S"):
+    from datetime import datetime
+    return datetime.now().strftime(fmt)
+
+
+def new_progress():
+    """Yeni öğrenci için boş ilerleme kaydı"""
+    return {
+        "start_date": _now(),
+        "completed_lessons": [],
+        "current_module": "python_temelleri",
+        "score": 0
+    }
+
+
+def last_activity(user_data):
+    """Kayıttaki en son çalışma zamanı (tekrar planı ve profil kayıtlarından); bilinmiyorsa None"""
+    from datetime import datetime
+    times = [datetime.fromtimestamp(entry["last"]).strftime("%Y-%m-%d %H:%M:%S")
+             for entry in user_data.get("schedule", {}).values() if "last" in entry]
+    times.extend(run["date"] for runs in user_data.get("profiles", {}).values() for run in runs)
+    return max(times, default=None)
+
+
+def default_learner_id():
+    """Ortamdan öğrenci kimliğini bul"""
+    learner_id = os.environ.get("EKOMCODE_LEARNER")
+    if learner_id:
+        return learner_id
+    try:
+        import getpass
+        return getpass.getuser()
+    except Exception:
+        return "varsayilan"
+
+
+def atomic_write(path, data):
+    """Dosyayı geçici dosya üzerinden atomik olarak değiştir"""
+    directory = os.path.dirname(os.path.abspath(path))
+    tmp_path = os.path.join(directory, f".{os.path.basename(path)}.{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _load_legacy(path):
+    """Eski pickle ilerleme dosyasını oku"""
+    if not os.path.exists(path):
+        return None
+    import pickle
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        return None
+
+
+def _take_legacy(data_dir):
+    """Eski user_progress.pkl dosyasını bir kez içe aktarmak için al"""
+    path = os.path.join(data_dir, LEGACY_PROGRESS_FILE)
+    user_data = _load_legacy(path)
+    if user_data is not None:
+        # Aynı dosya başka bir öğrenciye tekrar aktarılmasın
+        os.replace(path, path + ".migrated")
+    return user_data
+
+
+class ProgressStore:
+    """İlerleme deposu arayüzü"""
+
+    def load(self, learner_id):
+        """Öğrencinin ilerlemesini getir (yoksa yeni kayıt döner)"""
+        raise NotImplementedError
+
+    def save(self, learner_id, user_data):
+        """Öğrencinin özet bilgilerini kaydet"""
+        raise NotImplementedError
+
+    def record_completion(self, learner_id, lesson_key, user_data):
+        """Tamamlanan dersi kaydet"""
+        self.save(learner_id, user_data)
+
+    def reset(self, learner_id, user_data):
+        """Öğrencinin tüm ilerlemesini sil ve yenisini yaz"""
+        raise NotImplementedError
+
+    def migrate_legacy(self, learner_id):
+        """Eski tek kullanıcılı user_progress.pkl dosyasını kaydı olmayan öğrenciye aktar; aktarıldıysa True"""
+        return False
+
+    def learners(self):
+        """Kayıtlı tüm öğrenci kimlikleri"""
+        raise NotImplementedError
+
+    def cohort(self):
+        """Tüm öğrenciler topluca: ([(kimlik, puan, başlangıç, son tamamlama)], [(kimlik, ders)])"""
+        learners, completions = [], []
+        for learner_id in self.learners():
+            user_data = self.load(learner_id)
+            # Tamamlama zamanları tutulmaz; kayıttaki en yeni çalışma zamanı kullanılır
+            learners.append((learner_id, user_data["score"], user_data["start_date"], last_activity(user_data)))
+            completions.extend((learner_id, lesson_key) for lesson_key in user_data["completed_lessons"])
+        return learners, completions
+
+    def iter_learners(self):
+        """(kimlik, puan, başlangıç, son tamamlama) satırları, kimlik sırasıyla"""
+        for learner_id in sorted(self.learners()):
+            user_data = self.load(learner_id)
+            yield learner_id, user_data["score"], user_data["start_date"], last_activity(user_data)
+
+    def iter_completions(self):
+        """(kimlik, ders, tamamlanma zamanı) satırları, kimlik sırasıyla"""
+        for learner_id in sorted(self.learners()):
+            for lesson_key in self.load(learner_id)["completed_lessons"]:
+                yield learner_id, lesson_key, None
+
+    def flush(self):
+        """Bekleyen yazmaları diske aktar"""
+
+    def close(self):
+        """Depoyu kapat"""
+        self.flush()
+
+
+class PickleProgressStore(ProgressStore):
+    """Öğrenci başına bir pickle dosyası tutan depo"""
+
+    def __init__(self, data_dir="."):
+        self.data_dir = data_dir
+        self.progress_dir = os.path.join(data_dir, "progress")
+        os.makedirs(self.progress_dir, exist_ok=True)
+
+    def _path(self, learner_id):
+        safe_id = "".join(c if c.isalnum() or c in "-_." else "_" for c in learner_id)
+        return os.path.join(self.progress_dir, f"{safe_id}.pkl")
+
+    def load(self, learner_id):
+        user_data = _load_legacy(self._path(learner_id))
+        return user_data if user_data is not None else new_progress()
+
+    def migrate_legacy(self, learner_id):
+        if os.path.exists(self._path(learner_id)):
+            return False
+        user_data = _take_legacy(self.data_dir)
+        if user_data is None:
+            return False
+        self.save(learner_id, user_data)
+        return True
+
+    def save(self, learner_id, user_data):
+        import pickle
+        atomic_write(self._path(learner_id), pickle.dumps(user_data))
+
+    def reset(self, learner_id, user_data):
+        self.save(learner_id, user_data)
+
+    def learners(self):
+        for entry in os.scandir(self.progress_dir):
+            if entry.name.endswith(".pkl"):
+                yield entry.name[:-4]
+
+
+class SQLiteProgressStore(ProgressStore):
+    """WAL kipinde SQLite deposu, yazma tamponlu"""
+
+    def __init__(self, data_dir=".", batch_size=32, flush_interval=2.0):
+        self.data_dir = data_dir
+        self.path = os.path.join(data_dir, DEFAULT_DB_FILE)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._lock = threading.RLock()
+        self._pending_rows = {}
+        self._pending_completions = []
+        self._last_flush = time.monotonic()
+
+        os.makedirs(data_dir, exist_ok=True)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS learners (
+                    learner_id TEXT PRIMARY KEY,
+                    start_date TEXT NOT NULL,
+                    current_module TEXT NOT NULL,
+                    score INTEGER NOT NULL DEFAULT 0,
+                    extra TEXT NOT NULL DEFAULT '{}'
+                )""")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS completions (
+                    learner_id TEXT NOT NULL,
+                    lesson_key TEXT NOT NULL,
+                    completed_at TEXT NOT NULL,
+                    PRIMARY KEY (learner_id, lesson_key)
+                ) WITHOUT ROWID""")
+
+    def _row(self, learner_id, user_data):
+        extra = {k: v for k, v in user_data.items() if k not in _CORE_KEYS}
+        return (learner_id, user_data["start_date"], user_data["current_module"],
+                user_data["score"], json.dumps(extra, ensure_ascii=False))
+
+    def migrate_legacy(self, learner_id):
+        with self._lock:
+            self.flush()
+            if self.conn.execute("SELECT 1 FROM learners WHERE learner_id = ?", (learner_id,)).fetchone():
+                return False
+            user_data = _take_legacy(self.data_dir)
+            if user_data is None:
+                return False
+            now = _now()
+            with self.conn:
+                self.conn.execute("INSERT OR REPLACE INTO learners VALUES (?, ?, ?, ?, ?)",
+                                  self._row(learner_id, user_data))
+                self.conn.executemany("INSERT OR IGNORE INTO completions VALUES (?, ?, ?)",
+                                      [(learner_id, key, now) for key in user_data["completed_lessons"]])
+            return True
+
+    def load(self, learner_id):
+        with self._lock:
+            self.flush()
+            row = self.conn.execute(
+                "SELECT start_date, current_module, score, extra FROM learners WHERE learner_id = ?",
+                (learner_id,)).fetchone()
+            if row is None:
+                return new_progress()
+
+            user_data = json.loads(row[3])
+            user_data.update({
+                "start_date": row[0],
+                "current_module": row[1],
+                "score": row[2],
+                "completed_lessons": [key for (key,) in self.conn.execute(
+                    "SELECT lesson_key FROM completions WHERE learner_id = ? ORDER BY completed_at",
+                    (learner_id,))]
+            })
+            return user_data
+
+    def save(self, learner_id, user_data):
+        with self._lock:
+            self._pending_rows[learner_id] = self._row(learner_id, user_data)
+            self._maybe_flush()
+
+    def record_completion(self, learner_id, lesson_key, user_data):
+        with self._lock:
+            now = _now("%Y-%m-%d %H:%M:%S.%f")
+            self._pending_completions.append((learner_id, lesson_key, now))
+            self._pending_rows[learner_id] = self._row(learner_id, user_data)
+            self._maybe_flush()
+
+    def reset(self, learner_id, user_data):
+        with self._lock:
+            self.flush()
+            with self.conn:
+                self.conn.execute("DELETE FROM completions WHERE learner_id = ?", (learner_id,))
+                self.conn.execute("INSERT OR REPLACE INTO learners VALUES (?, ?, ?, ?, ?)",
+                                  self._row(learner_id, user_data))
+
+    def learners(self):
+        self.flush()
+        return [learner_id for (learner_id,) in self.conn.execute("SELECT learner_id FROM learners")]
+
+    @staticmethod
+    def _activity_rows(rows):
+        """(kimlik, puan, başlangıç, son tamamlama, extra) -> son etkinliği birleştirilmiş satırlar"""
+        for learner_id, score, start_date, last_completed, extra in rows:
+            # Diğer depolarla aynı ölçüt: tekrar planı ve profil zamanları, ayrıca tamamlama zamanı
+            last = max(filter(None, (last_completed, last_activity(json.loads(extra)))), default=None)
+            yield learner_id, score, start_date, last
+
+    def cohort(self):
+        # Öğrenci başına load() yerine iki sorgu
+        with self._lock:
+            self.flush()
+            learners = list(self._activity_rows(self.conn.execute("""
+                SELECT l.learner_id, l.score, l.start_date, c.last_completed, l.extra
+                FROM learners l LEFT JOIN (
+                    SELECT learner_id, MAX(completed_at) AS last_completed
+                    FROM completions GROUP BY learner_id
+                ) c USING (learner_id)""")))
+            completions = self.conn.execute("SELECT learner_id, lesson_key FROM completions").fetchall()
+        return learners, completions
+
+    def _stream(self, sql):
+        """Sorguyu ayrı bir okuma bağlantısında imleçle akıt (WAL: yazmaları engellemez)"""
+        self.flush()
+        conn = sqlite3.connect(self.path)
+        try:
+            yield from conn.execute(sql)
+        finally:
+            conn.close()
+
+    def iter_learners(self):
+        # İlişkili alt sorgu birincil anahtarın önekini kullanır; ara tablo oluşmaz
+        return self._activity_rows(self._stream("""
+            SELECT l.learner_id, l.score, l.start_date,
+                   (SELECT MAX(completed_at) FROM completions c WHERE c.learner_id = l.learner_id), l.extra
+            FROM learners l ORDER BY l.learner_id"""))
+
+    def iter_completions(self):
+        # Birincil anahtar sırası: sıralama için geçici tablo gerekmez
+        return self._stream("SELECT learner_id, lesson_key, completed_at FROM completions ORDER BY learner_id")
+
+    def _maybe_flush(self):
+        if (len(self._pending_completions) + len(self._pending_rows) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._pending_rows and not self._pending_completions:
+                return
+            with self.conn:
+                self.conn.executemany("INSERT OR REPLACE INTO learners VALUES (?, ?, ?, ?, ?)",
+                                      self._pending_rows.values())
+                self.conn.executemany("INSERT OR IGNORE INTO completions VALUES (?, ?, ?)",
+                                      self._pending_completions)
+            self._pending_rows.clear()
+            self._pending_completions.clear()
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            self.conn.close()
+
+
+STORES = {
+    "sqlite": SQLiteProgressStore,
+    "pickle": PickleProgressStore
+}
+
+
+def open_store(kind=None, data_dir=None):
+    """Ayarlara göre ilerleme deposunu aç"""
+    kind = kind or os.environ.get("EKOMCODE_STORE", "sqlite")
+    data_dir = data_dir or os.environ.get("EKOMCODE_DATA", ".")
+    if kind not in STORES:
+        raise ValueError(f"Bilinmeyen depo türü: {kind} (seçenekler: {', '.join(STORES)})")
+    return STORES[kind](data_dir)
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""İçerik klasörünü izleyerek yeniden başlatmadan güncelleme.
+
+WatchedContent, ContentPack'in önüne konan bir önbellektir: her kayıt
+ilk okunduğunda çözülür ve bellekte tutulur. Arka plandaki izleyici
+Linux'ta inotify ile (ctypes üzerinden, ek paket gerekmeden) yalnızca
+değişen dosyaların adlarını alır; inotify yoksa os.scandir ile klasörü
+tarayıp dosyaların mtime ve boyutlarını bir önceki taramayla
+karşılaştırır. Yalnızca değişen kayıtlar yeniden çözülür ve önbellekteki
+girdileri yerinde değiştirilir. Katalog dosyası değişmedikçe katalog
+yeniden kurulmaz; oturumlar version/catalog_version sayaçlarına bakarak
+kendi kopyalarını tazeler.
+"""
+
+import os
+import sys
+import struct
+import select
+import threading
+
+from ekom_content import ContentSource, ContentPack, DEFAULT_PACK_DIR, _KINDS
+
+DEFAULT_INTERVAL = 1.0
+
+_MISSING = object()
+_FOLDERS = {folder for folder, _ in _KINDS.values()}
+
+# inotify sabitleri (linux/inotify.h)
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_Q_OVERFLOW = 0x4000
+IN_ISDIR = 0x40000000
+_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+_EVENT = struct.Struct("iIII")
+
+
+def content_key(rel_path):
+    """Paket köküne göre göreli dosya yolunun kayıt anahtarı (içerik dışıysa None)"""
+    if rel_path == "catalog.json":
+        return "catalog"
+    folder, _, name = rel_path.partition("/")
+    for kind, (kind_folder, ext) in _KINDS.items():
+        if folder == kind_folder and name.endswith(ext):
+            return f"{kind}/{name[:-len(ext)]}"
+    return None
+
+
+def _skipped(name):
+    return name.startswith((".", "__"))
+
+
+class Inotify:
+    """İçerik klasörleri üzerinde inotify izleyicisi"""
+
+    def __init__(self, root):
+        import ctypes
+        import ctypes.util
+        self.root = root
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+        # izleme numarası -> paket köküne göre göreli klasör
+        self._dirs = {}
+        self.add_tree("")
+
+    @classmethod
+    def open(cls, root):
+        """Linux dışında ya da inotify kullanılamıyorsa None"""
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            return cls(root)
+        except (OSError, AttributeError):
+            return None
+
+    def _add(self, rel):
+        path = os.path.join(self.root, rel).encode(sys.getfilesystemencoding())
+        wd = self._libc.inotify_add_watch(self.fd, path, _WATCH_MASK)
+        if wd >= 0:
+            self._dirs[wd] = rel
+
+    def add_tree(self, rel):
+        """Klasörü ve alt klasörlerini izlemeye ekle"""
+        self._add(rel)
+        try:
+            entries = list(os.scandir(os.path.join(self.root, rel)))
+        except OSError:
+            return
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False) and not _skipped(entry.name) and (rel or entry.name in _FOLDERS):
+                self.add_tree(f"{rel}/{entry.name}" if rel else entry.name)
+
+    def read(self):
+        """Bekleyen olaylar: (değişen anahtarlar, tam tarama gerekli mi)"""
+        keys, rescan = set(), False
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return keys, rescan
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b"\0")
+            offset += _EVENT.size + length
+            if mask & IN_Q_OVERFLOW:
+                rescan = True
+                continue
+            rel = self._dirs.get(wd)
+            if rel is None or not name:
+                continue
+            name = os.fsdecode(name)
+            path = f"{rel}/{name}" if rel else name
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and not _skipped(name) and (rel or name in _FOLDERS):
+                    # Yeni klasördeki dosyalar izleme eklenmeden önce yazılmış olabilir
+                    self.add_tree(path)
+                    rescan = True
+                continue
+            key = content_key(path)
+            if key is not None:
+                keys.add(key)
+        return keys, rescan
+
+    def close(self):
+        os.close(self.fd)
+
+
+class WatchedContent(ContentSource):
+    """Değişen dosyaları yeniden okuyan, önbellekli içerik kaynağı"""
+
+    def __init__(self, pack=None, interval=DEFAULT_INTERVAL):
+        self.pack = pack if pack is not None else ContentPack(DEFAULT_PACK_DIR)
+        self.root = self.pack.root
+        self.interval = interval
+        self.version = 0
+        self.catalog_version = 0
+        self.mode = None
+        self.on_change = None
+        self._cache = {}
+        self._mtimes = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def get(self, key):
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            with self._lock:
+                value = self._cache.get(key, _MISSING)
+                if value is _MISSING:
+                    value = self._cache[key] = self.pack.get(key)
+        return value
+
+    def stamp(self, key):
+        # Klasördeki dosyanın özeti: build-content ile kurulan indeksle karşılaştırılabilir
+        return self.pack.stamp(key)
+
+    def keys(self):
+        return self.pack.keys()
+
+    def catalog(self):
+        # build_catalog dönen sözlüğe alan ekler; önbellekteki kayıt değişmesin
+        catalog = self.get("catalog")
+        return dict(catalog) if catalog is not None else None
+
+    def scan(self):
+        """Paketteki içerik dosyaları: {anahtar: (mtime_ns, boyut)}"""
+        found = {}
+        stack = [""]
+        while stack:
+            rel = stack.pop()
+            try:
+                entries = os.scandir(os.path.join(self.root, rel))
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if _skipped(entry.name):
+                        continue
+                    path = f"{rel}/{entry.name}" if rel else entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if rel or entry.name in _FOLDERS:
+                            stack.append(path)
+                        continue
+                    key = content_key(path)
+                    if key is None:
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    found[key] = (stat.st_mtime_ns, stat.st_size)
+        return found
+
+    def poll(self):
+        """Klasörü tara ve değişen kayıtları yenile; değişen anahtarları döndür"""
+        found = self.scan()
+        previous, self._mtimes = self._mtimes, found
+        if previous is None:
+            return []
+        changed = [key for key, stamp in found.items() if previous.get(key) != stamp]
+        changed.extend(key for key in previous if key not in found)
+        return self.refresh(changed)
+
+    def refresh(self, keys):
+        """Verilen kayıtları yeniden çöz ve önbellekteki girdileri değiştir"""
+        keys = list(keys)
+        if not keys:
+            return keys
+        with self._lock:
+            for key in keys:
+                # Hiç okunmamış kayıt ilk istendiğinde zaten diskten gelir
+                if key in self._cache:
+                    self._cache[key] = self.pack.get(key)
+            if "catalog" in keys:
+                self.catalog_version += 1
+            self.version += 1
+        if self.on_change is not None:
+            self.on_change(keys)
+        return keys
+
+    def watch(self, on_change=None, inotify=True):
+        """Arka planda izlemeye başla"""
+        self.on_change = on_change
+        watcher = Inotify.open(self.root) if inotify else None
+        self.mode = "inotify" if watcher is not None else "scandir"
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, args=(watcher,), name="ekom-watch", daemon=True)
+        self._thread.start()
+        return self
+
+    def _watch(self, watcher):
+        # Taban tarama: inotify kuyruğu taşarsa karşılaştırma buna göre yapılır
+        self.poll()
+        try:
+            while not self._stop.is_set():
+                if watcher is None:
+                    if not self._stop.wait(self.interval):
+                        self.poll()
+                    continue
+                ready, _, _ = select.select([watcher.fd], [], [], self.interval)
+                if not ready:
+                    continue
+                keys, rescan = watcher.read()
+                if rescan:
+                    self.poll()
+                else:
+                    self.refresh(keys)
+        finally:
+            if watcher is not None:
+                watcher.close()
+
+    def close(self):
+        """İzlemeyi durdur"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
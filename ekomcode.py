@@ -1,65 +1,37 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import time
+
+# Açılış süresi ölçümü (--profile-startup) için zaman damgaları
+_STARTUP_MARKS = [("başlangıç", time.perf_counter())]
+
+def startup_mark(label):
+    """Açılış sürecine bir zaman damgası ekle"""
+    _STARTUP_MARKS.append((label, time.perf_counter()))
+
 import os
 import sys
-import time
-import json
-import pickle
-from datetime import datetime
+from functools import lru_cache
 from colorama import Fore, Back, Style, init
+startup_mark("colorama")
+
+from ekom_storage import open_store, new_progress, default_learner_id, STORES
+startup_mark("ekom_storage")
+from ekom_content import load_content, DEFAULT_PACK_DIR, DEFAULT_BUNDLE
+startup_mark("ekom_content")
+from ekom_render import Renderer, menu_frame
+startup_mark("ekom_render")
+from ekom_progress import LessonIndex, CompletedLessons
 
 # Renkleri başlat
 init(autoreset=True)
+startup_mark("colorama.init")
 
-class EkomCode:
-    def __init__(self):
-        self.user_data = {}
-        self.current_level = "başlangıç"
-        self.progress_file = "user_progress.pkl"
-        self.load_user_progress()
-        
-        # Eğitim içeriği
-        self.modules = {
-            "python_temelleri": {
-                "title": "Python Temelleri",
-                "lessons": {
-                    "degiskenler": "Değişkenler ve Veri Tipleri",
-                    "operatorler": "Operatörler",
-                    "kosul_ifadeleri": "Koşul İfadeleri (if-elif-else)",
-                    "donguler": "Döngüler (for, while)",
-                    "fonksiyonlar": "Fonksiyonlar"
-                }
-            },
-            "otomasyon_egitim": {
-                "title": "Otomasyon Projeleri",
-                "lessons": {
-                    "dosya_okuma": "Dosya Okuma/Yazma Otomasyonu",
-                    "web_otomasyon": "Web Otomasyonu",
-                    "excel_otomasyon": "Excel Otomasyonu",
-                    "mail_otomasyon": "E-posta Otomasyonu",
-                    "veri_cekme": "Web'den Veri Çekme"
-                }
-            },
-            "ornek_projeler": {
-                "title": "Örnek Projeler",
-                "lessons": {
-                    "hesap_makinesi": "Hesap Makinesi",
-                    "todo_app": "Yapılacaklar Listesi",
-                    "password_generator": "Şifre Üretici",
-                    "web_scraper": "Web Kazıyıcı",
-                    "file_organizer": "Dosya Organizatörü"
-                }
-            }
-        }
-
-    def clear_screen(self):
-        """Ekranı temizle"""
-        os.system('cls' if os.name == 'nt' else 'clear')
-
-    def print_header(self):
-        """Başlık yazdır"""
-        header = f"""
+@lru_cache(maxsize=None)
+def header_frame():
+    """Başlık karesi (bir kez kurulur)"""
+    return f"""
 {Fore.CYAN}
 ╔══════════════════════════════════════════════════════════════╗
 ║                   {Fore.YELLOW}E K O M C O D E{Fore.CYAN}                           ║
@@ -67,66 +39,187 @@ class EkomCode:
 ╚══════════════════════════════════════════════════════════════╝
 {Style.RESET_ALL}
         """
-        print(header)
+
+def build_catalog(content):
+    """İçerik kataloğunu toplam ders sayısı ve ders indeksiyle birlikte kur"""
+    version = content.catalog_version
+    catalog = content.catalog()
+    catalog["version"] = version
+    catalog["total_lessons"] = sum(len(module["lessons"]) for module in catalog["modules"].values())
+    catalog["lesson_index"] = LessonIndex(catalog["modules"])
+    return catalog
+
+class EkomCode:
+    def __init__(self, learner_id=None, store=None, content=None, catalog=None, screen=None):
+        # İlerleme, içerik ve çalıştırma havuzu ilk gerektikleri ekranda yüklenir
+        self._user_data = None
+        self.current_level = "başlangıç"
+        self.learner_id = learner_id or default_learner_id()
+        self.store = store or open_store()
+        self._content = content
+        # Sunucuda tüm oturumlar aynı salt okunur kataloğu paylaşır
+        self._catalog = catalog
+        self._executor = None
+        self._scheduler = None
+        self.search_results = []
+        self.screen = screen or Renderer()
+        # Girdileri yük simülasyonunda tekrar oynatmak için kaydeden dosya
+        self.recorder = None
+
+    @property
+    def user_data(self):
+        """Öğrencinin ilerlemesi (ilk erişimde yüklenir)"""
+        if self._user_data is None:
+            self.load_user_progress()
+        return self._user_data
+
+    @user_data.setter
+    def user_data(self, value):
+        # Eski kayıtlardaki ders listesi bit dizisi tabanlı kümeye çevrilir
+        if not isinstance(value["completed_lessons"], CompletedLessons):
+            value["completed_lessons"] = self.lesson_index.completions(value["completed_lessons"])
+        self._user_data = value
+
+    @property
+    def content(self):
+        """Ders içeriği kaynağı (ilk erişimde açılır)"""
+        if self._content is None:
+            self._content = load_content()
+        return self._content
+
+    @property
+    def catalog(self):
+        """Modül kataloğu; toplam ders sayısı bir kez hesaplanır"""
+        if self._catalog is None or self._catalog["version"] != self.content.catalog_version:
+            self.catalog = build_catalog(self.content)
+        return self._catalog
+
+    @catalog.setter
+    def catalog(self, catalog):
+        # Katalog değişince tamamlanan dersler yeni ders indeksine taşınır
+        self._catalog = catalog
+        if self._user_data is not None:
+            completed = self._user_data["completed_lessons"]
+            if completed.index is not catalog["lesson_index"]:
+                self._user_data["completed_lessons"] = catalog["lesson_index"].completions(completed)
+
+    @property
+    def lesson_index(self):
+        return self.catalog["lesson_index"]
+
+    @property
+    def modules(self):
+        return self.catalog["modules"]
+
+    @property
+    def examples(self):
+        return self.catalog["examples"]
+
+    def clear_screen(self):
+        """Ekranı temizle (yeni kareye başla)"""
+        self.screen.clear()
+
+    def prompt(self, text):
+        """Kurulan kareyi ekrana bas ve kullanıcıdan girdi al"""
+        self.screen.present()
+        answer = input(text)
+        if self.recorder is not None:
+            self.recorder.write(answer + "\n")
+        return answer
+
+    def print_header(self):
+        """Başlık yazdır"""
+        self.screen.write(header_frame())
 
     def print_menu(self, title, options):
         """Menü yazdır"""
-        print(f"\n{Fore.GREEN}╔══ {title} {Fore.GREEN}══╗")
-        for key, option in options.items():
-            print(f"║ {Fore.YELLOW}{key}.{Style.RESET_ALL} {option}")
-        print(f"╚{'═' * (len(title) + 8)}╝")
+        for line in menu_frame(title, tuple(options.items())):
+            self.screen.write(line)
 
     def load_user_progress(self):
         """Kullanıcı ilerlemesini yükle"""
-        try:
-            with open(self.progress_file, 'rb') as f:
-                self.user_data = pickle.load(f)
-        except FileNotFoundError:
-            self.user_data = {
-                "start_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "completed_lessons": [],
-                "current_module": "python_temelleri",
-                "score": 0
-            }
+        self.user_data = self.store.load(self.learner_id)
 
     def save_user_progress(self):
         """Kullanıcı ilerlemesini kaydet"""
-        with open(self.progress_file, 'wb') as f:
-            pickle.dump(self.user_data, f)
+        self.store.save(self.learner_id, self.user_data)
+
+    @property
+    def search_index(self):
+        """Arama indeksi (ilk aramada yüklenir, oturumlar arasında paylaşılır)"""
+        catalog = self.catalog
+        version = self.content.version
+        if catalog.get("search_version") != version:
+            from ekom_search import SearchIndex, load_index
+            # İçerik izlenirken değişmişse indeks dosyası eskimiştir
+            catalog["search_index"] = (SearchIndex.build(self.content, catalog) if version
+                                       else load_index(self.content, catalog))
+            catalog["search_version"] = version
+        return catalog["search_index"]
+
+    @property
+    def executor(self):
+        """Kod çalıştırma havuzu (ilk kullanımda başlatılır)"""
+        if self._executor is None:
+            from ekom_executor import ExecutionPool
+            self._executor = ExecutionPool()
+        return self._executor
+
+    @property
+    def scheduler(self):
+        """Tekrar planlayıcısı (ilk öneride kurulur)"""
+        # İlerleme sıfırlanınca ya da katalog değişince tamamlanan dersler nesnesi yenilenir
+        if self._scheduler is None or self._scheduler.completed is not self.user_data["completed_lessons"]:
+            from ekom_schedule import LessonScheduler
+            self._scheduler = LessonScheduler(self.lesson_index, self.user_data)
+        return self._scheduler
+
+    def close(self):
+        """Bekleyen kayıtları yaz, havuzu ve depoyu kapat"""
+        self.save_user_progress()
+        self.store.close()
+        if self._executor is not None:
+            self._executor.shutdown()
 
     def show_progress(self):
         """İlerlemeyi göster"""
         completed = len(self.user_data["completed_lessons"])
-        total = sum(len(module["lessons"]) for module in self.modules.values())
+        total = self.catalog["total_lessons"]
         progress = (completed / total) * 100 if total > 0 else 0
         
-        print(f"\n{Fore.CYAN}╔══════════════ İLERLEME DURUMU ══════════════╗")
-        print(f"║ {Fore.GREEN}Tamamlanan Dersler: {completed}/{total}")
-        print(f"║ {Fore.BLUE}İlerleme: {progress:.1f}%")
-        print(f"║ {Fore.YELLOW}Puan: {self.user_data['score']}")
-        print(f"║ {Fore.MAGENTA}Başlangıç: {self.user_data['start_date']}")
-        print(f"╚═══════════════════════════════════════════════╝")
+        self.screen.write(f"\n{Fore.CYAN}╔══════════════ İLERLEME DURUMU ══════════════╗")
+        self.screen.write(f"║ {Fore.GREEN}Tamamlanan Dersler: {completed}/{total}")
+        self.screen.write(f"║ {Fore.BLUE}İlerleme: {progress:.1f}%")
+        self.screen.write(f"║ {Fore.YELLOW}Puan: {self.user_data['score']}")
+        self.screen.write(f"║ {Fore.MAGENTA}Başlangıç: {self.user_data['start_date']}")
+        self.screen.write(f"╚═══════════════════════════════════════════════╝")
+
+    def draw_main_menu(self):
+        """Ana menü karesini kur"""
+        self.clear_screen()
+        self.print_header()
+        self.show_progress()
+        
+        menu_options = {
+            "1": "Python Temelleri",
+            "2": "Otomasyon Eğitimi", 
+            "3": "Örnek Projeler",
+            "4": "Kod Örneklerini İncele",
+            "5": "Alıştırma Yap",
+            "6": "Ayarlar",
+            "7": "Ders Ara",
+            "8": "Devam Et (sıradaki ders)",
+            "0": "Çıkış"
+        }
+        
+        self.print_menu("ANA MENÜ", menu_options)
 
     def main_menu(self):
         """Ana menü"""
         while True:
-            self.clear_screen()
-            self.print_header()
-            self.show_progress()
-            
-            menu_options = {
-                "1": "Python Temelleri",
-                "2": "Otomasyon Eğitimi", 
-                "3": "Örnek Projeler",
-                "4": "Kod Örneklerini İncele",
-                "5": "Alıştırma Yap",
-                "6": "Ayarlar",
-                "0": "Çıkış"
-            }
-            
-            self.print_menu("ANA MENÜ", menu_options)
+            self.draw_main_menu()
             
-            choice = input(f"\n{Fore.CYAN}Seçiminiz (0-6): {Style.RESET_ALL}")
+            choice = self.prompt(f"\n{Fore.CYAN}Seçiminiz (0-8): {Style.RESET_ALL}")
             
             if choice == "1":
                 self.python_basics_menu()
@@ -140,12 +233,15 @@ class EkomCode:
                 self.practice_exercises()
             elif choice == "6":
                 self.settings_menu()
+            elif choice == "7":
+                self.search_menu()
+            elif choice == "8":
+                self.continue_lesson()
             elif choice == "0":
                 print(f"\n{Fore.GREEN}EkomCode'u kullandığınız için teşekkürler! 🚀")
-                self.save_user_progress()
                 break
             else:
-                input(f"{Fore.RED}Geçersiz seçim! Tekrar deneyin. (Enter)")
+                self.prompt(f"{Fore.RED}Geçersiz seçim! Tekrar deneyin. (Enter)")
 
     def python_basics_menu(self):
         """Python temelleri menüsü"""
@@ -159,25 +255,31 @@ class EkomCode:
         """Projeler menüsü"""
         self.module_menu("ornek_projeler")
 
+    def draw_module_menu(self, module_key):
+        """Modül menüsü karesini kur"""
+        module = self.modules[module_key]
+        self.clear_screen()
+        self.screen.write(f"\n{Fore.CYAN}╔══════════ {module['title']} ══════════╗")
+        
+        completed_lessons = self.user_data["completed_lessons"]
+        for i, (key, lesson) in enumerate(module["lessons"].items(), 1):
+            status = "✓" if key in completed_lessons else " "
+            self.screen.write(f"║ {i}. [{status}] {lesson}")
+        
+        self.screen.write(f"║")
+        self.screen.write(f"║ 0. Ana Menü")
+        self.screen.write(f"╚══════════════════════════════════╝")
+
     def module_menu(self, module_key):
         """Modül menüsünü göster"""
-        module = self.modules[module_key]
+        lessons = self.modules[module_key]["lessons"]
+        self.user_data["current_module"] = module_key
         
         while True:
-            self.clear_screen()
-            print(f"\n{Fore.CYAN}╔══════════ {module['title']} ══════════╗")
-            
-            lessons = module["lessons"]
-            for i, (key, lesson) in enumerate(lessons.items(), 1):
-                status = "✓" if key in self.user_data["completed_lessons"] else " "
-                print(f"║ {i}. [{status}] {lesson}")
-            
-            print(f"║")
-            print(f"║ 0. Ana Menü")
-            print(f"╚══════════════════════════════════╝")
+            self.draw_module_menu(module_key)
             
             try:
-                choice = input(f"\n{Fore.CYAN}Ders seçin (1-{len(lessons)}): {Style.RESET_ALL}")
+                choice = self.prompt(f"\n{Fore.CYAN}Ders seçin (1-{len(lessons)}): {Style.RESET_ALL}")
                 
                 if choice == "0":
                     break
@@ -187,291 +289,271 @@ class EkomCode:
                     lesson_key = list(lessons.keys())[choice_int - 1]
                     self.show_lesson(module_key, lesson_key)
                 else:
-                    input(f"{Fore.RED}Geçersiz seçim! (Enter)")
+                    self.prompt(f"{Fore.RED}Geçersiz seçim! (Enter)")
                     
             except ValueError:
-                input(f"{Fore.RED}Lütfen sayı girin! (Enter)")
+                self.prompt(f"{Fore.RED}Lütfen sayı girin! (Enter)")
 
-    def show_lesson(self, module_key, lesson_key):
-        """Ders içeriğini göster"""
+    def draw_lesson(self, module_key, lesson_key):
+        """Ders karesini kur; dersin örnek kodunu döndürür"""
         self.clear_screen()
         
         lesson_content = self.get_lesson_content(module_key, lesson_key)
         code_example = self.get_code_example(module_key, lesson_key)
         
-        print(f"\n{Fore.CYAN}╔══════════ {lesson_content['title']} ══════════╗")
-        print(f"║{Style.RESET_ALL}")
+        self.screen.write(f"\n{Fore.CYAN}╔══════════ {lesson_content['title']} ══════════╗")
+        self.screen.write(f"║{Style.RESET_ALL}")
         
         # Teori
         for line in lesson_content["theory"]:
-            print(f"║ {line}")
+            self.screen.write(f"║ {line}")
         
-        print(f"║{Style.RESET_ALL}")
-        print(f"║ {Fore.YELLOW}Örnek Kod:{Style.RESET_ALL}")
-        print(f"║{Style.RESET_ALL}")
+        self.screen.write(f"║{Style.RESET_ALL}")
+        self.screen.write(f"║ {Fore.YELLOW}Örnek Kod:{Style.RESET_ALL}")
+        self.screen.write(f"║{Style.RESET_ALL}")
         
         # Kod örneği
         for line in code_example.split('\n'):
-            print(f"║ {Fore.GREEN}{line}{Style.RESET_ALL}")
+            self.screen.write(f"║ {Fore.GREEN}{line}{Style.RESET_ALL}")
         
-        print(f"║{Style.RESET_ALL}")
-        print(f"╚══════════════════════════════════════════╝")
+        self.screen.write(f"║{Style.RESET_ALL}")
+        self.screen.write(f"╚══════════════════════════════════════════╝")
+        return code_example
+
+    def complete_lesson(self, lesson_key):
+        """Dersi tamamlandı olarak işaretle ve puanı ekle"""
+        if self.user_data["completed_lessons"].add(lesson_key):
+            self.user_data["score"] += 10
+            self.store.record_completion(self.learner_id, lesson_key, self.user_data)
+
+    def show_lesson(self, module_key, lesson_key):
+        """Ders içeriğini göster"""
+        code_example = self.draw_lesson(module_key, lesson_key)
         
-        # Kodu çalıştırma seçeneği
-        if lesson_key not in self.user_data["completed_lessons"]:
-            run_code = input(f"\n{Fore.CYAN}Kodu çalıştırmak ister misiniz? (e/h): {Style.RESET_ALL}").lower()
-            if run_code == 'e':
-                self.run_code_example(code_example)
-                self.user_data["completed_lessons"].append(lesson_key)
-                self.user_data["score"] += 10
-                self.save_user_progress()
+        # Kodu çalıştırma seçeneği (p: profil ve bellek raporuyla)
+        completed = lesson_key in self.user_data["completed_lessons"]
+        run_code = self.prompt(self.run_question(completed)).lower()
+        if run_code in ('e', 'p'):
+            result = self.run_code_example(code_example, profile=run_code == 'p', lesson_key=lesson_key)
+            self.schedule_review(lesson_key, result)
+            if not completed:
+                self.complete_lesson(lesson_key)
                 print(f"{Fore.GREEN}✓ Ders tamamlandı! +10 puan")
+            else:
+                self.save_user_progress()
+        elif completed:
+            return
         
-        input(f"\n{Fore.CYAN}Ana menüye dönmek için Enter...{Style.RESET_ALL}")
+        self.prompt(f"\n{Fore.CYAN}Ana menüye dönmek için Enter...{Style.RESET_ALL}")
+
+    def schedule_review(self, lesson_key, result):
+        """Çalıştırma sonucunu planlayıcıya işle; hata veya zaman aşımı dersi erken tekrara alır"""
+        ok = result is not None and not result.error and not result.timed_out
+        self.scheduler.record(lesson_key, ok)
+
+    def next_lesson(self):
+        """Sıradaki ders (modül, ders) ya da None"""
+        lesson_key = self.scheduler.next(self.user_data["current_module"])
+        if lesson_key is None:
+            return None
+        return self.lesson_index.module_of[lesson_key], lesson_key
+
+    def nothing_due_message(self):
+        """Önerilecek ders kalmadığında gösterilen mesaj"""
+        review = self.scheduler.next_review()
+        if review is None:
+            return f"{Fore.GREEN}Tüm dersler tamamlandı!"
+        from datetime import datetime
+        lesson_key, due = review
+        title = self.modules[self.lesson_index.module_of[lesson_key]]["lessons"][lesson_key]
+        return (f"{Fore.GREEN}Tüm dersler tamamlandı. Sıradaki tekrar: {title} "
+                f"({datetime.fromtimestamp(due).strftime('%Y-%m-%d %H:%M')})")
+
+    def continue_lesson(self):
+        """Planlayıcının önerdiği dersi aç"""
+        found = self.next_lesson()
+        if found is None:
+            self.prompt(f"{self.nothing_due_message()} (Enter)")
+            return
+        self.user_data["current_module"] = found[0]
+        self.show_lesson(*found)
+
+    def run_question(self, completed):
+        """Ders ekranının kod çalıştırma sorusu"""
+        if completed:
+            return f"\n{Fore.CYAN}Tekrar çalıştır (e), profilleyerek çalıştır (p) veya dönmek için Enter: {Style.RESET_ALL}"
+        return f"\n{Fore.CYAN}Kodu çalıştırmak ister misiniz? (e/h, p=profilleyerek): {Style.RESET_ALL}"
 
     def get_lesson_content(self, module_key, lesson_key):
         """Ders içeriğini getir"""
-        lessons_content = {
-            "python_temelleri": {
-                "degiskenler": {
-                    "title": "Değişkenler ve Veri Tipleri",
-                    "theory": [
-                        "Değişkenler: Verileri saklamak için kullanılan etiketler",
-                        "Veri Tipleri:",
-                        "  - int: Tam sayılar (5, -3, 100)",
-                        "  - float: Ondalıklı sayılar (3.14, -0.5)",
-                        "  - str: Metinler ('Merhaba', \"Python\")",
-                        "  - bool: Mantıksal değerler (True, False)",
-                        "  - list: Liste [1, 2, 3]",
-                        "  - dict: Sözlük {'isim': 'Ali', 'yas': 25}"
-                    ]
-                },
-                "operatorler": {
-                    "title": "Operatörler",
-                    "theory": [
-                        "Aritmetik Operatörler:",
-                        "  + Toplama, - Çıkarma, * Çarpma, / Bölme",
-                        "  % Mod (kalan), ** Üs, // Tam bölme",
-                        "",
-                        "Karşılaştırma Operatörleri:",
-                        "  == Eşit, != Eşit değil, > Büyük, < Küçük",
-                        "  >= Büyük eşit, <= Küçük eşit",
-                        "",
-                        "Mantıksal Operatörler:",
-                        "  and Ve, or Veya, not Değil"
-                    ]
-                }
-            },
-            "otomasyon_egitim": {
-                "dosya_okuma": {
-                    "title": "Dosya Okuma/Yazma Otomasyonu",
-                    "theory": [
-                        "Dosya işlemleri için open() fonksiyonu kullanılır:",
-                        "Modlar: 'r' okuma, 'w' yazma, 'a' ekleme",
-                        "with open() kullanımı dosyayı otomatik kapatır",
-                        "",
-                        "Önemli Fonksiyonlar:",
-                        "  read(): Tüm dosyayı okur",
-                        "  readline(): Bir satır okur",
-                        "  readlines(): Tüm satırları liste olarak okur",
-                        "  write(): Dosyaya yazar",
-                        "  close(): Dosyayı kapatır"
-                    ]
-                }
-            }
-        }
-        
-        return lessons_content.get(module_key, {}).get(lesson_key, {"title": "Ders", "theory": ["İçerik hazırlanıyor..."]})
+        theory = self.content.theory(module_key, lesson_key)
+        if theory is None:
+            return {"title": "Ders", "theory": ["İçerik hazırlanıyor..."]}
+        return {"title": self.modules[module_key]["lessons"][lesson_key], "theory": theory}
 
     def get_code_example(self, module_key, lesson_key):
         """Kod örneğini getir"""
-        code_examples = {
-            "degiskenler": '''
-# Değişken tanımlama
-isim = "Ahmet"
-yas = 25
-boy = 1.75
-ogrenci = True
-
-# Veri tiplerini yazdırma
-print("İsim:", isim, "Tip:", type(isim))
-print("Yaş:", yas, "Tip:", type(yas))
-print("Boy:", boy, "Tip:", type(boy))
-print("Öğrenci:", ogrenci, "Tip:", type(ogrenci))
-
-# Liste ve sözlük
-meyveler = ["elma", "armut", "muz"]
-kisi = {"ad": "Mehmet", "yas": 30}
-
-print("Meyveler:", meyveler)
-print("Kişi:", kisi)
-''',
-            "operatorler": '''
-# Aritmetik operatörler
-a = 10
-b = 3
-
-print("Toplam:", a + b)
-print("Fark:", a - b)
-print("Çarpım:", a * b)
-print("Bölüm:", a / b)
-print("Tam Bölüm:", a // b)
-print("Kalan:", a % b)
-print("Üs:", a ** b)
-
-# Karşılaştırma operatörleri
-x = 5
-y = 8
-
-print("x == y:", x == y)
-print("x != y:", x != y)
-print("x > y:", x > y)
-print("x < y:", x < y)
-
-# Mantıksal operatörler
-dogru = True
-yanlis = False
-
-print("dogru and yanlis:", dogru and yanlis)
-print("dogru or yanlis:", dogru or yanlis)
-print("not dogru:", not dogru)
-''',
-            "dosya_okuma": '''
-# Dosya yazma
-with open("ornek.txt", "w", encoding="utf-8") as dosya:
-    dosya.write("Merhaba Dünya!\\n")
-    dosya.write("Python ile dosya işlemleri\\n")
-    dosya.write("Otomasyon eğitimi\\n")
-
-print("Dosya yazma tamamlandı!")
-
-# Dosya okuma
-print("\\nDosya içeriği:")
-with open("ornek.txt", "r", encoding="utf-8") as dosya:
-    icerik = dosya.read()
-    print(icerik)
-
-# Satır satır okuma
-print("Satır satır okuma:")
-with open("ornek.txt", "r", encoding="utf-8") as dosya:
-    satirlar = dosya.readlines()
-    for i, satir in enumerate(satirlar, 1):
-        print(f"{i}. satır: {satir.strip()}")
-'''
-        }
-        
-        return code_examples.get(lesson_key, '# Kod örneği hazırlanıyor...')
+        code = self.content.code(module_key, lesson_key)
+        return code if code is not None else '# Kod örneği hazırlanıyor...'
 
-    def run_code_example(self, code):
+    def run_code_example(self, code, profile=False, lesson_key=None):
         """Kod örneğini çalıştır"""
+        self.screen.invalidate()
+        for line in self.run_header_lines():
+            print(line)
         try:
-            print(f"\n{Fore.YELLOW}╔══════════ KOD ÇALIŞTIRILIYOR ══════════╗")
-            print(f"║{Style.RESET_ALL}")
-            exec(code)
-            print(f"║{Style.RESET_ALL}")
-            print(f"╚══════════════════════════════════════════╝")
-        except Exception as e:
+            result = self.executor.run(code, on_output=self._print_output, profile=profile)
+        except RuntimeError as e:
             print(f"{Fore.RED}Hata oluştu: {e}")
+            return None
+        for line in self.run_footer_lines(result, lesson_key):
+            print(line)
+        self.record_profile(lesson_key, result)
+        return result
+
+    def run_header_lines(self):
+        """Kod çalıştırma çerçevesinin üst satırları"""
+        yield f"\n{Fore.YELLOW}╔══════════ KOD ÇALIŞTIRILIYOR ══════════╗"
+        yield f"║{Style.RESET_ALL}"
+
+    def run_footer_lines(self, result, lesson_key=None):
+        """Kod çalıştırma çerçevesinin alt satırları ve sonuç mesajı"""
+        yield f"║{Style.RESET_ALL}"
+        yield f"╚══════════════════════════════════════════╝"
+        if result.profile is not None:
+            yield from self.profile_lines(result.profile, lesson_key)
+        if result.truncated:
+            yield (f"{Fore.YELLOW}Çıktının tamamı gösterilmedi: toplam {result.output_lines} satır, "
+                   f"{result.output_bytes / 1024:.0f} KiB")
+        if result.timed_out:
+            yield f"{Fore.RED}Zaman aşımı: kod {self.executor.limits['wall_time']} saniye içinde bitmedi"
+        elif result.error:
+            yield f"{Fore.RED}Hata oluştu: {result.error}"
+
+    # Ders başına saklanan en fazla profil kaydı
+    PROFILE_HISTORY = 20
+
+    def profile_lines(self, report, lesson_key=None):
+        """Profil raporunun satırları; dersin önceki çalıştırmasıyla karşılaştırır"""
+        yield f"\n{Fore.MAGENTA}╔══════════ PROFİL RAPORU ══════════╗"
+        yield f"║ Süre: {report['wall_time'] * 1000:.1f} ms   Bellek tepe: {report['peak_kib']:.1f} KiB{Style.RESET_ALL}"
+        history = self.user_data.get("profiles", {}).get(lesson_key) if lesson_key else None
+        if history:
+            previous = history[-1]
+            change = (report["wall_time"] * 1000 / previous["wall_ms"] - 1) * 100 if previous["wall_ms"] else 0.0
+            color = Fore.GREEN if change <= 0 else Fore.RED
+            yield (f"║ {color}Önceki çalıştırma ({previous['date']}): {previous['wall_ms']:.1f} ms, "
+                   f"{previous['peak_kib']:.1f} KiB  ({change:+.0f}% süre){Style.RESET_ALL}")
+        yield f"║"
+        yield f"║ {'fonksiyon':<40}{'çağrı':>8}{'kendi ms':>10}{'toplam ms':>11}"
+        for function in report["functions"]:
+            name = function["name"] if len(function["name"]) <= 39 else function["name"][:38] + "…"
+            yield (f"║ {name:<40}{function['calls']:>8}{function['own_time'] * 1000:>10.2f}"
+                   f"{function['total_time'] * 1000:>11.2f}")
+        yield f"╚════════════════════════════════════╝{Style.RESET_ALL}"
+
+    def record_profile(self, lesson_key, result):
+        """Profil sonucunu öğrencinin ders kaydına ekle"""
+        if result is None or result.profile is None or lesson_key is None:
+            return
+        from datetime import datetime
+        history = self.user_data.setdefault("profiles", {}).setdefault(lesson_key, [])
+        history.append({
+            "date": datetime.now().strftime("%Y-%m-%d %H:%M"),
+            "wall_ms": round(result.profile["wall_time"] * 1000, 3),
+            "peak_kib": round(result.profile["peak_kib"], 1),
+            "top": [function["name"] for function in result.profile["functions"][:3]]
+        })
+        del history[:-self.PROFILE_HISTORY]
+        self.save_user_progress()
+
+    def _print_output(self, chunk):
+        """Çalışan kodun çıktısını geldikçe ekrana yaz"""
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
+
+    def draw_search_results(self, query):
+        """Arama sonuçları karesini kur; bulunan belgeleri döndürür"""
+        from ekom_search import snippet
+        self.search_results = [doc for _, doc in self.search_index.search(query, limit=9)]
+        self.clear_screen()
+        self.screen.write(f"\n{Fore.CYAN}╔══════════ ARAMA: {query} ══════════╗")
+        for i, (kind, key, _, title) in enumerate(self.search_results, 1):
+            where = self.modules[key]["title"] if kind == "lesson" else "Kod Örnekleri"
+            self.screen.write(f"║ {Fore.YELLOW}{i}.{Style.RESET_ALL} {title} {Fore.BLUE}({where}){Style.RESET_ALL}")
+            line = snippet(self.content, self.search_results[i - 1], query)
+            if line:
+                self.screen.write(f"║    {Fore.GREEN}{line}{Style.RESET_ALL}")
+        if not self.search_results:
+            self.screen.write(f"║ {Fore.RED}Sonuç bulunamadı{Style.RESET_ALL}")
+        self.screen.write(f"║")
+        self.screen.write(f"║ 0. Ana Menü")
+        self.screen.write(f"╚══════════════════════════════════╝")
+        return self.search_results
+
+    def search_menu(self):
+        """Ders ve kod örneklerinde ara"""
+        query = self.prompt(f"\n{Fore.CYAN}Aranacak kelime (Enter=Ana menü): {Style.RESET_ALL}").strip()
+        if not query:
+            return
+        
+        while True:
+            results = self.draw_search_results(query)
+            choice = self.prompt(f"\n{Fore.CYAN}Açmak için numara (0=Ana menü): {Style.RESET_ALL}")
+            
+            if choice == "0":
+                break
+            elif choice.isdigit() and 1 <= int(choice) <= len(results):
+                kind, key, detail, _ = results[int(choice) - 1]
+                if kind == "lesson":
+                    self.show_lesson(key, detail)
+                else:
+                    self.show_code_example(key)
+            else:
+                self.prompt(f"{Fore.RED}Geçersiz seçim! (Enter)")
+
+    def draw_code_examples(self):
+        """Kod örnekleri menüsü karesini kur"""
+        self.clear_screen()
+        self.print_menu("KOD ÖRNEKLERİ", {key: example["title"] for key, example in self.examples.items()})
 
     def code_examples(self):
         """Kod örneklerini incele"""
-        examples = {
-            "1": "Web Scraping Örneği",
-            "2": "Excel Otomasyonu", 
-            "3": "E-posta Gönderme",
-            "4": "Dosya Organizatörü",
-            "5": "Veritabanı İşlemleri"
-        }
-        
         while True:
-            self.clear_screen()
-            self.print_menu("KOD ÖRNEKLERİ", examples)
+            self.draw_code_examples()
             
-            choice = input(f"\n{Fore.CYAN}Seçiminiz (1-5, 0=Ana menü): {Style.RESET_ALL}")
+            choice = self.prompt(f"\n{Fore.CYAN}Seçiminiz (1-5, 0=Ana menü): {Style.RESET_ALL}")
             
             if choice == "0":
                 break
-            elif choice in examples:
+            elif choice in self.examples:
                 self.show_code_example(choice)
             else:
-                input(f"{Fore.RED}Geçersiz seçim! (Enter)")
+                self.prompt(f"{Fore.RED}Geçersiz seçim! (Enter)")
 
-    def show_code_example(self, example_key):
-        """Kod örneğini göster"""
-        examples = {
-            "1": '''
-# Web Scraping Örneği
-import requests
-from bs4 import BeautifulSoup
-
-def basit_scraper(url):
-    try:
-        response = requests.get(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Başlıkları al
-        basliklar = soup.find_all('h1')[:3]
-        print("Sayfa Başlıkları:")
-        for baslik in basliklar:
-            print(f"- {baslik.text.strip()}")
-            
-    except Exception as e:
-        print(f"Hata: {e}")
-
-# Kullanım
-basit_scraper("https://example.com")
-''',
-            "2": '''
-# Excel Otomasyonu
-import openpyxl
-from openpyxl import Workbook
-
-def excel_olustur():
-    # Yeni workbook oluştur
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Veriler"
-    
-    # Başlıklar
-    ws['A1'] = 'İsim'
-    ws['B1'] = 'Yaş'
-    ws['C1'] = 'Şehir'
-    
-    # Veriler
-    veriler = [
-        ['Ahmet', 25, 'İstanbul'],
-        ['Ayşe', 30, 'Ankara'],
-        ['Mehmet', 35, 'İzmir']
-    ]
-    
-    for i, veri in enumerate(veriler, 2):
-        ws[f'A{i}'] = veri[0]
-        ws[f'B{i}'] = veri[1]
-        ws[f'C{i}'] = veri[2]
-    
-    # Kaydet
-    wb.save('ornek_veriler.xlsx')
-    print("Excel dosyası oluşturuldu: ornek_veriler.xlsx")
-
-excel_olustur()
-'''
-        }
-        
+    def draw_code_example(self, example_key):
+        """Kod örneği karesini kur"""
         self.clear_screen()
-        print(f"\n{Fore.CYAN}╔══════════ KOD ÖRNEĞİ ══════════╗")
-        print(f"║{Style.RESET_ALL}")
+        self.screen.write(f"\n{Fore.CYAN}╔══════════ KOD ÖRNEĞİ ══════════╗")
+        self.screen.write(f"║{Style.RESET_ALL}")
         
-        code = examples.get(example_key, "# Örnek hazırlanıyor...")
+        example = self.examples.get(example_key)
+        code = self.content.example(example["key"]) if example else None
+        if code is None:
+            code = "# Örnek hazırlanıyor..."
         for line in code.split('\n'):
-            print(f"║ {Fore.GREEN}{line}{Style.RESET_ALL}")
-        
-        print(f"║{Style.RESET_ALL}")
-        print(f"╚══════════════════════════════════╝")
+            self.screen.write(f"║ {Fore.GREEN}{line}{Style.RESET_ALL}")
         
-        input(f"\n{Fore.CYAN}Devam etmek için Enter...{Style.RESET_ALL}")
+        self.screen.write(f"║{Style.RESET_ALL}")
+        self.screen.write(f"╚══════════════════════════════════╝")
 
-    def practice_exercises(self):
-        """Alıştırmalar"""
+    def show_code_example(self, example_key):
+        """Kod örneğini göster"""
+        self.draw_code_example(example_key)
+        self.prompt(f"\n{Fore.CYAN}Devam etmek için Enter...{Style.RESET_ALL}")
+
+    def draw_practice_menu(self):
+        """Alıştırmalar menüsü karesini kur"""
         exercises = {
             "1": "Hesap Makinesi Yapımı",
             "2": "Şifre Üretici",
@@ -480,128 +562,102 @@ excel_olustur()
         
         self.clear_screen()
         self.print_menu("ALIŞTIRMALAR", exercises)
+
+    def practice_exercises(self):
+        """Alıştırmalar"""
+        self.draw_practice_menu()
         
-        choice = input(f"\n{Fore.CYAN}Seçiminiz (1-3): {Style.RESET_ALL}")
+        choice = self.prompt(f"\n{Fore.CYAN}Seçiminiz (1-3): {Style.RESET_ALL}")
         
         if choice == "1":
             self.calculator_exercise()
         elif choice == "2":
             self.password_generator_exercise()
         else:
-            input(f"{Fore.YELLOW}Bu alıştırma yakında eklenecek! (Enter)")
+            self.prompt(f"{Fore.YELLOW}Bu alıştırma yakında eklenecek! (Enter)")
+
+    # Alıştırma anahtarı -> (başlık, görev, ipucu)
+    EXERCISES = {
+        "hesap_makinesi": ("HESAP MAKİNESİ ALIŞTIRMASI",
+                           "Görev: Menüde 4 işlemi ve '5. Çıkış' seçeneğini gösteren, sonucu satır sonunda yazan bir hesap makinesi yapın",
+                           "İpucu: input(), if-elif-else, float() kullanın"),
+        "sifre_uretici": ("ŞİFRE ÜRETİCİ ALIŞTIRMASI",
+                          "Görev: Girilen uzunlukta 5 şifre üretip '1. şifre' biçiminde yazdırın "
+                          "(küçük/büyük harf, rakam ve noktalama içersin)",
+                          "İpucu: random modülü, string modülü kullanın")
+    }
+
+    def draw_exercise(self, exercise_key):
+        """Alıştırma görevi karesini kur"""
+        title, task, hint = self.EXERCISES[exercise_key]
+        self.clear_screen()
+        self.screen.write(f"\n{Fore.CYAN}╔══════════ {title} ══════════╗")
+        self.screen.write(f"║{Style.RESET_ALL}")
+        self.screen.write(f"║ {Fore.YELLOW}{task}{Style.RESET_ALL}")
+        self.screen.write(f"║ {Fore.GREEN}{hint}{Style.RESET_ALL}")
+        self.screen.write(f"║{Style.RESET_ALL}")
+        self.screen.write(f"╚══════════════════════════════════════════════════╝")
+
+    def solution_lines(self, exercise_key):
+        """Alıştırma çözümünün renklendirilmiş satırları"""
+        solution = self.content.exercise(exercise_key)
+        yield f"\n{Fore.GREEN}Çözüm:{Style.RESET_ALL}"
+        for line in solution.split('\n'):
+            yield f"{Fore.CYAN}{line}{Style.RESET_ALL}"
+
+    def grade_exercise(self, exercise_key, path):
+        """Öğrencinin çözüm dosyasını sına, puanı ilerlemeye ekle; sonuç satırlarını döndür"""
+        from ekom_grader import Grader, credit, grade_lines
+        try:
+            with open(os.path.expanduser(path), encoding="utf-8") as f:
+                code = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            return [f"{Fore.RED}Dosya okunamadı: {e}"]
+        grader = Grader(self.content, pool=self.executor)
+        grade = grader.grade(code, exercise_key, self.learner_id)
+        lines = list(grade_lines(grade))
+        gained = credit(self.user_data, grade)
+        if gained:
+            self.save_user_progress()
+            lines.append(f"{Fore.GREEN}✓ +{gained} puan")
+        return lines
+
+    def show_exercise(self, exercise_key):
+        """Alıştırmayı göster; çözüm dosyası verilirse sına, yoksa örnek çözümü yazdır"""
+        self.draw_exercise(exercise_key)
+        path = self.prompt(f"\n{Fore.CYAN}Çözüm dosyanızın yolu (Enter=örnek çözümü göster): {Style.RESET_ALL}")
+        
+        self.screen.invalidate()
+        lines = self.grade_exercise(exercise_key, path.strip()) if path.strip() else self.solution_lines(exercise_key)
+        for line in lines:
+            print(line)
+        self.prompt(f"\n{Fore.CYAN}Devam etmek için Enter...{Style.RESET_ALL}")
 
     def calculator_exercise(self):
         """Hesap makinesi alıştırması"""
-        print(f"\n{Fore.CYAN}╔══════════ HESAP MAKİNESİ ALIŞTIRMASI ══════════╗")
-        print(f"║{Style.RESET_ALL}")
-        print(f"║ {Fore.YELLOW}Görev: 4 işlem yapan basit bir hesap makinesi yapın{Style.RESET_ALL}")
-        print(f"║ {Fore.GREEN}İpucu: input(), if-elif-else, float() kullanın{Style.RESET_ALL}")
-        print(f"║{Style.RESET_ALL}")
-        print(f"╚══════════════════════════════════════════════════╝")
-        
-        input(f"\n{Fore.CYAN}Çözümü görmek için Enter...{Style.RESET_ALL}")
-        
-        solution = '''
-# Hesap Makinesi Çözümü
-while True:
-    print("\\n--- Hesap Makinesi ---")
-    print("1. Toplama")
-    print("2. Çıkarma") 
-    print("3. Çarpma")
-    print("4. Bölme")
-    print("5. Çıkış")
-    
-    secim = input("Seçiminiz (1-5): ")
-    
-    if secim == '5':
-        print("Güle güle!")
-        break
-    
-    if secim in ['1', '2', '3', '4']:
-        try:
-            sayi1 = float(input("İlk sayı: "))
-            sayi2 = float(input("İkinci sayı: "))
-            
-            if secim == '1':
-                sonuc = sayi1 + sayi2
-                print(f"Sonuç: {sayi1} + {sayi2} = {sonuc}")
-            elif secim == '2':
-                sonuc = sayi1 - sayi2
-                print(f"Sonuç: {sayi1} - {sayi2} = {sonuc}")
-            elif secim == '3':
-                sonuc = sayi1 * sayi2
-                print(f"Sonuç: {sayi1} × {sayi2} = {sonuc}")
-            elif secim == '4':
-                if sayi2 != 0:
-                    sonuc = sayi1 / sayi2
-                    print(f"Sonuç: {sayi1} ÷ {sayi2} = {sonuc}")
-                else:
-                    print("Hata: Sıfıra bölünemez!")
-        except ValueError:
-            print("Hata: Geçerli sayı girin!")
-    else:
-        print("Geçersiz seçim!")
-'''
-        print(f"\n{Fore.GREEN}Çözüm:{Style.RESET_ALL}")
-        for line in solution.split('\n'):
-            print(f"{Fore.CYAN}{line}{Style.RESET_ALL}")
+        self.show_exercise("hesap_makinesi")
 
     def password_generator_exercise(self):
         """Şifre üretici alıştırması"""
-        print(f"\n{Fore.CYAN}╔══════════ ŞİFRE ÜRETİCİ ALIŞTIRMASI ══════════╗")
-        print(f"║{Style.RESET_ALL}")
-        print(f"║ {Fore.YELLOW}Görev: Rastgele şifre üreten program yapın{Style.RESET_ALL}")
-        print(f"║ {Fore.GREEN}İpucu: random modülü, string modülü kullanın{Style.RESET_ALL}")
-        print(f"║{Style.RESET_ALL}")
-        print(f"╚══════════════════════════════════════════════════╝")
-        
-        input(f"\n{Fore.CYAN}Çözümü görmek için Enter...{Style.RESET_ALL}")
+        self.show_exercise("sifre_uretici")
+
+    def draw_settings_menu(self):
+        """Ayarlar menüsü karesini kur"""
+        self.clear_screen()
+        settings = {
+            "1": "Kullanıcı İstatistikleri",
+            "2": "Verileri Sıfırla",
+            "0": "Ana Menü"
+        }
         
-        solution = '''
-# Şifre Üretici Çözümü
-import random
-import string
-
-def sifre_uret(uzunluk=12):
-    # Tüm karakterleri birleştir
-    tum_karakterler = string.ascii_letters + string.digits + string.punctuation
-    
-    # Rastgele şifre oluştur
-    sifre = ''.join(random.choice(tum_karakterler) for i in range(uzunluk))
-    return sifre
-
-# Kullanım
-print("Rastgele Şifreler:")
-for i in range(5):
-    sifre = sifre_uret(10)
-    print(f"{i+1}. {sifre}")
-
-# Sadece harf ve rakam
-def basit_sifre_uret(uzunluk=8):
-    karakterler = string.ascii_letters + string.digits
-    return ''.join(random.choice(karakterler) for i in range(uzunluk))
-
-print("\\nBasit Şifreler:")
-for i in range(3):
-    print(f"{i+1}. {basit_sifre_uret(6)}")
-'''
-        print(f"\n{Fore.GREEN}Çözüm:{Style.RESET_ALL}")
-        for line in solution.split('\n'):
-            print(f"{Fore.CYAN}{line}{Style.RESET_ALL}")
+        self.print_menu("AYARLAR", settings)
 
     def settings_menu(self):
         """Ayarlar menüsü"""
         while True:
-            self.clear_screen()
-            settings = {
-                "1": "Kullanıcı İstatistikleri",
-                "2": "Verileri Sıfırla",
-                "0": "Ana Menü"
-            }
+            self.draw_settings_menu()
             
-            self.print_menu("AYARLAR", settings)
-            
-            choice = input(f"\n{Fore.CYAN}Seçiminiz: {Style.RESET_ALL}")
+            choice = self.prompt(f"\n{Fore.CYAN}Seçiminiz: {Style.RESET_ALL}")
             
             if choice == "1":
                 self.show_statistics()
@@ -610,55 +666,366 @@ for i in range(3):
             elif choice == "0":
                 break
             else:
-                input(f"{Fore.RED}Geçersiz seçim! (Enter)")
+                self.prompt(f"{Fore.RED}Geçersiz seçim! (Enter)")
 
-    def show_statistics(self):
-        """İstatistikleri göster"""
+    def draw_statistics(self):
+        """İstatistikler karesini kur"""
         self.clear_screen()
         completed = len(self.user_data["completed_lessons"])
-        total_lessons = sum(len(module["lessons"]) for module in self.modules.values())
+        total_lessons = self.catalog["total_lessons"]
         
-        print(f"\n{Fore.CYAN}╔══════════════ İSTATİSTİKLER ══════════════╗")
-        print(f"║ {Fore.GREEN}Toplam Ders: {total_lessons}")
-        print(f"║ {Fore.BLUE}Tamamlanan: {completed}")
-        print(f"║ {Fore.YELLOW}Tamamlanma Oranı: {(completed/total_lessons)*100:.1f}%")
-        print(f"║ {Fore.MAGENTA}Toplam Puan: {self.user_data['score']}")
-        print(f"║ {Fore.CYAN}Başlangıç Tarihi: {self.user_data['start_date']}")
+        self.screen.write(f"\n{Fore.CYAN}╔══════════════ İSTATİSTİKLER ══════════════╗")
+        self.screen.write(f"║ {Fore.GREEN}Toplam Ders: {total_lessons}")
+        self.screen.write(f"║ {Fore.BLUE}Tamamlanan: {completed}")
+        self.screen.write(f"║ {Fore.YELLOW}Tamamlanma Oranı: {(completed/total_lessons)*100:.1f}%")
+        self.screen.write(f"║ {Fore.MAGENTA}Toplam Puan: {self.user_data['score']}")
+        self.screen.write(f"║ {Fore.CYAN}Başlangıç Tarihi: {self.user_data['start_date']}")
         
         # Modül bazlı istatistikler
-        print(f"║")
-        print(f"║ {Fore.WHITE}Modül İlerlemeleri:")
+        self.screen.write(f"║")
+        self.screen.write(f"║ {Fore.WHITE}Modül İlerlemeleri:")
+        completed_lessons = self.user_data["completed_lessons"]
         for module_key, module in self.modules.items():
-            mod_completed = sum(1 for lesson in module["lessons"] if lesson in self.user_data["completed_lessons"])
-            mod_total = len(module["lessons"])
-            print(f"║   {module['title']}: {mod_completed}/{mod_total}")
+            mod_completed = completed_lessons.module_completed(module_key)
+            mod_total = completed_lessons.module_total(module_key)
+            self.screen.write(f"║   {module['title']}: {mod_completed}/{mod_total}")
         
-        print(f"╚═══════════════════════════════════════════════╝")
-        
-        input(f"\n{Fore.CYAN}Devam etmek için Enter...{Style.RESET_ALL}")
+        self.screen.write(f"╚═══════════════════════════════════════════════╝")
+
+    def show_statistics(self):
+        """İstatistikleri göster"""
+        self.draw_statistics()
+        self.prompt(f"\n{Fore.CYAN}Devam etmek için Enter...{Style.RESET_ALL}")
+
+    def reset_progress(self):
+        """Öğrencinin tüm ilerlemesini sil"""
+        self.user_data = new_progress()
+        self.store.reset(self.learner_id, self.user_data)
 
     def reset_data(self):
         """Verileri sıfırla"""
-        confirm = input(f"\n{Fore.RED}Tüm verileriniz silinecek! Emin misiniz? (e/h): {Style.RESET_ALL}").lower()
+        confirm = self.prompt(f"\n{Fore.RED}Tüm verileriniz silinecek! Emin misiniz? (e/h): {Style.RESET_ALL}").lower()
         if confirm == 'e':
-            self.user_data = {
-                "start_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "completed_lessons": [],
-                "current_module": "python_temelleri",
-                "score": 0
-            }
-            self.save_user_progress()
+            self.reset_progress()
             print(f"{Fore.GREEN}✓ Veriler sıfırlandı!")
             time.sleep(2)
 
+def parse_args(argv=None):
+    """Komut satırı seçeneklerini oku"""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        # Seçeneksiz açılışta argparse yüklenmez
+        from types import SimpleNamespace
+        return SimpleNamespace(learner=None, store=None, data_dir=None, record=None, metrics=None,
+                               profile_startup=False, watch=False, command=None)
+
+    import argparse
+    parser = argparse.ArgumentParser(prog="ekomcode", description="EkomCode Python eğitim platformu")
+    parser.add_argument("--learner", help="öğrenci kimliği (varsayılan: EKOMCODE_LEARNER veya sistem kullanıcısı)")
+    parser.add_argument("--store", choices=sorted(STORES), help="ilerleme deposu (varsayılan: sqlite)")
+    parser.add_argument("--data-dir", help="ilerleme verilerinin saklanacağı klasör")
+    parser.add_argument("--record", metavar="DOSYA",
+                        help="girilen her satırı dosyaya kaydet (loadgen ile tekrar oynatılabilir)")
+    parser.add_argument("--metrics", metavar="DOSYA",
+                        help="sayaç ve gecikme ölçümlerini çıkışta dosyaya yaz (.json veya Prometheus metni)")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="ilk ekran çizilene kadar geçen süreyi adım adım raporla ve çık")
+    parser.add_argument("--watch", action="store_true",
+                        help="içerik klasörünü izle; değişen dersler yeniden başlatmadan yüklenir")
+    commands = parser.add_subparsers(dest="command")
+
+    build = commands.add_parser("build-content", help="içerik paketini ikili dosyaya ve arama indeksine derle")
+    build.add_argument("--pack", default=DEFAULT_PACK_DIR, help="içerik klasörü")
+    build.add_argument("--out", default=DEFAULT_BUNDLE, help="çıktı dosyası")
+    build.add_argument("--index", help="arama indeksi dosyası (varsayılan: search.index)")
+
+    selftest = commands.add_parser("selftest", help="tüm kod parçalarını etkileşimsiz olarak sına")
+    selftest.add_argument("--workers", type=int, help="paralel işçi sayısı")
+    selftest.add_argument("--timeout", type=int, default=10, help="parça başına süre sınırı (saniye)")
+    selftest.add_argument("-v", "--verbose", action="store_true", help="başarısız parçaların çıktısını göster")
+
+    serve = commands.add_parser("serve", help="telnet uyumlu çok kullanıcılı sunucu başlat "
+                                              "(kimlik doğrulama yok; yalnızca güvenilir ağlar için)")
+    serve.add_argument("--host", default="127.0.0.1", help="dinlenecek adres (yalnızca güvenilir ağlarda "
+                                                          "127.0.0.1 dışına açın)")
+    serve.add_argument("--port", type=int, default=2323, help="dinlenecek port")
+    serve.add_argument("--max-sessions", type=int, default=1000, help="aynı anda en fazla oturum sayısı")
+    serve.add_argument("--idle-timeout", type=int, default=900, help="boşta kalan oturumun kapatılma süresi (saniye)")
+
+    search = commands.add_parser("search", help="derslerde ve kod örneklerinde ara")
+    search.add_argument("query", help="aranacak kelimeler (önek yeterli, ör. 'değiş')")
+    search.add_argument("--limit", type=int, default=10, help="gösterilecek sonuç sayısı")
+    search.add_argument("--rebuild", action="store_true", help="indeks dosyasını kullanmadan baştan kur")
+
+    loadgen = commands.add_parser("loadgen", help="başsız oturumlarla yük simülasyonu çalıştır")
+    loadgen.add_argument("scripts", nargs="*", help="kayıtlı girdi betikleri (--record); verilmezse rastgele gezinme")
+    loadgen.add_argument("--sessions", type=int, default=1000, help="simüle edilecek oturum sayısı")
+    loadgen.add_argument("--workers", type=int, help="paralel süreç sayısı")
+    loadgen.add_argument("--steps", type=int, default=50, help="oturum başına en fazla adım")
+    loadgen.add_argument("--seed", type=int, default=1234, help="rastgele gezinme tohumu")
+    loadgen.add_argument("--pack", help="içerik klasörü (varsayılan: kurulu içerik)")
+    loadgen.add_argument("--exec", action="store_true", help="ders kodlarını gerçekten çalıştır")
+    loadgen.add_argument("--json", help="sonuç raporunu JSON olarak yaz")
+
+    analytics = commands.add_parser("analytics", help="tüm öğrencilerin ilerleme istatistikleri")
+    analytics.add_argument("--top", type=int, default=10, help="sıralama ve listelerde gösterilecek kayıt sayısı")
+    analytics.add_argument("--stalled-days", type=int, default=14,
+                           help="bu kadar gündür ders bitirmeyen öğrenci takılmış sayılır")
+    analytics.add_argument("--backend", choices=("auto", "numpy", "bitset"), default="auto",
+                           help="matris gösterimi (auto: numpy kuruluysa numpy)")
+    analytics.add_argument("--json", help="sonuç raporunu JSON olarak yaz")
+
+    scrape = commands.add_parser("scrape", help="sayfaları eşzamanlı kazı (adres yoksa yerel sunucuda hız ölçümü)")
+    scrape.add_argument("urls", nargs="*", help="kazınacak adresler")
+    scrape.add_argument("--pages", type=int, default=500, help="hız ölçümünde indirilecek sayfa sayısı")
+    scrape.add_argument("--concurrency", type=int, default=64, help="aynı anda en fazla istek")
+    scrape.add_argument("--per-host", type=int, default=8, help="sunucu başına aynı anda en fazla istek")
+    scrape.add_argument("--retries", type=int, default=3, help="başarısız istek için yeniden deneme sayısı")
+    scrape.add_argument("--rate", type=float, help="sunucu başına saniyede en fazla istek")
+    scrape.add_argument("--json", help="sonuç raporunu JSON olarak yaz")
+
+    bigfile = commands.add_parser("bigfile", help="büyük dosya işleme yöntemlerini karşılaştır")
+    bigfile.add_argument("path", nargs="?", help="işlenecek dosya (verilmezse test günlüğü üretilir)")
+    bigfile.add_argument("--size-mb", type=int, default=200, help="üretilecek test günlüğünün boyutu (MiB)")
+    bigfile.add_argument("--pattern", default="ERROR", help="sayılacak metin")
+    bigfile.add_argument("--methods", nargs="+", choices=("read_all", "lines", "chunks", "mmap", "parallel"),
+                         help="karşılaştırılacak yöntemler (varsayılan: hepsi)")
+    bigfile.add_argument("--workers", type=int, help="paralel yöntemdeki süreç sayısı")
+    bigfile.add_argument("--keep", action="store_true", help="üretilen test günlüğünü silme")
+    bigfile.add_argument("--json", help="sonuç raporunu JSON olarak yaz")
+
+    organize = commands.add_parser("organize", help="dosyaları türe/tarihe göre klasörle, kopyaları bul")
+    organize.add_argument("root", nargs="?", help="düzenlenecek klasör (verilmezse deneme ağacında hız ölçümü)")
+    organize.add_argument("--by", choices=("type", "ext", "date"), default="type",
+                          help="klasörleme ölçütü: tür, uzantı ya da değişiklik tarihi (YYYY/AA)")
+    organize.add_argument("--apply", action="store_true", help="planı uygula (varsayılan: kuru çalıştırma)")
+    organize.add_argument("--duplicates", action="store_true", help="kopyaları bulup Kopyalar klasörüne ayır")
+    organize.add_argument("--no-recursive", action="store_true", help="alt klasörlere inme")
+    organize.add_argument("--workers", type=int, help="özetleme iş parçacığı sayısı")
+    organize.add_argument("--files", type=int, default=20000, help="hız ölçümündeki dosya sayısı")
+    organize.add_argument("--json", help="sonuç raporunu JSON olarak yaz")
+
+    db = commands.add_parser("db", help="CSV ya da ilerleme verisini SQLite'a toplu yükle (verilmezse hız ölçümü)")
+    db.add_argument("csv", nargs="?", help="yüklenecek CSV dosyası (ilk satır sütun adları)")
+    db.add_argument("--db", dest="db_path", help="hedef SQLite dosyası")
+    db.add_argument("--table", help="tablo adı (varsayılan: dosya adı)")
+    db.add_argument("--index", action="append", default=[], help="yüklemeden sonra dizin kurulacak sütun")
+    db.add_argument("--replace", action="store_true", help="tablo zaten varsa silip yeniden yükle")
+    db.add_argument("--progress", action="store_true", help="ilerleme deposundaki tüm öğrencileri yükle")
+    db.add_argument("--rows", type=int, default=1_000_000, help="hız ölçümündeki satır sayısı")
+    db.add_argument("--methods", nargs="+", choices=("autocommit", "transaction", "indexed", "bulk"),
+                    help="karşılaştırılacak ekleme yöntemleri (varsayılan: hepsi)")
+    db.add_argument("--json", help="sonuç raporunu JSON olarak yaz")
+
+    mail = commands.add_parser("mail", help="haftalık ilerleme raporlarını e-postayla gönder "
+                                             "(sunucu yoksa yerel SMTP sunucusunda hız ölçümü)")
+    mail.add_argument("--host", help="SMTP sunucusu")
+    mail.add_argument("--port", type=int, default=25, help="SMTP bağlantı noktası")
+    mail.add_argument("--starttls", action="store_true", help="bağlantıyı STARTTLS ile şifrele")
+    mail.add_argument("--user", help="SMTP kullanıcı adı (parola: EKOMCODE_SMTP_PASSWORD)")
+    mail.add_argument("--from", dest="sender", default="ekomcode@ornek.com", help="gönderen adresi")
+    mail.add_argument("--domain", help="alıcı adresi: <öğrenci>@<alan adı> (kimliği adres olmayan öğrenciler "
+                                         "için --host ile zorunlu)")
+    mail.add_argument("--workers", type=int, default=4, help="aynı anda açık SMTP bağlantısı")
+    mail.add_argument("--rate", type=float, help="saniyede en fazla ileti")
+    mail.add_argument("--retries", type=int, default=3, help="geçici hatada yeniden deneme sayısı")
+    mail.add_argument("--limit", type=int, help="en fazla bu kadar öğrenciye gönder")
+    mail.add_argument("--dry-run", action="store_true", help="ilk raporu göster, gönderme")
+    mail.add_argument("--messages", type=int, default=1000, help="hız ölçümündeki ileti sayısı")
+    mail.add_argument("--latency", type=float, default=0.002, help="hız ölçümünde yerel sunucunun tur gecikmesi (s)")
+    mail.add_argument("--json", help="sonuç raporunu JSON olarak yaz")
+
+    export = commands.add_parser("export", help="ilerleme ve istatistikleri Excel (.xlsx) ya da CSV olarak dışa aktar")
+    export.add_argument("path", help="hedef dosya: .xlsx (openpyxl gerekir) ya da .csv")
+    export.add_argument("--events", action="store_true", help="tamamlanan her ders için bir satırlık sayfa ekle")
+    export.add_argument("--sample", type=int, help="depo yerine bu kadar öğrencilik yapay kohort yaz (hız ölçümü)")
+    export.add_argument("--json", help="sonuç raporunu JSON olarak yaz")
+
+    grade = commands.add_parser("grade", help="alıştırma çözümlerini sınayıp puanla")
+    grade.add_argument("exercise", help="alıştırma anahtarı (ör. hesap_makinesi)")
+    grade.add_argument("paths", nargs="*",
+                       help="çözüm dosyaları veya klasörleri; öğrenci kimliği dosya adıdır (verilmezse örnek çözüm)")
+    grade.add_argument("--workers", type=int, help="paralel işçi sayısı")
+    grade.add_argument("--timeout", type=int, default=5, help="sınama başına süre sınırı (saniye)")
+    grade.add_argument("--credit", action="store_true", help="kazanılan puanları öğrencilerin ilerlemesine ekle")
+    grade.add_argument("-v", "--verbose", action="store_true", help="sınama başına sonuçları göster")
+    grade.add_argument("--json", help="sonuç raporunu JSON olarak yaz")
+
+    bench = commands.add_parser("bench", help="performans ölçümlerini çalıştır")
+    bench.add_argument("pattern", nargs="?", default="*", help="ölçüm adı deseni (ör. 'storage.*')")
+    bench.add_argument("--quick", action="store_true", help="daha az tekrarla hızlı çalıştır")
+    bench.add_argument("--baseline", help="karşılaştırılacak temel değer dosyası (JSON; varsayılan: varsa "
+                                          "bench_baseline.json)")
+    bench.add_argument("--save-baseline", nargs="?", const="bench_baseline.json",
+                       help="sonuçları temel değer olarak bu dosyaya yaz (varsayılan: bench_baseline.json)")
+    bench.add_argument("--tolerance", type=float, default=0.2, help="gerileme eşiği (0.2 = %%20)")
+    bench.add_argument("--json", help="sonuç raporunu JSON olarak yaz")
+    return parser.parse_args(argv)
+
+def _process_age():
+    """Sürecin başlamasından bu yana geçen süre (yalnızca Linux, yoksa None)"""
+    try:
+        with open("/proc/self/stat") as f:
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+def profile_startup(app, target_ms=50):
+    """İlk kareyi çizip açılış süresinin dökümünü yazdır"""
+    app.load_user_progress()
+    startup_mark("ilerleme yüklendi")
+    app.catalog
+    startup_mark("katalog yüklendi")
+    app.draw_main_menu()
+    app.screen.present()
+    startup_mark("ilk kare")
+    process_age = _process_age()
+    app.close()
+
+    print(f"\n{Fore.CYAN}╔══════════════ AÇILIŞ PROFİLİ ══════════════╗")
+    previous = _STARTUP_MARKS[0][1]
+    for label, stamp in _STARTUP_MARKS[1:]:
+        print(f"║ {label:<22} {(stamp - previous) * 1000:8.2f} ms"
+              f"   (toplam {(stamp - _STARTUP_MARKS[0][1]) * 1000:7.2f} ms)")
+        previous = stamp
+    first_paint = (_STARTUP_MARKS[-1][1] - _STARTUP_MARKS[0][1]) * 1000
+    color = Fore.GREEN if first_paint <= target_ms else Fore.RED
+    print(f"║")
+    print(f"║ {color}İlk kare: {first_paint:.2f} ms (hedef {target_ms} ms){Style.RESET_ALL}")
+    if process_age is not None:
+        print(f"║ Yorumlayıcı açılışı dahil: {process_age * 1000:.0f} ms")
+    print(f"╚═════════════════════════════════════════════╝")
+
 def main():
     """Ana fonksiyon"""
+    args = parse_args()
+    if args.metrics:
+        import ekom_metrics
+        ekom_metrics.enable(args.metrics)
+    if args.command == "build-content":
+        from ekom_content import build_bundle
+        count = build_bundle(args.pack, args.out)
+        print(f"{Fore.GREEN}✓ {count} kayıt derlendi: {args.out}")
+        from ekom_search import SearchIndex, DEFAULT_INDEX
+        from ekom_content import ContentPack
+        index = SearchIndex.build(ContentPack(args.pack))
+        index.save(args.index or DEFAULT_INDEX)
+        print(f"{Fore.GREEN}✓ Arama indeksi: {len(index.docs)} belge, {len(index.terms)} terim: "
+              f"{args.index or DEFAULT_INDEX}")
+        return
+    if args.command == "search":
+        import ekom_search
+        sys.exit(ekom_search.main(load_content(), args.query, args.limit, args.rebuild))
+    if args.command == "selftest":
+        import ekom_selftest
+        sys.exit(ekom_selftest.main(load_content(), args.workers, args.timeout, args.verbose))
+    content = None
+    if args.watch:
+        from ekom_watch import WatchedContent
+        content = WatchedContent()
+    if args.command == "serve":
+        import ekom_server
+        ekom_server.main(open_store(args.store, args.data_dir), args.host, args.port, content,
+                         max_sessions=args.max_sessions, idle_timeout=args.idle_timeout)
+        return
+    if args.command == "loadgen":
+        import ekom_loadgen
+        sys.exit(ekom_loadgen.main(args.scripts, args.sessions, args.workers, args.steps, args.seed,
+                                   args.pack, args.exec, args.json))
+    if args.command == "analytics":
+        import ekom_analytics
+        store = open_store(args.store, args.data_dir)
+        try:
+            sys.exit(ekom_analytics.main(store, load_content(), args.top, args.stalled_days,
+                                         args.backend, args.json))
+        finally:
+            store.close()
+    if args.command == "scrape":
+        import ekom_scraper
+        sys.exit(ekom_scraper.main(args.urls, args.pages, args.concurrency, args.per_host, args.retries,
+                                   args.rate, args.json))
+    if args.command == "bigfile":
+        import ekom_bigfile
+        sys.exit(ekom_bigfile.main(args.path, args.size_mb, args.pattern, args.methods, args.workers,
+                                   args.keep, args.json))
+    if args.command == "organize":
+        import ekom_organizer
+        sys.exit(ekom_organizer.main(args.root, args.by, args.apply, args.duplicates, not args.no_recursive,
+                                     args.workers, args.files, args.json))
+    if args.command == "db":
+        import ekom_db
+        store = open_store(args.store, args.data_dir) if args.progress else None
+        try:
+            sys.exit(ekom_db.main(args.csv, args.db_path, args.table, args.index, store, args.rows,
+                                  args.methods, args.json, args.replace))
+        finally:
+            if store is not None:
+                store.close()
+    if args.command == "mail":
+        import ekom_mail
+        store = open_store(args.store, args.data_dir) if args.host or args.dry_run else None
+        try:
+            sys.exit(ekom_mail.main(store, load_content().catalog()["modules"], args.host, args.port,
+                                    args.sender, args.domain, args.workers, args.rate, args.retries,
+                                    args.starttls, args.user, args.limit, args.dry_run, args.messages,
+                                    args.latency, args.json))
+        finally:
+            if store is not None:
+                store.close()
+    if args.command == "export":
+        import ekom_export
+        store = open_store(args.store, args.data_dir) if not args.sample else None
+        try:
+            sys.exit(ekom_export.main(store, load_content().catalog()["modules"], args.path, args.events,
+                                      args.sample, args.json))
+        finally:
+            if store is not None:
+                store.close()
+    if args.command == "grade":
+        import ekom_grader
+        store = open_store(args.store, args.data_dir) if args.credit else None
+        try:
+            sys.exit(ekom_grader.main(load_content(), args.exercise, args.paths, store, args.workers,
+                                      args.timeout, args.verbose, args.json))
+        finally:
+            if store is not None:
+                store.close()
+    if args.command == "bench":
+        import ekom_bench
+        sys.exit(ekom_bench.main(args.pattern, args.quick, args.baseline, args.save_baseline,
+                                 args.tolerance, args.json))
+
+    if content is not None:
+        content.watch()
+    store = open_store(args.store, args.data_dir)
+    learner_id = args.learner or default_learner_id()
+    # Eski tek kullanıcılı ilerleme dosyası yalnızca bu makinenin varsayılan öğrencisine aktarılır;
+    # sunucu oturumları, not verme ve raporlar gibi diğer yüklemeler onu sahiplenmez
+    if learner_id == default_learner_id():
+        store.migrate_legacy(learner_id)
+    app = EkomCode(learner_id=learner_id, store=store, content=content)
+    startup_mark("depo açıldı")
+    if args.profile_startup:
+        profile_startup(app)
+        return
+    if args.record:
+        app.recorder = open(args.record, 'w', encoding="utf-8", buffering=1)
     try:
-        app = EkomCode()
         app.main_menu()
     except KeyboardInterrupt:
         print(f"\n\n{Fore.YELLOW}Program kapatılıyor...")
         print(f"{Fore.GREEN}EkomCode'u kullandığınız için teşekkürler! 🚀")
+    finally:
+        app.close()
+        if app.recorder is not None:
+            app.recorder.close()
+        if content is not None:
+            content.close()
 
 if __name__ == "__main__":
+    # Diğer modüllerin "import ekomcode" ile aynı modülü görmesi için
+    sys.modules.setdefault("ekomcode", sys.modules["__main__"])
     main()
@@ -0,0 +1,47 @@
+import time
+from datetime import datetime
+
+import pytest
+
+from ekom_analytics import Cohort
+from ekom_content import load_content
+from ekom_storage import PickleProgressStore, new_progress, last_activity
+
+TODAY = datetime(2024, 6, 30)
+
+
+@pytest.fixture(scope="module")
+def modules():
+    return load_content().catalog()["modules"]
+
+
+def test_last_activity_uses_schedule_and_profiles():
+    user_data = new_progress()
+    assert last_activity(user_data) is None
+    user_data["schedule"] = {"a": {"last": time.mktime((2024, 6, 1, 12, 0, 0, 0, 0, -1))}}
+    user_data["profiles"] = {"a": [{"date": "2024-06-20 09:30"}]}
+    assert last_activity(user_data) == "2024-06-20 09:30"
+
+
+def test_stalled_skips_learners_without_known_activity(modules):
+    learners = [
+        ("zamani_bilinmeyen", 10, "2024-01-01 10:00:00", None),
+        ("etkin", 10, "2024-01-01 10:00:00", "2024-06-29 10:00:00"),
+        ("hic_baslamamis", 0, "2024-01-01 10:00:00", None),
+        ("takilan", 10, "2024-01-01 10:00:00", "2024-05-01 10:00:00"),
+    ]
+    completions = [(learner_id, "degiskenler") for learner_id in ("zamani_bilinmeyen", "etkin", "takilan")]
+    report = Cohort(modules, learners, completions, backend="bitset").report(today=TODAY)
+    assert [entry["learner"] for entry in report["stalled"]] == ["hic_baslamamis", "takilan"]
+    assert report["stalled_unknown"] == 1
+
+
+def test_pickle_store_cohort_reports_activity(tmp_path, modules):
+    store = PickleProgressStore(str(tmp_path))
+    user_data = new_progress()
+    user_data["start_date"] = "2024-01-01 10:00:00"
+    user_data["completed_lessons"] = ["degiskenler"]
+    user_data["profiles"] = {"degiskenler": [{"date": "2024-06-29 08:00"}]}
+    store.save("ayse", user_data)
+    report = Cohort.load(store, modules, backend="bitset").report(today=TODAY)
+    assert report["stalled_total"] == 0 and report["stalled_unknown"] == 0
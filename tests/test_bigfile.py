@@ -0,0 +1,67 @@
+import pytest
+
+import ekom_bigfile
+from ekom_bigfile import METHODS, count_chunks, split_ranges
+
+TEXTS = {
+    "bos": "",
+    "sonu_yeni_satir": "INFO a\nERROR b\nERROR ERROR\n",
+    "sonu_acik": "INFO a\nERROR b\nson ERROR",
+    "tek_satir": "ERRORERRORERROR",
+    "cakisan": "aaaa\naaaaa\n",
+}
+
+
+def write(tmp_path, text):
+    path = tmp_path / "log.txt"
+    path.write_bytes(text.encode("utf-8"))
+    return str(path)
+
+
+@pytest.mark.parametrize("name", sorted(TEXTS))
+@pytest.mark.parametrize("method", sorted(METHODS))
+def test_methods_agree(tmp_path, monkeypatch, name, method):
+    # Küçük pencere: mmap taraması da kalıbı pencere sınırlarında böler
+    monkeypatch.setattr(ekom_bigfile, "CHUNK_SIZE", 3)
+    text = TEXTS[name]
+    pattern = "aa" if name == "cakisan" else "ERROR"
+    path = write(tmp_path, text)
+    lines = text.count("\n") + (1 if text and not text.endswith("\n") else 0)
+    expected = {"lines": lines, "matches": text.count(pattern)}
+    function = METHODS[method][1]
+    kwargs = {"workers": 2} if method == "parallel" else {}
+    assert function(path, pattern, **kwargs) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 4, 5, 7, 64])
+def test_chunks_across_boundaries(tmp_path, chunk_size):
+    text = "xERRORyERROR\nERROR" * 5
+    path = write(tmp_path, text)
+    assert count_chunks(path, "ERROR", chunk_size) == {"lines": 6, "matches": 15}
+
+
+def test_split_ranges_aligned_to_lines(tmp_path):
+    text = "".join(f"satir {i}\n" for i in range(100))
+    path = write(tmp_path, text)
+    data = text.encode()
+    for parts in (1, 3, 7, 200):
+        ranges = split_ranges(path, parts)
+        assert 1 <= len(ranges) <= parts
+        assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start and data[start - 1:start] == b"\n"
+
+
+def test_split_ranges_empty_and_single_line(tmp_path):
+    assert split_ranges(write(tmp_path, ""), 4) == []
+    assert split_ranges(write(tmp_path, "tek satir"), 4) == [(0, 9)]
+
+
+@pytest.mark.parametrize("pattern", ["aa", "aba", "abab"])
+@pytest.mark.parametrize("size", [1, 2, 3, 4, 5, 8])
+def test_overlapping_pattern_counted_like_str_count(tmp_path, monkeypatch, pattern, size):
+    monkeypatch.setattr(ekom_bigfile, "CHUNK_SIZE", size)
+    text = "aaaaaaa\nababababa\nabababab\n"
+    path = write(tmp_path, text)
+    assert count_chunks(path, pattern, size)["matches"] == text.count(pattern)
+    assert METHODS["mmap"][1](path, pattern)["matches"] == text.count(pattern)
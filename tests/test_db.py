@@ -0,0 +1,101 @@
+import pytest
+
+from ekom_db import connect, _affinity, load_csv, load_progress, bulk_insert, stream
+from ekom_storage import STORES, new_progress
+
+
+@pytest.mark.parametrize("values, expected", [
+    (["1", "-2", "+3"], "INTEGER"),
+    (["1", "2.5", "1e3"], "REAL"),
+    (["1", "abc"], "TEXT"),
+    (["", "4"], "INTEGER"),
+    ([], "INTEGER"),
+    (["0", "10", "-3"], "INTEGER"),
+    (["0.5", "2"], "REAL"),
+    (["12", "007"], "TEXT"),
+    (["-0123"], "TEXT"),
+])
+def test_affinity(values, expected):
+    assert _affinity(values) == expected
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = connect(str(tmp_path / "test.sqlite"))
+    yield conn
+    conn.close()
+
+
+def write_csv(path, text):
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_load_csv_counts_skipped_rows(conn, tmp_path):
+    path = write_csv(tmp_path / "notlar.csv", "ad,puan\nali,10\neksik\n\nfazla,1,2\nayse,7.5\n")
+    table, count, skipped = load_csv(conn, path, indexes=["ad"])
+    assert (table, count, skipped) == ("notlar", 2, 2)
+    assert conn.execute("SELECT ad, puan FROM notlar ORDER BY ad").fetchall() == [("ali", 10.0), ("ayse", 7.5)]
+    types = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(notlar)")}
+    assert types == {"ad": "TEXT", "puan": "REAL"}
+
+
+def test_load_csv_refuses_existing_table_unless_replaced(conn, tmp_path):
+    path = write_csv(tmp_path / "v.csv", "a\n1\n")
+    load_csv(conn, path)
+    with pytest.raises(ValueError):
+        load_csv(conn, path)
+    load_csv(conn, path, replace=True)
+    assert conn.execute("SELECT COUNT(*) FROM v").fetchone() == (1,)
+
+
+def test_load_csv_empty_file(conn, tmp_path):
+    with pytest.raises(ValueError):
+        load_csv(conn, write_csv(tmp_path / "bos.csv", ""))
+
+
+def test_bulk_insert_and_stream(conn):
+    conn.execute("CREATE TABLE t (i INTEGER, s TEXT)")
+    rows = ((i, str(i)) for i in range(2500))
+    assert bulk_insert(conn, "t", ("i", "s"), rows, batch_size=1000) == 2500
+    assert sum(i for i, _ in stream(conn, "SELECT i, s FROM t", arraysize=100)) == sum(range(2500))
+
+
+def test_load_csv_keeps_leading_zeros(conn, tmp_path):
+    load_csv(conn, write_csv(tmp_path / "ogrenci.csv", "no,posta\n007,06100\n12,34000\n"))
+    assert conn.execute("SELECT no, posta FROM ogrenci").fetchall() == [("007", "06100"), ("12", "34000")]
+
+
+def test_failed_replace_keeps_original_table(conn, tmp_path):
+    path = write_csv(tmp_path / "v.csv", "a\n1\n2\n")
+    load_csv(conn, path)
+    # Bozuk bayt örnek satırlardan ve ilk okuma tamponundan sonra gelir
+    bad = tmp_path / "bozuk.csv"
+    bad.write_bytes(b"a\n" + b"3\n" * 20000 + b"\xff\n")
+    for replace in (True, False):
+        with pytest.raises(UnicodeDecodeError):
+            load_csv(conn, str(bad), table="v" if replace else "yeni", replace=replace)
+    assert not conn.in_transaction
+    assert conn.execute("SELECT a FROM v").fetchall() == [(1,), (2,)]
+    # Yarıda kalan yükleme boş tablo bırakmaz; düzeltilmiş dosya yeniden denenebilir
+    bad.write_bytes(b"a\n" + b"3\n" * 20000)
+    assert load_csv(conn, str(bad), table="yeni")[1] == 20000
+
+
+@pytest.mark.parametrize("kind", sorted(STORES))
+def test_load_progress_streams_store(conn, tmp_path, kind):
+    store = STORES[kind](str(tmp_path / kind))
+    try:
+        for learner_id, lessons in (("veli", ["b"]), ("ali", ["a", "b"])):
+            user_data = new_progress()
+            for lesson_key in lessons:
+                user_data["completed_lessons"].append(lesson_key)
+                user_data["score"] += 10
+                store.record_completion(learner_id, lesson_key, user_data)
+        store.flush()
+        assert load_progress(conn, store) == {"learners": 2, "completions": 3}
+    finally:
+        store.close()
+    assert conn.execute("SELECT learner_id, score FROM learners ORDER BY learner_id").fetchall() == [
+        ("ali", 20), ("veli", 10)]
+    assert conn.execute("SELECT COUNT(*) FROM completions WHERE lesson_key = 'b'").fetchone() == (2,)
@@ -0,0 +1,40 @@
+import os
+
+import pytest
+
+from ekom_executor import ExecutionPool
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="çatallanan çalıştırma yolu gerekir")
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = ExecutionPool(workers=1)
+    yield pool
+    pool.shutdown()
+
+
+def test_error_larger_than_pipe_buffer_is_reported(pool):
+    result = pool.run("raise ValueError('x' * 200000)", wall_time=5)
+    assert not result.timed_out
+    assert result.returncode == 1
+    assert result.error.startswith("ValueError: xxx")
+
+
+def test_profile_report_is_returned(pool):
+    result = pool.run("print(sum(range(1000)))", profile=True)
+    assert result.output.strip() == "499500"
+    assert result.profile["wall_time"] >= 0
+
+
+def test_wall_time_limit(pool):
+    result = pool.run("while True: pass", wall_time=1)
+    assert result.timed_out
+
+
+def test_subprocess_fallback_finds_app_modules():
+    from ekom_executor import _run_subprocess
+    job = {"code": "import ekom_progress; print('tamam')", "stdin": "",
+           "limits": {"wall_time": 10, "output_kb": 64, "output_lines": 100}}
+    result = _run_subprocess(job, lambda chunk: None)
+    assert result["returncode"] == 0 and result["output"].strip() == "tamam"
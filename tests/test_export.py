@@ -0,0 +1,66 @@
+import csv
+
+from ekom_export import export, learner_rows, sample_streams
+from ekom_progress import LessonIndex
+
+MODULES = {
+    "temel": {"title": "Temeller", "lessons": {"a1": "Değişkenler", "a2": "Döngüler"}},
+    "otomasyon": {"title": "Otomasyon", "lessons": {"b1": "Dosyalar", "b2": "E-posta"}},
+}
+LEARNERS = [
+    ("ali", 30, "2024-01-01", "2024-01-05"),
+    ("bora", 0, "2024-01-02", None),
+    ("ceren", 10, "2024-01-03", "2024-01-04"),
+]
+COMPLETIONS = [
+    ("ali", "a1", "2024-01-02"), ("ali", "b1", "2024-01-03"), ("ali", "b2", "2024-01-05"),
+    # Öğrenci tablosunda olmayan kayıt ve katalogda olmayan ders atlanır
+    ("ayse", "a1", None),
+    ("ceren", "a2", "2024-01-04"), ("ceren", "eski", None),
+    ("zeynep", "a1", None),
+]
+
+
+def test_learner_rows_merge_sorted_streams():
+    index = LessonIndex(MODULES)
+    counters = dict.fromkeys(index.keys, 0)
+    rows = list(learner_rows(LEARNERS, COMPLETIONS, index, MODULES, counters))
+    assert rows == [
+        ["ali", "2024-01-01", "2024-01-05", 30, 3, 75.0, 1, 2],
+        ["bora", "2024-01-02", "2024-01-02", 0, 0, 0.0, 0, 0],
+        ["ceren", "2024-01-03", "2024-01-04", 10, 1, 25.0, 1, 0],
+    ]
+    assert counters == {"a1": 1, "a2": 1, "b1": 1, "b2": 1}
+
+
+def test_learner_rows_without_completions():
+    index = LessonIndex(MODULES)
+    rows = list(learner_rows(LEARNERS[:1], [], index, MODULES))
+    assert rows == [["ali", "2024-01-01", "2024-01-05", 30, 0, 0.0, 0, 0]]
+
+
+def read_csv(path):
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return list(csv.reader(f))
+
+
+def test_csv_export_writes_every_sheet(tmp_path):
+    path = str(tmp_path / "rapor.csv")
+    counts, paths = export(path, LEARNERS, COMPLETIONS, MODULES, events=COMPLETIONS)
+    assert counts == {"ogrenciler": 3, "dersler": 4, "moduller": 2, "tamamlamalar": 6}
+    assert [p[len(str(tmp_path)) + 1:] for p in paths] == [
+        "rapor.csv", "rapor_dersler.csv", "rapor_moduller.csv", "rapor_tamamlamalar.csv"]
+    assert read_csv(paths[0])[1][:5] == ["ali", "2024-01-01", "2024-01-05", "30", "3"]
+    assert read_csv(paths[1])[1] == ["Temeller", "Değişkenler", "a1", "1", "33.3"]
+    assert read_csv(paths[2])[1:] == [["Temeller", "2", "2", "33.3"], ["Otomasyon", "2", "2", "33.3"]]
+
+
+def test_sample_streams_sorted_and_consistent():
+    learners, completions = sample_streams(120, MODULES)
+    ids = [row[0] for row in learners()]
+    assert ids == sorted(ids) and len(ids) == 120
+    scores = {learner_id: score for learner_id, score, _, _ in learners()}
+    done = {}
+    for learner_id, _, _ in completions():
+        done[learner_id] = done.get(learner_id, 0) + 1
+    assert all(scores[learner_id] == 10 * count for learner_id, count in done.items())
@@ -0,0 +1,50 @@
+import io
+import os
+import contextlib
+
+from ekom_content import load_content
+from ekom_grader import load_spec, check_output, collect_submissions, unreadable_grade
+
+EXERCISES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "content", "exercises")
+
+
+def run_solution(stdin):
+    """Örnek çözümü verilen girdiyle çalıştır ve çıktısını döndür"""
+    with open(os.path.join(EXERCISES, "hesap_makinesi.py"), encoding="utf-8") as f:
+        code = f.read()
+    lines = iter(stdin.splitlines())
+    output = io.StringIO()
+
+    def fake_input(prompt=""):
+        output.write(prompt)
+        return next(lines)
+    with contextlib.redirect_stdout(output):
+        exec(code, {"input": fake_input, "__name__": "__main__"})
+    return output.getvalue()
+
+
+def exit_test():
+    spec = load_spec(load_content(), "hesap_makinesi")
+    return next(test for test in spec["tests"] if test["name"] == "çıkış")
+
+
+def test_exit_test_rejects_unrelated_output():
+    assert check_output("merhaba\n", exit_test()) is not None
+
+
+def test_reference_solution_passes_every_test():
+    for test in load_spec(load_content(), "hesap_makinesi")["tests"]:
+        assert check_output(run_solution(test["stdin"]), test) is None, test["name"]
+
+
+def test_unreadable_submissions_do_not_stop_batch(tmp_path):
+    (tmp_path / "ali.py").write_text("print('merhaba')\n", encoding="utf-8")
+    (tmp_path / "şule.py").write_bytes("print('günaydın')\n".encode("cp1254"))
+    submissions, unreadable = collect_submissions("hesap_makinesi", [str(tmp_path), str(tmp_path / "yok.py")])
+    assert submissions == [("ali", "hesap_makinesi", "print('merhaba')\n")]
+    assert [learner_id for learner_id, _ in unreadable] == ["şule", "yok"]
+    assert "UTF-8" in unreadable[0][1]
+
+    grade = unreadable_grade(load_content(), "hesap_makinesi", *unreadable[0])
+    assert grade.points == 0 and grade.passed == 0
+    assert grade.tests[0].detail == unreadable[0][1]
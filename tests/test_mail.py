@@ -0,0 +1,120 @@
+import smtplib
+
+import pytest
+
+from ekom_mail import SMTPSink, SMTPPool, pipelined_send, learner_address, reports, main
+
+MODULES = {"temel": {"title": "Temeller", "lessons": {"degiskenler": "Değişkenler", "donguler": "Döngüler"}}}
+DATA = b"Subject: deneme\r\n\r\n.nokta ile baslayan satir\r\n"
+BODY = ".nokta ile başlayan satır"
+
+
+@pytest.fixture
+def sink():
+    with SMTPSink(keep=10, refuse=["yok@ornek.com"]) as sink:
+        yield sink
+
+
+@pytest.fixture
+def smtp(sink):
+    smtp = smtplib.SMTP(sink.host, sink.port, timeout=5)
+    smtp.ehlo()
+    yield smtp
+    smtp.quit()
+
+
+def test_pipelined_send_delivers(sink, smtp):
+    assert smtp.has_extn("pipelining")
+    assert pipelined_send(smtp, "a@ornek.com", ["b@ornek.com", "c@ornek.com"], b"Subject: x\r\n\r\n.nokta\r\n") == {}
+    assert sink.stats["messages"] == 1
+    assert sink.stats["recipients"] == 2
+    assert sink.messages == [b"Subject: x\r\n\r\n.nokta\r\n"]
+
+
+def test_pipelined_send_returns_refused(sink, smtp):
+    refused = pipelined_send(smtp, "a@ornek.com", ["b@ornek.com", "yok@ornek.com"], DATA)
+    assert list(refused) == ["yok@ornek.com"]
+    assert refused["yok@ornek.com"][0] == 550
+    assert sink.stats["recipients"] == 1
+
+
+def test_pipelined_send_all_refused_resets(sink, smtp):
+    with pytest.raises(smtplib.SMTPRecipientsRefused):
+        pipelined_send(smtp, "a@ornek.com", ["yok@ornek.com"], DATA)
+    # Bağlantı sıfırlanmış olmalı: sonraki ileti normal gider
+    assert pipelined_send(smtp, "a@ornek.com", ["b@ornek.com"], DATA) == {}
+    assert sink.stats["recipients"] == 1
+
+
+@pytest.mark.parametrize("pipelining", [True, False])
+def test_pool_records_refused_recipients(sink, pipelining):
+    learners = [("ali", 10, None, None), ("yok", 0, None, None), ("ayse", 5, None, None)]
+    messages = list(reports(learners, [("ali", "degiskenler")], MODULES, domain="ornek.com"))
+    # İkinci iletiye reddedilmeyen bir alıcı eklenir: ileti kısmen gönderilir
+    messages[1]["Cc"] = "veli@ornek.com"
+    pool = SMTPPool(sink.host, sink.port, size=1, pipelining=pipelining)
+    stats = pool.send_all(messages)
+    assert stats["sent"] == 2
+    assert stats["partial"] == 1
+    assert [address for address, _ in pool.failures] == ["yok@ornek.com"]
+    assert pool.failures[0][1].startswith("550")
+
+
+@pytest.mark.parametrize("pipelining", [True, False])
+def test_pool_delivers_body_unchanged(sink, pipelining):
+    learners = [("ali", 10, None, None), ("şule", 0, None, None)]
+    messages = list(reports(learners, [], MODULES, domain="okul.edu"))
+    for message in messages:
+        message.set_content(BODY)
+    pool = SMTPPool(sink.host, sink.port, size=1, pipelining=pipelining)
+    stats = pool.send_all(messages)
+    assert pool.failures == []
+    assert stats["sent"] == 2
+    # Nokta kaçışı bir kez yapılır, sunucu tarafında geri alınır
+    assert all(BODY.encode() in data and b".." + BODY.encode() not in data for data in sink.messages)
+    assert b"To: =?utf-8?" not in sink.messages[1] and "şule@okul.edu".encode() in sink.messages[1]
+
+
+def test_non_ascii_address_needs_smtputf8():
+    learners = [("şule", 0, None, None), ("ali", 0, None, None)]
+    with SMTPSink(smtputf8=False) as sink:
+        pool = SMTPPool(sink.host, sink.port, size=1, retries=0)
+        stats = pool.send_all(reports(learners, [], MODULES, domain="okul.edu"))
+    assert stats["sent"] == 1 and stats["failed"] == 1
+    assert pool.failures[0][0] == "şule@okul.edu"
+    assert "SMTPUTF8" in pool.failures[0][1]
+
+
+def test_unexpected_error_does_not_stall_pool(sink, monkeypatch):
+    def broken(smtp, message):
+        raise UnicodeEncodeError("ascii", "ş", 0, 1, "deneme")
+    pool = SMTPPool(sink.host, sink.port, size=1, retries=0)
+    monkeypatch.setattr(pool, "_send", broken)
+    # Kuyruk sınırından (size * 4) fazla ileti: ölü iş parçacığı send_all'ı kilitlerdi
+    messages = list(reports([(f"o{i}", 0, None, None) for i in range(10)], [], MODULES, domain="ornek.com"))
+    stats = pool.send_all(messages)
+    assert stats["failed"] == 10
+    assert len(pool.failures) == 10 and pool.failures[0][1].startswith("UnicodeEncodeError")
+
+
+def test_learner_address():
+    assert learner_address("ali", "okul.edu") == "ali@okul.edu"
+    assert learner_address("ali@okul.edu") == "ali@okul.edu"
+    assert learner_address("ali") is None
+
+
+class FakeStore:
+    def __init__(self, learners):
+        self.learners = learners
+
+    def cohort(self):
+        return self.learners, []
+
+
+def test_main_requires_domain_for_real_server(sink):
+    store = FakeStore([("ali", 0, None, None), ("veli@okul.edu", 0, None, None)])
+    assert main(store, MODULES, sink.host, sink.port) == 2
+    assert sink.stats["connections"] == 0
+    assert main(store, MODULES, sink.host, sink.port, dry_run=True) == 0
+    assert main(store, MODULES, sink.host, sink.port, domain="okul.edu", workers=1) == 0
+    assert sink.stats["messages"] == 2
@@ -0,0 +1,51 @@
+import os
+
+import pytest
+
+from ekom_organizer import PARTIAL_SIZE, DUPLICATES_FOLDER, scan, find_duplicates, make_plan
+
+
+def write(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def paths(groups):
+    return sorted(sorted(os.path.basename(entry.path) for entry in group) for group in groups)
+
+
+@pytest.mark.parametrize("size", [100, PARTIAL_SIZE + 4000, 2 * PARTIAL_SIZE, 2 * PARTIAL_SIZE + 4000])
+def test_same_head_and_tail_different_middle_is_not_duplicate(tmp_path, size):
+    # Fark, kısmi özetin okuduğu ilk PARTIAL_SIZE baytın hemen ardında
+    position = min(PARTIAL_SIZE, size - 1)
+    for name, byte in (("x.bin", b"1"), ("y.bin", b"2")):
+        data = bytearray(b"a" * size)
+        data[position:position + 1] = byte
+        write(tmp_path / name, bytes(data))
+    assert find_duplicates(scan(str(tmp_path)), workers=2) == []
+
+
+@pytest.mark.parametrize("size", [1, PARTIAL_SIZE + 4000, 3 * PARTIAL_SIZE])
+def test_identical_files_are_grouped(tmp_path, size):
+    data = bytes(range(256)) * (size // 256 + 1)
+    for name in ("a.bin", "b.bin", "c.bin"):
+        write(tmp_path / name, data[:size])
+    write(tmp_path / "other.bin", b"z" * size)
+    assert paths(find_duplicates(scan(str(tmp_path)), workers=2)) == [["a.bin", "b.bin", "c.bin"]]
+
+
+def test_empty_files_are_not_duplicates(tmp_path):
+    write(tmp_path / "a.txt", b"")
+    write(tmp_path / "b.txt", b"")
+    assert find_duplicates(scan(str(tmp_path))) == []
+
+
+def test_plan_moves_only_later_copies(tmp_path):
+    data = b"ayni icerik" * 3000
+    write(tmp_path / "a.txt", data)
+    write(tmp_path / "b.txt", data)
+    os.utime(tmp_path / "a.txt", (1, 1))
+    plan = make_plan(str(tmp_path), duplicates=True)
+    targets = {os.path.basename(source): os.path.relpath(target, tmp_path) for source, target in plan.moves}
+    assert targets["b.txt"] == os.path.join(DUPLICATES_FOLDER, "b.txt")
+    assert targets["a.txt"] == os.path.join("Belgeler", "a.txt")
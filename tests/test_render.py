@@ -0,0 +1,46 @@
+import io
+
+from ekom_render import CSI, Renderer, display_width
+
+
+class Terminal(io.StringIO):
+    """Boyutu bilinmeyen ANSI akışı: çizici 80x24 varsayar"""
+
+    def fileno(self):
+        raise OSError
+
+
+def draw(renderer, lines):
+    renderer.clear()
+    for line in lines:
+        renderer.write(line)
+    renderer.present()
+
+
+def test_display_width_ignores_colors_and_counts_wide_chars():
+    assert display_width("\x1b[32m║ abc\x1b[0m") == 5
+    assert display_width("🚀") == 2
+    assert display_width("a\tb") == 9
+
+
+def test_only_changed_rows_are_redrawn():
+    stream = Terminal()
+    renderer = Renderer(stream, ansi=True)
+    draw(renderer, ["bir", "iki", "üç"])
+    stream.truncate(0)
+    stream.seek(0)
+    draw(renderer, ["bir", "İKİ", "üç"])
+    output = stream.getvalue()
+    assert f"{CSI}2J" not in output
+    assert f"{CSI}2;1HİKİ" in output and "bir" not in output
+
+
+def test_wrapping_line_forces_full_repaint():
+    stream = Terminal()
+    renderer = Renderer(stream, ansi=True)
+    draw(renderer, ["bir", "x" * 100, "üç"])
+    stream.truncate(0)
+    stream.seek(0)
+    # Uzun satır ekranda iki satır kapladığı için satır adresleri kaymıştır
+    draw(renderer, ["bir", "x" * 100, "ÜÇ"])
+    assert stream.getvalue().startswith(f"{CSI}H{CSI}2J")
@@ -0,0 +1,97 @@
+import pytest
+
+from ekom_progress import LessonIndex
+from ekom_schedule import DAY, RETRY_DELAY, REVIEW_DAYS, LessonScheduler, review_interval
+
+MODULES = {
+    "temel": {"lessons": {"a1": "", "a2": "", "a3": ""}},
+    "otomasyon": {"lessons": {"b1": "", "b2": ""}},
+}
+NOW = 1_000_000
+
+
+@pytest.fixture
+def index():
+    return LessonIndex(MODULES)
+
+
+def make(index, done=(), **user_data):
+    user_data["completed_lessons"] = index.completions(done)
+    return LessonScheduler(index, user_data, now=NOW), user_data
+
+
+def complete(scheduler, lesson_key, ok=True, now=NOW):
+    entry = scheduler.record(lesson_key, ok, now)
+    scheduler.completed.add(lesson_key)
+    return entry
+
+
+def test_review_interval_shrinks_with_failures():
+    assert review_interval(0, 0) == REVIEW_DAYS[0] * DAY
+    assert review_interval(2, 1) == REVIEW_DAYS[2] * DAY // 2
+    assert review_interval(2, 10) == review_interval(2, 3)
+
+
+def test_new_lessons_follow_current_module(index):
+    scheduler, _ = make(index, done=["a1"])
+    assert scheduler.next(now=NOW) == "a2"
+    assert scheduler.next("otomasyon", now=NOW) == "b1"
+    complete(scheduler, "b1")
+    complete(scheduler, "b2")
+    # Modül bitince katalog sırasıyla sonraki (başa dönerek) modüle geçilir
+    assert scheduler.next("otomasyon", now=NOW) == "a2"
+
+
+def test_completed_before_scheduler_start_at_first_step(index):
+    scheduler, user_data = make(index, done=["a1"])
+    assert user_data["schedule"]["a1"] == {"due": NOW + DAY, "step": 0, "failures": 0, "last": NOW}
+    assert scheduler.next_review() == ("a1", NOW + DAY)
+
+
+def test_due_review_comes_before_new_lesson(index):
+    scheduler, _ = make(index)
+    complete(scheduler, "a1")
+    assert scheduler.next(now=NOW) == "a2"
+    assert scheduler.next(now=NOW + DAY) == "a1"
+
+
+def test_successful_reviews_extend_interval(index):
+    scheduler, user_data = make(index)
+    complete(scheduler, "a1")
+    now = NOW
+    for step in range(1, len(REVIEW_DAYS) + 1):
+        now = user_data["schedule"]["a1"]["due"]
+        entry = scheduler.record("a1", True, now)
+        assert entry["step"] == min(step, len(REVIEW_DAYS) - 1)
+    assert entry["due"] == now + REVIEW_DAYS[-1] * DAY
+    # Zamanı gelmeden yapılan tekrar aralığı uzatmaz
+    step = entry["step"]
+    assert scheduler.record("a1", True, now + 1)["step"] == step
+
+
+def test_failure_resets_and_retries_soon(index):
+    scheduler, user_data = make(index)
+    complete(scheduler, "a1")
+    scheduler.record("a1", True, NOW + DAY)
+    entry = scheduler.record("a1", False, NOW + DAY + 5)
+    assert entry == {"due": NOW + DAY + 5 + RETRY_DELAY, "step": 0, "failures": 1, "last": NOW + DAY + 5}
+    assert scheduler.next(now=NOW + DAY + 5 + RETRY_DELAY) == "a1"
+    entry = scheduler.record("a1", True, NOW + DAY + 5 + RETRY_DELAY)
+    assert entry["due"] == NOW + DAY + 5 + RETRY_DELAY + review_interval(1, 1)
+
+
+def test_stale_heap_entries_are_skipped(index):
+    scheduler, user_data = make(index)
+    complete(scheduler, "a1")
+    complete(scheduler, "a2", now=NOW + 10)
+    # a1 yeniden planlandı: yığındaki eski (NOW + DAY) girdisi atılmalı
+    scheduler.record("a1", True, NOW + 20)
+    assert scheduler.next_review() == ("a2", NOW + 10 + DAY)
+    assert len(scheduler._reviews) == 2
+
+
+def test_unknown_lesson_is_ignored(index):
+    scheduler, user_data = make(index)
+    assert scheduler.record("yok", True, NOW) is None
+    assert user_data["schedule"] == {}
+    assert scheduler.next_review() is None
@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+from ekom_scraper import MAX_REDIRECTS, Scraper, FixtureServer
+
+
+def crawl(paths, **server_options):
+    async def run():
+        async with FixtureServer(pages=10, **server_options) as server:
+            base = f"http://{server.host}:{server.port}"
+            async with Scraper(backoff=0.01) as scraper:
+                return await scraper.crawl([path if "//" in path or ":" in path else base + path
+                                            for path in paths])
+    return asyncio.run(run())
+
+
+def test_pages_are_parsed_including_chunked_bodies():
+    first, second = crawl(["/sayfa/2", "/sayfa/3"])
+    assert (first.status, first.title) == (200, "Sayfa 2")
+    assert second.ok and second.headings[0] == "Örnek Başlık 3"
+    assert len(second.links) == 5
+
+
+def test_transient_errors_are_retried():
+    page, = crawl(["/sayfa/4"], fail_every=2)
+    assert page.ok and page.attempts == 2
+
+
+def test_redirect_is_followed():
+    page, = crawl(["/yonlendir/5"])
+    assert page.ok and page.title == "Sayfa 5"
+    assert page.url.endswith("/sayfa/5")
+
+
+def test_redirect_loop_is_stopped():
+    page, = crawl(["/dongu"])
+    assert not page.ok and str(MAX_REDIRECTS) in page.error
+
+
+@pytest.mark.parametrize("url", ["example.com", "ftp://example.com/x", "http:///yol", "http://host:99999/"])
+def test_invalid_urls_are_rejected_without_connecting(url):
+    page, = crawl([url])
+    assert page.status is None and "geçersiz adres" in page.error
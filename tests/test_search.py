@@ -0,0 +1,67 @@
+import os
+import shutil
+
+import pytest
+
+from ekom_content import DEFAULT_PACK_DIR, ContentBundle, ContentPack, build_bundle
+from ekom_search import SearchIndex, content_fingerprint, load_index, fold
+from ekom_watch import WatchedContent
+
+
+@pytest.fixture
+def pack(tmp_path):
+    root = tmp_path / "content"
+    shutil.copytree(DEFAULT_PACK_DIR, root, ignore=shutil.ignore_patterns("__pycache__"))
+    return ContentPack(str(root))
+
+
+def test_turkish_folding():
+    assert fold("ŞİFRE") == fold("şifre") == "sifre"
+
+
+def test_prebuilt_index_is_reused_until_lesson_text_changes(pack, tmp_path):
+    index_path = str(tmp_path / "search.index")
+    SearchIndex.build(pack).save(index_path)
+    assert not load_index(pack, path=index_path).search("zürafa")
+
+    with open(pack.path("theory/python_temelleri/degiskenler"), "a", encoding="utf-8") as f:
+        f.write("Zürafa örneği\n")
+    index = load_index(pack, path=index_path)
+    assert [doc[2] for _, doc in index.search("zürafa")] == ["degiskenler"]
+
+
+def test_prebuilt_index_goes_stale_when_code_changes(pack, tmp_path):
+    index_path = str(tmp_path / "search.index")
+    saved = SearchIndex.build(pack)
+    saved.save(index_path)
+    path = pack.path("code/python_temelleri/degiskenler")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("\n# yeni satır\n")
+    assert load_index(pack, path=index_path).fingerprint != saved.fingerprint
+
+
+def test_bundle_and_pack_share_fingerprint(pack, tmp_path, monkeypatch):
+    bundle_path = str(tmp_path / "content.bundle")
+    build_bundle(pack.root, bundle_path)
+    bundle = ContentBundle(bundle_path)
+    try:
+        index_path = str(tmp_path / "search.index")
+        # build-content indeksi klasörden kurar; çalışma anında paket kullanılır
+        saved = SearchIndex.build(pack)
+        saved.save(index_path)
+        assert content_fingerprint(bundle, bundle.catalog()) == saved.fingerprint
+
+        def rebuild(*args):
+            raise AssertionError("kaydedilmiş indeks yeniden kuruldu")
+        monkeypatch.setattr(SearchIndex, "build", rebuild)
+        assert load_index(bundle, path=index_path).fingerprint == saved.fingerprint
+        assert WatchedContent(pack).stamp("catalog") == bundle.stamp("catalog")
+    finally:
+        bundle.close()
+
+
+def test_fingerprint_ignores_mtime(pack):
+    before = content_fingerprint(pack, pack.catalog())
+    path = pack.path("theory/python_temelleri/degiskenler")
+    os.utime(path, ns=(1, 1))
+    assert content_fingerprint(pack, pack.catalog()) == before
@@ -0,0 +1,8 @@
+from ekom_selftest import _optional_missing
+
+
+def test_only_optional_packages_are_skipped():
+    assert _optional_missing("ModuleNotFoundError: No module named 'openpyxl'")
+    assert _optional_missing("ModuleNotFoundError: No module named 'bs4.element'")
+    assert not _optional_missing("ModuleNotFoundError: No module named 'ekom_mail'")
+    assert not _optional_missing("ValueError: x")
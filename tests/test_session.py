@@ -0,0 +1,56 @@
+import pytest
+
+from ekom_content import load_content
+from ekom_storage import SQLiteProgressStore
+from ekomcode import build_catalog
+from ekom_session import Session
+
+
+@pytest.fixture(scope="module")
+def content():
+    content = load_content()
+    return content, build_catalog(content)
+
+
+@pytest.fixture
+def make_session(content, tmp_path):
+    store = SQLiteProgressStore(str(tmp_path))
+    active = set()
+    sessions = []
+
+    def make():
+        session = Session(store, *content, ansi=False, active=active)
+        session.start()
+        sessions.append(session)
+        return session
+    yield make, active
+    for session in sessions:
+        session.close()
+    store.close()
+
+
+def test_second_live_session_is_refused(make_session):
+    make, active = make_session
+    first, second = make(), make()
+    first.handle("ali")
+    assert first.view == "main"
+    assert active == {"ali"}
+
+    assert "açık bir oturum var" in second.handle("ali")
+    assert not second.logged_in
+    assert second.handle("") and second.view == "login"
+    second.handle("veli")
+    assert second.view == "main"
+    assert active == {"ali", "veli"}
+
+
+def test_closed_session_releases_learner_id(make_session):
+    make, active = make_session
+    first = make()
+    first.handle("ali")
+    first.close()
+    assert active == set()
+    second = make()
+    second.handle("ali")
+    assert second.view == "main"
+    assert second.learner_id == "ali"
@@ -0,0 +1,72 @@
+import os
+import pickle
+
+import pytest
+
+from ekom_storage import LEGACY_PROGRESS_FILE, STORES, new_progress
+
+
+@pytest.fixture(params=sorted(STORES))
+def make_store(request, tmp_path):
+    stores = []
+
+    def make(data_dir=tmp_path):
+        store = STORES[request.param](str(data_dir))
+        stores.append(store)
+        return store
+    yield make
+    for store in stores:
+        store.close()
+
+
+def write_legacy(directory, lessons):
+    user_data = new_progress()
+    user_data["completed_lessons"] = lessons
+    user_data["score"] = 10 * len(lessons)
+    with open(os.path.join(directory, LEGACY_PROGRESS_FILE), 'wb') as f:
+        pickle.dump(user_data, f)
+
+
+def test_missing_data_dir_is_created(make_store, tmp_path):
+    store = make_store(tmp_path / "yeni" / "klasor")
+    store.save("ali", new_progress())
+    assert "ali" in list(store.learners())
+
+
+def test_load_does_not_claim_legacy_file(make_store, tmp_path):
+    write_legacy(tmp_path, ["degiskenler"])
+    store = make_store()
+    assert store.load("uzak_ogrenci")["completed_lessons"] == []
+    assert os.path.exists(tmp_path / LEGACY_PROGRESS_FILE)
+
+
+def test_legacy_file_migrates_once(make_store, tmp_path):
+    write_legacy(tmp_path, ["degiskenler"])
+    store = make_store()
+    assert store.migrate_legacy("yerel")
+    assert list(store.load("yerel")["completed_lessons"]) == ["degiskenler"]
+    assert not os.path.exists(tmp_path / LEGACY_PROGRESS_FILE)
+    assert not store.migrate_legacy("yerel")
+
+
+def test_legacy_file_does_not_overwrite_existing_learner(make_store, tmp_path):
+    store = make_store()
+    store.save("yerel", new_progress())
+    write_legacy(tmp_path, ["degiskenler"])
+    assert not store.migrate_legacy("yerel")
+    assert os.path.exists(tmp_path / LEGACY_PROGRESS_FILE)
+
+
+def test_last_activity_same_for_every_store(make_store):
+    store = make_store()
+    user_data = new_progress()
+    # Profil zamanı tamamlama zamanından yeni: her depoda son etkinlik odur
+    user_data["profiles"] = {"degiskenler": [{"date": "2099-01-01 10:00"}]}
+    user_data["completed_lessons"].append("degiskenler")
+    store.record_completion("ali", "degiskenler", user_data)
+    store.save("veli", new_progress())
+    store.flush()
+    learners, _ = store.cohort()
+    last = {learner_id: last for learner_id, _, _, last in learners}
+    assert last == {"ali": "2099-01-01 10:00", "veli": None}
+    assert {row[0]: row[3] for row in store.iter_learners()} == last